@@ -0,0 +1,426 @@
+# batch.py
+"""
+Runner batch: menjalankan banyak pipeline matriks dari file job JSONL dalam satu
+proses induk dan pool proses berukuran tetap (start-up interpreter / numpy
+dibayar sekali per worker, bukan sekali per job).
+
+Satu job per baris:
+
+    {"id": "j1", "a": "data/a.csv", "b": "data/b.csv",
+     "loader": {"skip_header": true, "impute_strategy": "mean"},
+     "ops": ["add", {"op": "multiply", "strategy": "buffer"},
+             {"op": "inverse", "export": "out/inv_a.mtxb"}, "mlr"],
+     "include_data": false}
+
+a / b         : path CSV (relatif terhadap direktori file job)
+loader        : argumen load_matrix_from_csv (menimpa default dari CLI)
+ops           : nama operasi atau {"op": nama, ...argumen, "export": path}
+                (lihat OPERATIONS); "export" memilih exporter dari ekstensi
+                .csv / .json / .mtxb
+include_data  : sertakan isi matriks hasil di output (default: ringkasan saja)
+
+Input yang sama (path + opsi loader) yang dipakai beberapa job hanya di-parse
+sekali: parsing dijalankan di pool, hasilnya ditulis ke .mtxb sementara, lalu
+job yang memakainya membuka file tersebut lewat mmap. Hasil per job (status,
+ringkasan hasil tiap operasi, waktu load / operasi / total) ditulis ke JSONL
+output segera setelah job selesai, dalam urutan selesai.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stdout
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from matrix import Matrix, uses_buffer
+from sparsematrix import SparseMatrix
+from utilities.csv_loader import load_matrix_from_csv
+from utilities.binary_loader import load_matrix_from_binary
+from utilities import csv_cache
+from operations.adder import add_matrices
+from operations.subtractor import subtract_matrices
+from operations.multiplier import multiply_matrices
+from operations.transpose import transpose_matrix
+from operations.determinant import find_determinant
+from operations.inverse import inverse_matrix
+from operations.linear_regression import linear_regression
+import operations.mlr as mlr_module
+from operations import result_cache
+from validators.is_square import is_square
+from validators.is_symmetric import is_symmetric
+from validators.is_identity import is_identity
+from validators.is_diagonal import is_diagonal
+from validators.is_triangular import is_triangular
+from exporters.csv_exporter import export_to_csv
+from exporters.json_exporter import export_to_json
+from exporters.binary_exporter import export_to_binary
+
+# Argumen load_matrix_from_csv yang boleh diatur per job. `workers` sengaja tidak
+# ada: paralelisme batch ada di level job, bukan di dalam satu loader.
+LOADER_OPTIONS = (
+    "delimiter", "skip_header", "selected_columns", "drop_non_numeric", "impute_strategy",
+    "normalize", "as_sparse", "sparse_threshold", "backend", "streaming", "chunk_size",
+    "cache_dir", "cache_validate", "schema",
+)
+
+EXPORTERS = {".csv": export_to_csv, ".json": export_to_json, ".mtxb": export_to_binary}
+
+
+# ------------------------------------------------------------
+# Operasi
+# ------------------------------------------------------------
+def _require_b(b, name):
+    if b is None:
+        raise ValueError(f"Operasi '{name}' membutuhkan matriks B.")
+    return b
+
+
+def _validate(a):
+    return {
+        "square": is_square(a),
+        "symmetric": is_symmetric(a),
+        "identity": is_identity(a),
+        "diagonal": is_diagonal(a),
+        "triangular": is_triangular(a),
+    }
+
+
+def _slr(a):
+    """Regresi linear sederhana kolom 0 vs kolom terakhir (seperti main.py)."""
+    if a.rows < 2 or a.cols < 2:
+        raise ValueError("Regresi linear membutuhkan minimal 2 baris dan 2 kolom.")
+    data = a.data
+    intercept, slope = linear_regression([row[0] for row in data], [row[-1] for row in data])
+    return {"a": float(intercept), "b": float(slope)}
+
+
+def _mlr(a, target=-1):
+    beta = mlr_module.fit_matrix(a, target=target)
+    return [float(coef) for coef in beta.ravel()]
+
+
+OPERATIONS = {
+    "add": lambda a, b: add_matrices(a, _require_b(b, "add")),
+    "subtract": lambda a, b: subtract_matrices(a, _require_b(b, "subtract")),
+    "multiply": lambda a, b, **kw: multiply_matrices(a, _require_b(b, "multiply"), **kw),
+    "transpose": lambda a, b: transpose_matrix(a),
+    "determinant": lambda a, b: find_determinant(a),
+    "inverse": lambda a, b: inverse_matrix(a),
+    "validate": lambda a, b: _validate(a),
+    "slr": lambda a, b: _slr(a),
+    "mlr": lambda a, b, **kw: _mlr(a, **kw),
+}
+
+
+# ------------------------------------------------------------
+# Parsing file job
+# ------------------------------------------------------------
+def _op_spec(op):
+    if isinstance(op, str):
+        op = {"op": op}
+    if not isinstance(op, dict) or op.get("op") not in OPERATIONS:
+        raise ValueError(f"Operasi tidak dikenal: {op!r} (pilihan: {', '.join(OPERATIONS)})")
+    export = op.get("export")
+    if export is not None and os.path.splitext(export)[1].lower() not in EXPORTERS:
+        raise ValueError(f"Ekstensi export tidak didukung: {export} (pilihan: {', '.join(EXPORTERS)})")
+    return dict(op)
+
+
+def _job_spec(raw, base_dir, defaults):
+    if not isinstance(raw, dict):
+        raise ValueError("Job harus berupa objek JSON.")
+    if not raw.get("a"):
+        raise ValueError("Job membutuhkan path input 'a'.")
+    loader = dict(defaults)
+    loader.update(raw.get("loader") or {})
+    unknown = sorted(set(loader) - set(LOADER_OPTIONS))
+    if unknown:
+        raise ValueError(f"Opsi loader tidak dikenal: {', '.join(unknown)}")
+
+    def resolve(path):
+        return os.path.abspath(os.path.join(base_dir, path)) if path else None
+
+    ops = raw.get("ops") or ["validate"]
+    return {
+        "id": raw.get("id"),
+        "a": resolve(raw["a"]),
+        "b": resolve(raw.get("b")),
+        "loader": loader,
+        "ops": [dict(spec, export=resolve(spec["export"])) if spec.get("export") else spec
+                for spec in map(_op_spec, ops)],
+        "include_data": bool(raw.get("include_data", False)),
+    }
+
+
+def load_jobs(path, defaults=None):
+    """
+    Baca file job JSONL. Mengembalikan list (spec, error) per baris non-kosong:
+    baris yang tidak valid tetap menghasilkan entri (spec hanya berisi id) agar
+    dilaporkan sebagai job gagal, bukan menghentikan seluruh batch.
+    """
+    base_dir = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            raw = None
+            try:
+                raw = json.loads(line)
+                spec = _job_spec(raw, base_dir, defaults or {})
+                if spec["id"] is None:
+                    spec["id"] = f"line-{line_no}"
+                jobs.append((spec, None))
+            except ValueError as e:
+                job_id = raw.get("id") if isinstance(raw, dict) else None
+                jobs.append(({"id": job_id or f"line-{line_no}"}, f"Baris {line_no}: {e}"))
+    return jobs
+
+
+def _input_key(path, loader):
+    return path, json.dumps(loader, sort_keys=True)
+
+
+# ------------------------------------------------------------
+# Bagian yang berjalan di worker
+# ------------------------------------------------------------
+def _restore_backend(matrix, loader):
+    """Matrix dari .mtxb ber-buffer numpy (bila tersedia); kembalikan ke backend yang diminta loader."""
+    return csv_cache.restore_backend(matrix, loader.get("backend"), loader.get("streaming"),
+                                     loader.get("normalize") is not None)
+
+
+def _stage_input(path, loader, cache_dir):
+    """Parse satu input CSV sekali dan simpan sebagai .mtxb untuk dipakai bersama."""
+    start = time.perf_counter()
+    matrix = load_matrix_from_csv(path, **loader)
+    digest = hashlib.sha1(repr(_input_key(path, loader)).encode()).hexdigest()[:16]
+    target = os.path.join(cache_dir, f"{digest}.mtxb")
+    with redirect_stdout(io.StringIO()):
+        export_to_binary(matrix, target)
+    return target, time.perf_counter() - start
+
+
+def _load_input(source):
+    kind, path, loader = source
+    if kind == "mtxb":
+        return _restore_backend(load_matrix_from_binary(path), loader)
+    return load_matrix_from_csv(path, **loader)
+
+
+def _matrix_sum(matrix):
+    if isinstance(matrix, SparseMatrix):
+        return float(sum(v for _, _, v in matrix.iter_nonzero()))
+    if uses_buffer(matrix):
+        return float(matrix.to_array().sum())
+    return float(sum(sum(row) for row in matrix.data))
+
+
+def _summarize(value, include_data):
+    """Ubah hasil operasi menjadi nilai yang bisa ditulis sebagai JSON."""
+    if isinstance(value, (Matrix, SparseMatrix)) or hasattr(value, "evaluate"):
+        if hasattr(value, "evaluate"):
+            value = value.evaluate()
+        summary = {
+            "type": type(value).__name__,
+            "shape": [value.rows, value.cols],
+            "sum": _matrix_sum(value),
+        }
+        if isinstance(value, SparseMatrix):
+            summary["nnz"] = value.nnz
+        if include_data:
+            summary["data"] = value.to_array().tolist() if uses_buffer(value) else value.data
+        return summary
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def _export(value, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    EXPORTERS[os.path.splitext(path)[1].lower()](value, path)
+
+
+def run_job(spec, sources):
+    """
+    Jalankan satu job (di worker). sources: {"a": (jenis, path, loader), "b": ...}
+    dengan jenis "csv" (parse langsung) atau "mtxb" (input bersama yang sudah di-parse).
+    """
+    start = time.perf_counter()
+    timings = {"load": {}}
+    result = {"id": spec["id"], "worker": os.getpid(), "status": "ok", "ops": []}
+    # Exporter mencetak pesan sukses; jangan campur dengan output batch
+    with redirect_stdout(io.StringIO()):
+        try:
+            matrices = {}
+            for name in ("a", "b"):
+                if sources.get(name) is None:
+                    matrices[name] = None
+                    continue
+                t0 = time.perf_counter()
+                matrices[name] = _load_input(sources[name])
+                timings["load"][name] = time.perf_counter() - t0
+            result["inputs"] = {name: {"path": spec[name], "shared": src[0] == "mtxb"}
+                                for name, src in sources.items()}
+
+            for op in spec["ops"]:
+                kwargs = {k: v for k, v in op.items() if k not in ("op", "export")}
+                entry = {"op": op["op"]}
+                t0 = time.perf_counter()
+                try:
+                    value = OPERATIONS[op["op"]](matrices["a"], matrices["b"], **kwargs)
+                    if op.get("export"):
+                        _export(value, op["export"])
+                        entry["export"] = op["export"]
+                    entry["result"] = _summarize(value, spec["include_data"])
+                except Exception as e:
+                    entry["error"] = f"{type(e).__name__}: {e}"
+                    result["status"] = "error"
+                entry["seconds"] = time.perf_counter() - t0
+                result["ops"].append(entry)
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = f"{type(e).__name__}: {e}"
+    timings["total"] = time.perf_counter() - start
+    result["timings"] = timings
+    if result_cache.is_enabled():
+        # Counter kumulatif cache hasil di worker ini
+        result["result_cache"] = result_cache.stats()
+    return result
+
+
+def _enable_result_cache(options):
+    result_cache.enable(**options)
+
+
+# ------------------------------------------------------------
+# Penjadwal (proses induk)
+# ------------------------------------------------------------
+def run_batch(jobs, output, workers=None, cache_dir=None, max_pending=None, progress=None,
+              result_cache_options=None):
+    """
+    Jalankan daftar job (hasil load_jobs) di ProcessPoolExecutor berukuran `workers`
+    dan tulis satu baris JSON per job ke file `output` (path atau file object).
+    max_pending: batas job yang sedang diproses / menunggu hasil (default 2 × workers)
+                 sehingga memori hasil tetap terbatas untuk ribuan job.
+    result_cache_options: argumen result_cache.enable() untuk setiap worker
+                 (None = cache hasil nonaktif); tier disk bisa dipakai bersama antar worker.
+    Mengembalikan ringkasan {jobs, ok, error, shared_inputs, seconds}.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    start = time.perf_counter()
+
+    # Input yang dipakai >= 2 kali di-parse sekali lalu dibagikan lewat .mtxb
+    usage = {}
+    for spec, error in jobs:
+        if error is None:
+            for name in ("a", "b"):
+                if spec[name]:
+                    key = _input_key(spec[name], spec["loader"])
+                    usage[key] = usage.get(key, 0) + 1
+    shared = {key for key, n in usage.items() if n > 1}
+
+    own_cache = cache_dir is None and bool(shared)
+    if own_cache:
+        cache_dir = tempfile.mkdtemp(prefix="matrix-batch-")
+    elif shared:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    close_output = isinstance(output, str)
+    out = open(output, "w", encoding="utf-8") if close_output else output
+    counts = {"jobs": len(jobs), "ok": 0, "error": 0, "shared_inputs": len(shared)}
+
+    def emit(index, result):
+        result["index"] = index
+        counts["ok" if result["status"] == "ok" else "error"] += 1
+        out.write(json.dumps(result, default=str) + "\n")
+        out.flush()
+        if progress is not None:
+            progress(counts["ok"] + counts["error"], len(jobs), result)
+
+    try:
+        pool_options = {}
+        if result_cache_options is not None:
+            pool_options = {"initializer": _enable_result_cache, "initargs": (result_cache_options,)}
+        with ProcessPoolExecutor(max_workers=workers, **pool_options) as pool:
+            stage_futures = {}
+            for key in shared:
+                path, loader = key[0], json.loads(key[1])
+                stage_futures[pool.submit(_stage_input, path, loader, cache_dir)] = key
+            staged = {}        # key → (path .mtxb | None, error | None)
+            waiters = {}       # key → [index job]
+            blocked = {}       # index job → jumlah input bersama yang belum siap
+            ready = deque()
+
+            for index, (spec, error) in enumerate(jobs):
+                if error is not None:
+                    emit(index, {"id": spec["id"], "status": "error", "error": error})
+                    continue
+                keys = {_input_key(spec[n], spec["loader"]) for n in ("a", "b") if spec[n]}
+                keys = keys & shared
+                if keys:
+                    blocked[index] = len(keys)
+                    for key in keys:
+                        waiters.setdefault(key, []).append(index)
+                else:
+                    ready.append(index)
+
+            running = {}
+            while ready or running or stage_futures:
+                while ready and len(running) < max_pending:
+                    index = ready.popleft()
+                    spec = jobs[index][0]
+                    sources, failed = {}, None
+                    for name in ("a", "b"):
+                        if not spec[name]:
+                            continue
+                        key = _input_key(spec[name], spec["loader"])
+                        if key in staged:
+                            target, error = staged[key]
+                            failed = failed or error
+                            sources[name] = ("mtxb", target, spec["loader"])
+                        else:
+                            sources[name] = ("csv", spec[name], spec["loader"])
+                    if failed:
+                        emit(index, {"id": spec["id"], "status": "error",
+                                     "error": f"Gagal memuat input: {failed}"})
+                        continue
+                    running[pool.submit(run_job, spec, sources)] = index
+
+                if not running and not stage_futures:
+                    continue
+                done, _ = wait(set(running) | set(stage_futures), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in stage_futures:
+                        key = stage_futures.pop(future)
+                        try:
+                            staged[key] = (future.result()[0], None)
+                        except Exception as e:
+                            staged[key] = (None, f"{type(e).__name__}: {e}")
+                        for index in waiters.pop(key, []):
+                            blocked[index] -= 1
+                            if blocked[index] == 0:
+                                del blocked[index]
+                                ready.append(index)
+                    else:
+                        index = running.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = {"id": jobs[index][0]["id"], "status": "error",
+                                      "error": f"{type(e).__name__}: {e}"}
+                        emit(index, result)
+    finally:
+        if close_output:
+            out.close()
+        if own_cache:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    counts["seconds"] = time.perf_counter() - start
+    return counts
@@ -0,0 +1,12 @@
+# benchmarks/__init__.py
+"""
+Suite benchmark yang bisa diulang untuk operations, loader CSV, exporter,
+validator dan regresi pada data sintetis (lihat cases.py).
+
+    python -m benchmarks --profile quick --output hasil.json
+    python -m benchmarks --compare baseline.json
+"""
+from .cases import PROFILES, build_cases
+from .runner import compare_results, load_results, run_suite, save_results
+
+__all__ = ["PROFILES", "build_cases", "run_suite", "compare_results", "load_results", "save_results"]
@@ -0,0 +1,102 @@
+# benchmarks/__main__.py
+# CLI suite benchmark:
+#   python -m benchmarks [--profile quick|full] [--filter TEKS] [--repeat N]
+#                        [--output hasil.json] [--compare baseline.json [--against hasil.json]]
+# Exit code 1 jika --compare menemukan regresi.
+
+import argparse
+import os
+import sys
+import tempfile
+
+# Jalankan dari root repo: modul matrix / operations / utilities ada di direktori induk
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.cases import PROFILES, build_cases
+from benchmarks.runner import compare_results, load_results, run_suite, save_results
+
+
+def _format_seconds(value):
+    if value is None:
+        return "-"
+    if value < 1e-3:
+        return f"{value * 1e6:.1f}µs"
+    if value < 1:
+        return f"{value * 1e3:.2f}ms"
+    return f"{value:.3f}s"
+
+
+def _print_comparison(rows, show_all):
+    counts = {}
+    for row in rows:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+        if not show_all and row["status"] in ("ok", "improvement"):
+            continue
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        print(f"{row['status']:<12} {ratio:>8}  {_format_seconds(row['baseline']):>10} → "
+              f"{_format_seconds(row['current']):<10} {row['name']}")
+        if row.get("error"):
+            print(f"{'':<22}gagal: {row['error']}")
+    print("\nRingkasan: " + ", ".join(f"{k}={v}" for k, v in sorted(counts.items())))
+    return counts.get("regression", 0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark operasi matriks, loader, exporter, validator dan regresi.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick", help="Grid ukuran (default: quick)")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="Hanya kasus yang namanya memuat teks ini (boleh diulang)")
+    parser.add_argument("--repeat", type=int, default=5, help="Jumlah ulangan terukur per kasus")
+    parser.add_argument("--warmup", type=int, default=1, help="Jumlah ulangan pemanasan (tidak diukur)")
+    parser.add_argument("--output", help="Simpan hasil ke file JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="Bandingkan dengan hasil baseline (JSON)")
+    parser.add_argument("--against", metavar="HASIL",
+                        help="Dengan --compare: pakai file hasil ini alih-alih menjalankan suite")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Batas regresi relatif terhadap median baseline (default 0.10 = 10%%)")
+    parser.add_argument("--show-all", action="store_true", help="Tampilkan semua baris perbandingan")
+    parser.add_argument("--list", action="store_true", help="Tampilkan nama kasus tanpa menjalankan")
+    parser.add_argument("--workdir", help="Direktori file sintetis (default: direktori sementara)")
+    args = parser.parse_args(argv)
+
+    if args.against:
+        if not args.compare:
+            parser.error("--against membutuhkan --compare")
+        current = load_results(args.against)
+    else:
+        workdir = args.workdir or tempfile.mkdtemp(prefix="matrix-bench-")
+        os.makedirs(workdir, exist_ok=True)
+        cases = build_cases(args.profile, workdir)
+        if args.filter:
+            cases = [c for c in cases if any(f in c.name for f in args.filter)]
+        if args.list:
+            for case in cases:
+                print(case.name)
+            return 0
+
+        def progress(i, total, name, entry):
+            timing = entry.get("error") or _format_seconds(entry["median"])
+            print(f"[{i}/{total}] {name}: {timing}", flush=True)
+
+        print(f"Menjalankan {len(cases)} kasus (profil {args.profile}, repeat {args.repeat}, data di {workdir})")
+        current = run_suite(cases, repeat=args.repeat, warmup=args.warmup,
+                            profile=args.profile, progress=progress)
+        if args.output:
+            save_results(current, args.output)
+            print(f"\nHasil disimpan ke {args.output}")
+
+    if args.compare:
+        print(f"\nPerbandingan dengan {args.compare} (ambang {args.threshold:.0%}):")
+        baseline = load_results(args.compare)
+        if args.filter:
+            # Kasus baseline di luar filter tidak dijalankan, jangan dilaporkan hilang
+            baseline["results"] = {name: entry for name, entry in baseline["results"].items()
+                                   if any(f in name for f in args.filter)}
+        regressions = _print_comparison(
+            compare_results(baseline, current, args.threshold), args.show_all)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+# benchmarks/cases.py
+"""
+Daftar kasus benchmark: grid bentuk × kepadatan × backend untuk operations.*,
+loader CSV, exporter, validator dan kedua jalur regresi.
+
+Setiap Case punya setup() (tidak diukur, dipanggil sebelum setiap ulangan)
+dan run(*args) (diukur). Operand dibuat sekali per kombinasi parameter;
+setup hanya membungkus ulang operand bila operasi menyimpan cache pada
+objek matriks (faktor LU, flag struktur) agar setiap ulangan mengukur
+perhitungan penuh.
+"""
+
+from collections import namedtuple
+import os
+
+import numpy as np
+
+import old_matriks
+from matrix import Matrix
+from sparsematrix import SparseMatrix
+from tiledmatrix import TiledMatrix
+from operations.adder import add_matrices
+from operations.subtractor import subtract_matrices
+from operations.multiplier import multiply_matrices
+from operations.transpose import transpose_matrix
+from operations.determinant import find_determinant
+from operations.inverse import inverse_matrix
+from operations.chain import multiply_chain
+from operations.linear_regression import linear_regression, multiple_linear_regression
+from operations import mlr
+from utilities.csv_loader import load_matrix_from_csv
+from exporters.csv_exporter import export_to_csv
+from exporters.json_exporter import export_to_json
+from exporters.binary_exporter import export_to_binary
+from validators.is_square import is_square
+from validators.is_symmetric import is_symmetric
+from validators.is_identity import is_identity
+from validators.is_diagonal import is_diagonal
+from validators.is_triangular import is_triangular
+
+from .data import csv_fixture, make_matrix, random_array
+
+Case = namedtuple("Case", ["name", "group", "params", "setup", "run"])
+
+# Grid per profil. Jalur pure-Python O(n^3) (LU list, perkalian versi lama)
+# dibatasi ke ukuran kecil agar satu putaran suite tetap dalam hitungan menit.
+PROFILES = {
+    "quick": {
+        "sizes": [32, 96],
+        "densities": [1.0, 0.05],
+        "csv_rows": [2000],
+        "csv_cols": 8,
+        "regression_rows": [10000],
+        "python_cubic_max": 96,
+    },
+    "full": {
+        "sizes": [32, 128, 512],
+        "densities": [1.0, 0.1, 0.01],
+        "csv_rows": [10000, 100000],
+        "csv_cols": 16,
+        "regression_rows": [10000, 200000],
+        "python_cubic_max": 128,
+    },
+}
+
+IMPUTE_STRATEGIES = ("zero", "mean", "median", "drop")
+NORMALIZATIONS = ("minmax", "zscore")
+VALIDATORS = (
+    ("is_square", is_square),
+    ("is_symmetric", is_symmetric),
+    ("is_identity", is_identity),
+    ("is_diagonal", is_diagonal),
+    ("is_triangular", is_triangular),
+)
+
+_fixtures = {}
+
+
+def _fixture(key, factory):
+    """Operand dibuat sekali per key lalu dipakai bersama oleh semua kasus."""
+    if key not in _fixtures:
+        _fixtures[key] = factory()
+    return _fixtures[key]
+
+
+def _name(group, op, **params):
+    inner = ",".join(f"{k}={v}" for k, v in params.items())
+    return f"{group}.{op}[{inner}]"
+
+
+def _fresh(matrix):
+    """Bungkus ulang isi matriks tanpa salinan sehingga cache LU / flag kosong lagi."""
+    if isinstance(matrix, SparseMatrix):
+        return SparseMatrix.from_compressed(matrix.indptr, matrix.indices, matrix.values,
+                                            shape=matrix.shape, format=matrix.format)
+    if matrix.backend == "numpy":
+        return Matrix(matrix.to_array())
+    if matrix.backend == "array":
+        return Matrix.from_flat(matrix.to_flat(), matrix.rows, matrix.cols)
+    return Matrix(matrix.data)
+
+
+def _case(group, op, run, setup, **params):
+    return Case(_name(group, op, **params), group, params, setup, run)
+
+
+# ------------------------------------------------------------
+# operations.*
+# ------------------------------------------------------------
+def _operation_cases(profile):
+    cases = []
+    for n in profile["sizes"]:
+        for density in profile["densities"]:
+            backends = ("list", "array", "numpy") if density == 1.0 else ("numpy", "sparse")
+            for backend in backends:
+                a = _fixture(("m", backend, n, density, 1), lambda: make_matrix(backend, n, n, density, seed=1))
+                b = _fixture(("m", backend, n, density, 2), lambda: make_matrix(backend, n, n, density, seed=2))
+                v = _fixture(("v", n), lambda: Matrix(random_array(n, 1, seed=3)))
+                params = dict(backend=backend, n=n, density=density)
+                operands = lambda a=a, b=b: (a, b)
+
+                cases.append(_case("ops", "add", add_matrices, operands, **params))
+                cases.append(_case("ops", "subtract", subtract_matrices, operands, **params))
+                cases.append(_case("ops", "transpose", transpose_matrix, lambda a=a: (a,), **params))
+                cases.append(_case("ops", "multiply", multiply_matrices, operands, **params))
+                cases.append(_case("ops", "multiply_chain", multiply_chain,
+                                   lambda a=a, b=b, v=v: (a, b, v), **params))
+
+                if backend != "sparse":
+                    cases.append(_case(
+                        "ops", "lazy_add_sub",
+                        lambda a, b: subtract_matrices(add_matrices(a, b, lazy=True),
+                                                       transpose_matrix(a, lazy=True)).evaluate(),
+                        operands, **params))
+                    if backend == "numpy" or n <= profile["python_cubic_max"]:
+                        cases.append(_case("ops", "determinant", find_determinant,
+                                           lambda a=a: (_fresh(a),), **params))
+                        cases.append(_case("ops", "inverse", inverse_matrix,
+                                           lambda a=a: (_fresh(a),), **params))
+
+            # Implementasi lama (old_matriks.py) sebagai pembanding jalur list
+            if density == 1.0 and n <= profile["python_cubic_max"]:
+                a = _fixture(("m", "list", n, density, 1), None)
+                b = _fixture(("m", "list", n, density, 2), None)
+                old = lambda a=a, b=b: (old_matriks.Matrix(a.data), old_matriks.Matrix(b.data))
+                params = dict(backend="legacy", n=n, density=density)
+                cases.append(_case("ops", "add", old_matriks.add_matrices, old, **params))
+                cases.append(_case("ops", "subtract", old_matriks.subtract_matrices, old, **params))
+                cases.append(_case("ops", "multiply", old_matriks.multiply_matrices, old, **params))
+    return cases
+
+
+# ------------------------------------------------------------
+# Validator
+# ------------------------------------------------------------
+def _validator_cases(profile):
+    cases = []
+    for n in profile["sizes"]:
+        # Matriks simetris (kasus terburuk: scan tidak berhenti lebih awal)
+        sym = _fixture(("sym", n), lambda: (lambda x: x + x.T)(random_array(n, n, seed=4)))
+        inputs = {
+            "list_of_lists": lambda sym=sym: (sym.tolist(),),
+            "list": lambda sym=sym: (Matrix(sym.tolist()),),
+            "numpy": lambda sym=sym: (Matrix(sym),),
+            "sparse": lambda sym=sym: (SparseMatrix((sym * (sym > 150)).tolist()),),
+        }
+        for kind, setup in inputs.items():
+            # Operand dibuat sekali; setup membungkus ulang agar flag yang di-cache tidak terbawa
+            operand = setup()[0]
+            fresh = (lambda o=operand: (o,)) if kind == "list_of_lists" else (lambda o=operand: (_fresh(o),))
+            for op, func in VALIDATORS:
+                cases.append(_case("validators", op, func, fresh, input=kind, n=n))
+    return cases
+
+
+# ------------------------------------------------------------
+# Loader CSV
+# ------------------------------------------------------------
+def _loader_cases(profile, workdir):
+    cases = []
+    cols = profile["csv_cols"]
+    for rows in profile["csv_rows"]:
+        for density in (1.0, 0.1):
+            path = csv_fixture(workdir, rows, cols, density)
+            variants = [dict(impute=s, normalize=None) for s in IMPUTE_STRATEGIES]
+            variants += [dict(impute="zero", normalize=n) for n in NORMALIZATIONS]
+            for as_sparse in (False, True):
+                for streaming in (False, True):
+                    for variant in variants:
+                        def run(path, as_sparse=as_sparse, streaming=streaming, variant=variant):
+                            return load_matrix_from_csv(
+                                path, impute_strategy=variant["impute"], normalize=variant["normalize"],
+                                as_sparse=as_sparse, streaming=streaming,
+                            )
+                        cases.append(_case(
+                            "loader", "load_matrix_from_csv", run, lambda path=path: (path,),
+                            rows=rows, cols=cols, density=density,
+                            output="sparse" if as_sparse else "dense",
+                            mode="stream" if streaming else "classic",
+                            impute=variant["impute"], normalize=variant["normalize"],
+                        ))
+    return cases
+
+
+# ------------------------------------------------------------
+# Exporter
+# ------------------------------------------------------------
+def _exporter_cases(profile, workdir):
+    cases = []
+    n = max(profile["sizes"])
+    exporters = (
+        ("csv", lambda m, p: export_to_csv(m, p + ".csv")),
+        ("json_compact", lambda m, p: export_to_json(m, p + ".json", mode="compact")),
+        ("json_ndjson", lambda m, p: export_to_json(m, p + ".ndjson", mode="ndjson")),
+        ("json_pretty", lambda m, p: export_to_json(m, p + ".pretty.json", mode="pretty")),
+        ("binary", lambda m, p: export_to_binary(m, p + ".mtxb")),
+    )
+    for backend, density in (("list", 1.0), ("numpy", 1.0), ("sparse", 0.05)):
+        matrix = _fixture(("m", backend, n, density, 1), lambda: make_matrix(backend, n, n, density, seed=1))
+        prefix = os.path.join(workdir, f"export_{backend}_{n}")
+        for fmt, func in exporters:
+            cases.append(_case("exporters", fmt, func, lambda m=matrix, p=prefix: (m, p),
+                               backend=backend, n=n, density=density))
+    return cases
+
+
+# ------------------------------------------------------------
+# Regresi
+# ------------------------------------------------------------
+def _regression_cases(profile, workdir):
+    cases = []
+    for rows in profile["regression_rows"]:
+        data = _fixture(("reg", rows), lambda: random_array(rows, 4, seed=5, integer=False))
+        x, y = data[:, 0].tolist(), data[:, -1].tolist()
+        cases.append(_case("regression", "linear_regression", linear_regression,
+                           lambda x=x, y=y: (x, y), rows=rows))
+
+        design = np.column_stack((np.ones(rows), data[:, :-1]))
+        X = Matrix(design)
+        Y = Matrix(data[:, -1:].copy())
+        cases.append(_case("regression", "multiple_linear_regression", multiple_linear_regression,
+                           lambda X=X, Y=Y: (X, Y), rows=rows, backend="numpy"))
+
+        # XᵀX out-of-core: desain di tile memmap, panel dialirkan dengan budget kecil
+        tiled = _fixture(("tiled", rows), lambda: TiledMatrix.from_matrix(
+            design, os.path.join(workdir, f"tiled_{rows}"), tile_shape=(4096, design.shape[1])))
+        cases.append(_case("regression", "tiled_gram",
+                           lambda t: multiply_matrices(transpose_matrix(t), t, memory_budget=8 * 2 ** 20),
+                           lambda t=tiled: (t,), rows=rows, backend="tiled"))
+
+        matrix = Matrix(data)
+        cases.append(_case("regression", "mlr.fit_matrix", mlr.fit_matrix,
+                           lambda m=matrix: (m,), rows=rows))
+
+        path = csv_fixture(workdir, rows, 4, 1.0, missing=0.0, seed=5)
+        cases.append(_case("regression", "mlr.fit_csv", mlr.fit_csv,
+                           lambda path=path: (path,), rows=rows))
+    return cases
+
+
+def build_cases(profile_name, workdir):
+    """Semua kasus untuk profil `profile_name`; file sintetis ditulis ke `workdir`."""
+    if profile_name not in PROFILES:
+        raise ValueError(f"Profil benchmark tidak dikenal: {profile_name}")
+    profile = PROFILES[profile_name]
+    return (
+        _operation_cases(profile)
+        + _validator_cases(profile)
+        + _loader_cases(profile, workdir)
+        + _exporter_cases(profile, workdir)
+        + _regression_cases(profile, workdir)
+    )
@@ -0,0 +1,61 @@
+# benchmarks/data.py
+"""
+Data sintetis deterministik untuk benchmark (seed tetap → hasil bisa diulang).
+"""
+
+import os
+
+import numpy as np
+
+from matrix import Matrix
+from sparsematrix import SparseMatrix
+
+
+def random_array(rows, cols, density=1.0, seed=0, integer=True):
+    """Array rows×cols; kira-kira (1 - density) bagian sel bernilai 0."""
+    rng = np.random.default_rng(seed)
+    if integer:
+        values = rng.integers(1, 100, size=(rows, cols))
+    else:
+        values = rng.random((rows, cols)) * 100.0
+    if density < 1.0:
+        values = values * (rng.random((rows, cols)) < density)
+    return values
+
+
+def make_matrix(backend, rows, cols, density=1.0, seed=0):
+    """
+    Matriks sintetis untuk backend "list" | "numpy" | "array" | "sparse".
+    Matriks persegi dibuat dominan diagonal agar determinan/invers selalu terdefinisi.
+    """
+    values = random_array(rows, cols, density, seed)
+    if rows == cols:
+        values = values + np.eye(rows, dtype=values.dtype) * (100 * rows)
+    if backend == "numpy":
+        return Matrix(values)
+    if backend == "array":
+        return Matrix.compact(values)
+    if backend == "sparse":
+        return SparseMatrix(values.tolist())
+    return Matrix(values.tolist())
+
+
+def write_csv(path, rows, cols, density=1.0, missing=0.0, seed=0):
+    """Tulis CSV numerik tanpa header; `missing` bagian sel dikosongkan (untuk imputasi)."""
+    values = random_array(rows, cols, density, seed)
+    rng = np.random.default_rng(seed + 1)
+    blanks = rng.random((rows, cols)) < missing
+    with open(path, "w", newline="") as f:
+        for row, blank in zip(values.tolist(), blanks.tolist()):
+            f.write(",".join("" if b else str(v) for v, b in zip(row, blank)))
+            f.write("\n")
+    return path
+
+
+def csv_fixture(workdir, rows, cols, density, missing=0.05, seed=0):
+    """Path CSV sintetis di `workdir` (dibuat sekali per kombinasi parameter)."""
+    name = f"synthetic_{rows}x{cols}_d{density}_m{missing}_s{seed}.csv"
+    path = os.path.join(workdir, name)
+    if not os.path.exists(path):
+        write_csv(path, rows, cols, density, missing, seed)
+    return path
@@ -0,0 +1,138 @@
+# benchmarks/runner.py
+"""
+Eksekusi kasus benchmark dan pembandingan dengan baseline.
+
+Format hasil (JSON):
+    {
+      "meta":    {python, platform, numpy, cpu_count, commit, profile, repeat, ...},
+      "results": {nama_kasus: {group, params, repeat, min, median, mean}
+                              | {group, params, error}}
+    }
+"""
+
+from contextlib import redirect_stdout
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment(profile, repeat, warmup):
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "cpu_count": os.cpu_count(),
+        "commit": _git_commit(),
+        "profile": profile,
+        "repeat": repeat,
+        "warmup": warmup,
+    }
+
+
+def time_case(case, repeat=5, warmup=1):
+    """Jalankan satu kasus: `warmup` putaran tanpa diukur lalu `repeat` putaran terukur (detik)."""
+    # Exporter mencetak pesan sukses; output tidak ikut diukur / ditampilkan
+    sink = io.StringIO()
+    with redirect_stdout(sink):
+        for _ in range(warmup):
+            case.run(*case.setup())
+        times = []
+        for _ in range(repeat):
+            args = case.setup()
+            start = time.perf_counter()
+            case.run(*args)
+            times.append(time.perf_counter() - start)
+            sink.seek(0)
+            sink.truncate()
+    return {
+        "repeat": repeat,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+    }
+
+
+def run_suite(cases, repeat=5, warmup=1, profile=None, progress=None):
+    """Jalankan semua kasus; kasus yang melempar exception dicatat sebagai error, suite tetap lanjut."""
+    results = {}
+    for i, case in enumerate(cases, 1):
+        entry = {"group": case.group, "params": case.params}
+        try:
+            entry.update(time_case(case, repeat, warmup))
+        except Exception as e:
+            entry["error"] = f"{type(e).__name__}: {e}"
+        results[case.name] = entry
+        if progress is not None:
+            progress(i, len(cases), case.name, entry)
+    return {"meta": environment(profile, repeat, warmup), "results": results}
+
+
+def save_results(results, path):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(baseline, current, threshold=0.10, metric="median"):
+    """
+    Bandingkan dua hasil suite per nama kasus.
+    status: "regression" (rasio > 1 + threshold, atau kasus yang berhasil di baseline
+            kini gagal; pesan error ada di row["error"]),
+            "improvement" (rasio < 1 / (1 + threshold)),
+            "ok", "new" (tidak ada di baseline), "missing" (hilang dari hasil sekarang),
+            "error" (gagal di baseline; masih gagal atau baru berhasil sekarang)
+    """
+    base_results = baseline["results"]
+    cur_results = current["results"]
+    rows = []
+    for name in sorted(set(base_results) | set(cur_results)):
+        base, cur = base_results.get(name), cur_results.get(name)
+        row = {"name": name, "baseline": None, "current": None, "ratio": None}
+        if base is None:
+            row["status"] = "new"
+        elif cur is None:
+            row["status"] = "missing"
+        elif "error" in cur and "error" not in base:
+            row["status"] = "regression"
+            row["error"] = cur["error"]
+        elif "error" in base:
+            row["status"] = "error"
+        else:
+            row["baseline"] = base[metric]
+            row["current"] = cur[metric]
+            row["ratio"] = cur[metric] / base[metric] if base[metric] > 0 else float("inf")
+            if row["ratio"] > 1 + threshold:
+                row["status"] = "regression"
+            elif row["ratio"] < 1 / (1 + threshold):
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
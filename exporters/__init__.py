@@ -1,5 +1,6 @@
 # exporters/__init__.py
 from .csv_exporter import export_to_csv
 from .json_exporter import export_to_json
+from .binary_exporter import export_to_binary
 
-__all__ = ["export_to_csv", "export_to_json"]
+__all__ = ["export_to_csv", "export_to_json", "export_to_binary"]
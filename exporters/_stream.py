@@ -0,0 +1,69 @@
+# _stream.py
+"""Bantuan bersama exporter: membuka file output ber-buffer (opsional gzip) dan menulis per batch baris."""
+import gzip
+
+from sparsematrix import SparseMatrix
+
+# Ukuran buffer tulis file dan jumlah baris yang digabung per panggilan write()
+BUFFER_SIZE = 1 << 20
+BATCH_ROWS = 1024
+# Layout output: "dense" (satu baris per baris matriks, semua jenis matriks) |
+# "triplet" (khusus SparseMatrix: satu entri per elemen non-nol)
+LAYOUTS = ("dense", "triplet")
+
+
+def check_layout(matriks, layout, format_name):
+    if layout not in LAYOUTS:
+        raise ValueError(f"Layout {format_name} tidak dikenal: {layout} (pilih {', '.join(LAYOUTS)})")
+    if layout == "triplet" and not isinstance(matriks, SparseMatrix):
+        raise ValueError("Layout 'triplet' hanya untuk SparseMatrix.")
+
+
+def _sparse_rows(matriks):
+    """Baris dense SparseMatrix dibentuk satu per satu dari CSR (memori O(cols))."""
+    csr = matriks.tocsr()
+    indptr, indices, values = csr.indptr, csr.indices, csr.values
+    for i in range(csr.rows):
+        row = [0] * csr.cols
+        for k in range(indptr[i], indptr[i + 1]):
+            row[indices[k]] = values[k]
+        yield row
+
+
+def dense_rows(matriks):
+    """Iterator baris (list) untuk Matrix / SparseMatrix tanpa membentuk seluruh .data."""
+    if isinstance(matriks, SparseMatrix):
+        return _sparse_rows(matriks)
+    return matriks.iter_rows() if hasattr(matriks, "iter_rows") else iter(matriks.data)
+
+
+def open_output(nama_file, compress=False, newline=None):
+    """Buka file teks untuk ditulis; gzip jika compress=True atau nama berakhiran .gz."""
+    if compress or str(nama_file).endswith(".gz"):
+        return gzip.open(nama_file, "wt", newline=newline)
+    return open(nama_file, "w", newline=newline, buffering=BUFFER_SIZE)
+
+
+def write_lines(file, lines, suffix="\n"):
+    """Tulis iterator string per batch sehingga jumlah panggilan write() kecil."""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= BATCH_ROWS:
+            file.write(suffix.join(batch) + suffix)
+            batch.clear()
+    if batch:
+        file.write(suffix.join(batch) + suffix)
+
+
+def with_commas(items):
+    """Tambahkan koma di akhir setiap item kecuali yang terakhir (isi array JSON per baris)."""
+    it = iter(items)
+    _missing = object()
+    prev = next(it, _missing)
+    if prev is _missing:
+        return
+    for item in it:
+        yield prev + ","
+        prev = item
+    yield prev
@@ -0,0 +1,112 @@
+# binary_exporter.py
+"""
+Format biner matriks (.mtxb) yang bisa di-memory-map:
+
+  header 64 byte (little-endian):
+    magic  4s   b"MTXB"
+    versi  B    1
+    flags  B    bit 0 = sparse (CSR)
+    dtype  c    b"q" (int64) | b"d" (float64)
+    (pad)  x
+    rows   Q
+    cols   Q
+    nnz    Q    (0 untuk dense)
+  data:
+    dense  : rows*cols nilai, row-major
+    sparse : indptr (rows+1 × int64), indices (nnz × int64), values (nnz × dtype)
+"""
+from array import array
+import os
+import struct
+import sys
+import tempfile
+
+from sparsematrix import SparseMatrix
+from utilities import profiler
+
+MAGIC = b"MTXB"
+VERSION = 1
+FLAG_SPARSE = 1
+HEADER = struct.Struct("<4sBBcxQQQ")
+HEADER_SIZE = 64
+
+
+def _to_little_endian(arr):
+    if sys.byteorder != "little":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr
+
+
+def _write_header(file, flags, typecode, rows, cols, nnz):
+    header = HEADER.pack(MAGIC, VERSION, flags, typecode.encode(), rows, cols, nnz)
+    file.write(header.ljust(HEADER_SIZE, b"\0"))
+
+
+def _write_dense(file, matriks):
+    if getattr(matriks, "backend", None) == "numpy":
+        buffer = matriks.to_array()
+        typecode = "q" if buffer.dtype.kind in "iub" else "d"
+        _write_header(file, 0, typecode, matriks.rows, matriks.cols, 0)
+        file.write(buffer.astype("<i8" if typecode == "q" else "<f8", copy=False).tobytes())
+        return
+
+    # Backend array: buffer flat sudah berformat sama (row-major, int64 / float64)
+    if getattr(matriks, "backend", None) == "array":
+        flat = matriks.to_flat()
+        _write_header(file, 0, flat.typecode, matriks.rows, matriks.cols, 0)
+        file.write(_to_little_endian(flat).tobytes())
+        return
+
+    data = matriks.data
+    typecode = "q" if all(type(v) is int for row in data for v in row) else "d"
+    _write_header(file, 0, typecode, matriks.rows, matriks.cols, 0)
+    for row in data:
+        file.write(_to_little_endian(array(typecode, row)).tobytes())
+
+
+def _write_sparse(file, matriks):
+    csr = matriks.tocsr()
+    values = csr.values
+    if not isinstance(values, array):
+        # Nilai campuran int / float: format hanya mengenal int64 atau float64
+        values = array("q" if all(type(v) is int for v in values) else "d", values)
+    _write_header(file, FLAG_SPARSE, values.typecode, csr.rows, csr.cols, csr.nnz)
+    for arr in (csr.indptr, csr.indices, values):
+        file.write(_to_little_endian(arr).tobytes())
+
+
+def write_binary(file, matriks):
+    """Tulis header + data matriks ke file biner yang sudah terbuka (tanpa pesan / penanganan error)."""
+    if isinstance(matriks, SparseMatrix):
+        _write_sparse(file, matriks)
+    else:
+        _write_dense(file, matriks)
+
+
+@profiler.timed()
+def export_to_binary(matriks, nama_file):
+    """
+    Fungsi untuk mengekspor matriks ke file biner .mtxb (lihat docstring modul).
+    :param matriks: Matrix atau SparseMatrix
+    :param nama_file: Nama file output.
+
+    File ditulis ke file sementara di direktori yang sama lalu diganti atomik
+    (os.replace): pembaca yang masih me-mmap file lama (load_matrix_from_binary,
+    visualizer) tetap melihat isi lama, bukan file yang terpotong di tempat.
+    """
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(nama_file)), suffix=".tmp")
+        with os.fdopen(fd, 'wb') as file:
+            write_binary(file, matriks)
+        # mkstemp membuat file 0600: samakan dengan izin file biasa (0666 & ~umask)
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)
+        os.replace(tmp, nama_file)
+        print(f"✅ Matriks berhasil diekspor ke {nama_file}")
+    except Exception as e:
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
+        print(f"❌ Terjadi kesalahan saat mengekspor ke biner: {e}")
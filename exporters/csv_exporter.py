@@ -1,17 +1,30 @@
 # csv_exporter.py
 import csv
 
-def export_to_csv(matriks, nama_file):
+from ._stream import LAYOUTS, check_layout, dense_rows, open_output
+from utilities import profiler
+
+
+@profiler.timed()
+def export_to_csv(matriks, nama_file, compress=False, layout="dense"):
     """
-    Fungsi untuk mengekspor data matriks ke file CSV.
-    :param matriks: Objek matriks (harus memiliki attribute .data berupa list of lists)
-    :param nama_file: Nama file output CSV.
+    Fungsi untuk mengekspor data matriks ke file CSV secara streaming (baris demi baris).
+    :param matriks: Objek matriks (Matrix / SparseMatrix)
+    :param nama_file: Nama file output CSV (akhiran .gz → dikompres gzip).
+    :param compress: Paksa kompresi gzip.
+    :param layout: "dense" (default, satu baris CSV per baris matriks untuk semua
+                   jenis matriks) | "triplet" (khusus SparseMatrix: header
+                   "row,col,value" lalu satu baris per elemen non-nol).
     """
+    check_layout(matriks, layout, "CSV")
     try:
-        with open(nama_file, 'w', newline='') as file:
+        with open_output(nama_file, compress, newline='') as file:
             writer = csv.writer(file)
-            for row in matriks.data:
-                writer.writerow(row)
+            if layout == "triplet":
+                writer.writerow(["row", "col", "value"])
+                writer.writerows(matriks.iter_nonzero())
+            else:
+                writer.writerows(dense_rows(matriks))
         print(f"✅ Matriks berhasil diekspor ke {nama_file}")
     except Exception as e:
         print(f"❌ Terjadi kesalahan saat mengekspor ke CSV: {e}")
@@ -1,16 +1,71 @@
 # json_exporter.py
 import json
 
-def export_to_json(matriks, nama_file):
+from ._stream import LAYOUTS, check_layout, dense_rows, open_output, write_lines, with_commas
+from utilities import profiler
+
+_COMPACT = (",", ":")
+
+
+def _dump(value):
+    return json.dumps(value, separators=_COMPACT)
+
+
+def _write_dense(file, matriks, mode):
+    rows = dense_rows(matriks)
+    if mode == "ndjson":
+        write_lines(file, map(_dump, rows))
+    elif mode == "pretty":
+        # format lama (indent=4), tetap ditulis per baris
+        file.write("[")
+        first = True
+        for row in rows:
+            file.write(("\n" if first else ",\n") + "\n".join(
+                "    " + line for line in json.dumps(row, indent=4).splitlines()))
+            first = False
+        file.write("\n]" if not first else "]")
+    else:
+        file.write("[\n")
+        write_lines(file, with_commas(map(_dump, rows)))
+        file.write("]\n")
+
+
+def _write_sparse(file, matriks, mode):
+    meta = {"format": "coo", "shape": [matriks.rows, matriks.cols], "nnz": matriks.nnz}
+    entries = ([i, j, v] for i, j, v in matriks.iter_nonzero())
+    if mode == "ndjson":
+        write_lines(file, [_dump(meta)])
+        write_lines(file, map(_dump, entries))
+        return
+    file.write(_dump(meta)[:-1] + ',"entries":[\n')
+    write_lines(file, with_commas(map(_dump, entries)))
+    file.write("]}\n")
+
+
+@profiler.timed()
+def export_to_json(matriks, nama_file, mode="compact", compress=False, layout="dense"):
     """
-    Fungsi untuk mengekspor data matriks ke file JSON.
-    :param matriks: Objek matriks (harus memiliki attribute .data berupa list of lists)
-    :param nama_file: Nama file output JSON.
+    Fungsi untuk mengekspor data matriks ke file JSON secara streaming (baris demi baris).
+    :param matriks: Objek matriks (Matrix / SparseMatrix)
+    :param nama_file: Nama file output JSON (akhiran .gz → dikompres gzip).
+    :param mode: "compact" (array JSON, satu baris matriks per baris teks)
+                 | "ndjson" (satu array JSON per baris, tanpa pembungkus)
+                 | "pretty" (indent=4 seperti format lama)
+    :param compress: Paksa kompresi gzip.
+    :param layout: "dense" (default, array baris untuk semua jenis matriks; SparseMatrix
+                   dibentuk per baris dari CSR) | "triplet" (khusus SparseMatrix:
+                   {"format": "coo", "shape", "nnz", "entries": [[i, j, v], ...]}, pada
+                   mode ndjson baris metadata lalu satu triplet per baris).
     """
+    if mode not in ("compact", "ndjson", "pretty"):
+        raise ValueError(f"Mode JSON tidak dikenal: {mode}")
+    check_layout(matriks, layout, "JSON")
     try:
-        matriks_data = matriks.data
-        with open(nama_file, 'w') as file:
-            json.dump(matriks_data, file, indent=4)
+        with open_output(nama_file, compress) as file:
+            if layout == "triplet":
+                _write_sparse(file, matriks, mode)
+            else:
+                _write_dense(file, matriks, mode)
         print(f"✅ Matriks berhasil diekspor ke {nama_file}")
     except Exception as e:
         print(f"❌ Terjadi kesalahan saat mengekspor ke JSON: {e}")
@@ -9,31 +9,57 @@ import time
 from typing import Any
 
 # Import class Matrix untuk merepresentasikan matriks
-from matrix import Matrix
+from matrix import Matrix, np
 
 # === Import utility untuk input & output data ===
 from utilities.csv_loader import load_matrix_from_csv       # Load CSV menjadi Matrix / SparseMatrix
-from utilities.formatter import print_matrix                # Format tampilan matriks ke console
+from utilities.formatter import print_matrix, DEFAULT_MAX_ROWS, DEFAULT_MAX_COLS  # Preview matriks (dielisi) ke console
+from utilities import profiler                              # Span/counter per stage (--profile)
 
 # === Import operasi dasar matriks ===
 from operations.adder import add_matrices                   # Penjumlahan matriks
 from operations.subtractor import subtract_matrices         # Pengurangan matriks
 from operations.multiplier import multiply_matrices         # Perkalian matriks
-from operations.inverse import inverse_matrix               # Invers matriks (dipakai hanya untuk matriks kecil)
+from operations.inverse import inverse_matrix               # Invers matriks (dekomposisi LU)
 from operations.transpose import transpose_matrix           # Transpose matriks
 
-# === Import Regresi / MLR (gunakan mlr.py yang memakai pseudo-inverse) ===
+# === Import Regresi / MLR (gunakan mlr.py berbasis persamaan normal) ===
 from operations.linear_regression import linear_regression, predict
-import operations.mlr as mlr_module  # multiple_linear_regression ada di sini (pakai pinv)
+import operations.mlr as mlr_module  # MLR streaming (akumulasi X^T X, X^T y per chunk)
+from operations import result_cache  # Cache hasil perkalian / invers / determinan / MLR
 
 # === Import validator matriks ===
 from validators.is_square import is_square
 from validators.is_symmetric import is_symmetric
 from validators.is_identity import is_identity
+from validators.is_diagonal import is_diagonal
+from validators.is_triangular import is_triangular
 
 # fungsi eksporter
 from exporters.csv_exporter import export_to_csv
 from exporters.json_exporter import export_to_json
+from exporters.binary_exporter import export_to_binary
+
+
+# Batas n untuk determinan & invers di CLI (LU O(n^3) berjalan sebelum output lain):
+# LU pure-Python ~2.5 detik pada n=300, LU buffer numpy ~1 detik pada n=1000.
+PYTHON_LU_MAX_N = 100
+BUFFER_LU_MAX_N = 1000
+
+
+def square_ops_operand(matriks):
+    """
+    Matriks yang dipakai untuk determinan & invers di CLI, atau None jika terlalu
+    besar. Di atas PYTHON_LU_MAX_N matriks dipindah ke buffer numpy (LU vektorisasi).
+    """
+    n = matriks.rows
+    if n <= PYTHON_LU_MAX_N:
+        return matriks
+    if np is None or n > BUFFER_LU_MAX_N:
+        return None
+    if getattr(matriks, "backend", None) == "numpy":
+        return matriks
+    return Matrix.from_array(matriks.to_array() if isinstance(matriks, Matrix) else matriks.data)
 
 
 def normalize_wsl_path(path: str) -> str:
@@ -69,7 +95,7 @@ def parse_args():
     - opsi normalisasi.
     """
     p = argparse.ArgumentParser(description="Load CSV(s) and run matrix operations.")
-    p.add_argument("--a", required=True, help="Path ke CSV untuk matriks A.")
+    p.add_argument("--a", help="Path ke CSV untuk matriks A (wajib kecuali memakai --batch).")
     p.add_argument("--b", help="Path ke CSV untuk matriks B (opsional).")
     p.add_argument("--delimiter", default=None, help="Delimiter CSV (default koma).")
     p.add_argument("--skip-header", action="store_true", help="Lewatkan baris header CSV.")
@@ -80,8 +106,59 @@ def parse_args():
                    help="Strategi isi nilai hilang.")
     p.add_argument("--normalize", choices=["minmax", "zscore"], default=None,
                    help="Normalisasi kolom numerik.")
+    p.add_argument("--backend", choices=["list", "numpy", "array"], default=None,
+                   help="Backend penyimpanan Matrix (numpy = buffer kontigu + kernel vektor, array = buffer flat tanpa numpy).")
+    p.add_argument("--stream", action="store_true",
+                   help="Muat CSV secara streaming per chunk (memori ≈ ukuran matriks output).")
+    p.add_argument("--chunk-size", type=int, default=65536, help="Jumlah baris per chunk pada mode --stream.")
+    p.add_argument("--workers", type=int, default=None,
+                   help="Jumlah proses untuk parsing CSV paralel per rentang byte (mengaktifkan --stream).")
+    p.add_argument("--cache-dir", default=None,
+                   help="Direktori cache hasil parse CSV (.mtxb); start berikutnya tidak mem-parse ulang.")
+    p.add_argument("--cache-validate", choices=["mtime", "hash"], default="mtime",
+                   help="Deteksi perubahan CSV untuk --cache-dir: ukuran+mtime (default) atau hash isi.")
+    p.add_argument("--schema", type=parse_schema, default=None, metavar="KOLOM=TIPE,...",
+                   help="Paksa tipe kolom (int / float / skip), mis. 'harga=float,id=skip'.")
     p.add_argument("--no-export", action="store_true", help="Matikan ekspor hasil ke file.")
-    return p.parse_args()
+    p.add_argument("--preview-rows", type=int, default=DEFAULT_MAX_ROWS,
+                   help="Jumlah baris matriks yang ditampilkan (awal + akhir); 0 = semua.")
+    p.add_argument("--preview-cols", type=int, default=DEFAULT_MAX_COLS,
+                   help="Jumlah kolom matriks yang ditampilkan (awal + akhir); 0 = semua.")
+    p.add_argument("--precision", type=int, default=None,
+                   help="Jumlah desimal nilai float pada tampilan matriks.")
+    p.add_argument("--profile", action="store_true",
+                   help="Cetak breakdown waktu per stage (loader, operasi, exporter) beserta counter.")
+    p.add_argument("--profile-out", metavar="PATH", default=None,
+                   help="Tulis trace JSON (format Chrome trace + ringkasan stage) ke PATH.")
+    p.add_argument("--profile-cprofile", action="store_true",
+                   help="Jalankan stage di bawah cProfile; profil stage terlama ikut dilaporkan.")
+    p.add_argument("--result-cache-mb", type=float, default=None,
+                   help="Aktifkan cache hasil operasi (berbasis isi operand) dengan batas memori MB.")
+    p.add_argument("--result-cache-dir", default=None,
+                   help="Direktori tier disk cache hasil (mengaktifkan cache; bisa dipakai bersama antar proses).")
+    p.add_argument("--batch", metavar="JOBS.jsonl", default=None,
+                   help="Jalankan banyak job dari file JSONL (lihat batch.py) di pool proses.")
+    p.add_argument("--batch-out", metavar="PATH", default=None,
+                   help="File JSONL hasil batch (default: <JOBS>.results.jsonl).")
+    p.add_argument("--jobs", type=int, default=None,
+                   help="Jumlah proses worker untuk --batch (default: jumlah CPU).")
+    args = p.parse_args()
+    if not args.a and not args.batch:
+        p.error("--a wajib diisi (atau gunakan --batch).")
+    return args
+
+
+def parse_schema(text: str) -> dict:
+    """
+    Ubah 'kolom=tipe,kolom=tipe' menjadi dict schema untuk load_matrix_from_csv.
+    """
+    schema = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        column, sep, kind = item.partition("=")
+        if not sep or not column.strip() or kind.strip() not in ("int", "float", "skip"):
+            raise argparse.ArgumentTypeError(f"Format schema tidak valid: '{item}' (gunakan kolom=int|float|skip)")
+        schema[column.strip()] = kind.strip()
+    return schema
 
 
 def make_abs_and_normalize(path: str) -> str:
@@ -96,65 +173,151 @@ def make_abs_and_normalize(path: str) -> str:
     return normalized
 
 
-def _print_matrix_or_obj(name: str, obj: Any):
+def _print_matrix_or_obj(name: str, obj: Any, **preview):
     """
     Helper: jika obj punya attribute .data (Matrix-like) gunakan print_matrix,
     kalau bukan, print biasa.
     """
     print(f"\n{name}")
     if hasattr(obj, "data"):
-        print_matrix(obj)
+        print_matrix(obj, **preview)
     else:
         print(obj)
 
 
+def _result_cache_options(args):
+    """Argumen result_cache.enable() dari CLI, atau None jika cache tidak diminta."""
+    if args.result_cache_mb is None and not args.result_cache_dir:
+        return None
+    options = {"disk_dir": make_abs_and_normalize(args.result_cache_dir) if args.result_cache_dir else None}
+    if args.result_cache_mb is not None:
+        options["max_bytes"] = int(args.result_cache_mb * 2 ** 20)
+    return options
+
+
+def run_batch_mode(args):
+    """
+    Mode --batch: opsi loader dari CLI menjadi default setiap job, hasil per job
+    ditulis ke JSONL segera setelah selesai.
+    """
+    import batch
+
+    jobs_path = make_abs_and_normalize(args.batch)
+    out_path = make_abs_and_normalize(args.batch_out) if args.batch_out \
+        else os.path.splitext(jobs_path)[0] + ".results.jsonl"
+    defaults = {
+        "delimiter": args.delimiter,
+        "skip_header": args.skip_header,
+        "impute_strategy": args.impute,
+        "normalize": args.normalize,
+        "as_sparse": args.as_sparse,
+        "sparse_threshold": args.sparse_threshold,
+        "backend": args.backend,
+        "streaming": args.stream,
+        "chunk_size": args.chunk_size,
+        "schema": args.schema,
+    }
+    if args.cache_dir:
+        defaults["cache_dir"] = make_abs_and_normalize(args.cache_dir)
+        defaults["cache_validate"] = args.cache_validate
+    jobs = batch.load_jobs(jobs_path, defaults)
+    print(f"Menjalankan {len(jobs)} job dari: {jobs_path}")
+
+    def progress(done, total, result):
+        if result["status"] == "ok":
+            status = "ok"
+        elif "error" in result:
+            status = f"ERROR {result['error']}"
+        else:
+            failed = [op["op"] for op in result.get("ops", []) if "error" in op]
+            status = f"ERROR pada operasi: {', '.join(failed)}"
+        print(f"[{done}/{total}] {result['id']}: {status}", flush=True)
+
+    summary = batch.run_batch(jobs, out_path, workers=args.jobs, progress=progress,
+                              result_cache_options=_result_cache_options(args))
+    print(f"\nSelesai: {summary['ok']} ok, {summary['error']} gagal, "
+          f"{summary['shared_inputs']} input dipakai bersama, {summary['seconds']:.2f} detik")
+    print(f"Hasil ditulis ke: {out_path}")
+    return 1 if summary["error"] else 0
+
+
 def main():
     # Ambil semua argumen
     args = parse_args()
+    if args.batch:
+        sys.exit(run_batch_mode(args))
+    cache_options = _result_cache_options(args)
+    if cache_options is not None:
+        result_cache.enable(**cache_options)
+    if args.profile or args.profile_out or args.profile_cprofile:
+        profiler.enable(cprofile=args.profile_cprofile)
+
+    # Opsi tampilan matriks: hanya baris awal/akhir yang diformat
+    preview = {"max_rows": args.preview_rows, "max_cols": args.preview_cols, "precision": args.precision}
 
     try:
         # Normalisasi path file input
         a_path = make_abs_and_normalize(args.a)
         b_path = make_abs_and_normalize(args.b) if args.b else None
+        cache_dir = make_abs_and_normalize(args.cache_dir) if args.cache_dir else None
 
         print(f"Loading A from: {a_path}")
         if b_path:
             print(f"Loading B from: {b_path}")
 
         # === Load matriks A dengan opsi imputasi, normalisasi, dan deteksi sparse ===
-        matriks_a = load_matrix_from_csv(
-            a_path,
-            delimiter=args.delimiter,
-            skip_header=args.skip_header,
-            impute_strategy=args.impute,
-            normalize=args.normalize,
-            as_sparse=args.as_sparse,
-            sparse_threshold=args.sparse_threshold
-        )
+        with profiler.span("load A"):
+            matriks_a = load_matrix_from_csv(
+                a_path,
+                delimiter=args.delimiter,
+                skip_header=args.skip_header,
+                impute_strategy=args.impute,
+                normalize=args.normalize,
+                as_sparse=args.as_sparse,
+                sparse_threshold=args.sparse_threshold,
+                backend=args.backend,
+                streaming=args.stream,
+                chunk_size=args.chunk_size,
+                workers=args.workers,
+                cache_dir=cache_dir,
+                cache_validate=args.cache_validate,
+                schema=args.schema
+            )
 
         print("\n--- Matriks A (preview) ---")
-        print_matrix(matriks_a)
+        print_matrix(matriks_a, **preview)
 
         # === Validasi sifat matriks A ===
         print("\n[Validasi Matriks A]")
-        print("Persegi?    :", is_square(matriks_a.data))
-        print("Simetris?   :", is_symmetric(matriks_a.data))
-        print("Identitas?  :", is_identity(matriks_a.data))
+        # Flag struktur dihitung sekali dan di-cache pada Matrix
+        print("Persegi?    :", is_square(matriks_a))
+        print("Simetris?   :", is_symmetric(matriks_a))
+        print("Identitas?  :", is_identity(matriks_a))
+        print("Diagonal?   :", is_diagonal(matriks_a))
+        print("Segitiga?   :", is_triangular(matriks_a))
 
         # === Jika ada Matriks B ===
         if b_path:
-            matriks_b = load_matrix_from_csv(
-                b_path,
-                delimiter=args.delimiter,
-                skip_header=args.skip_header,
-                impute_strategy=args.impute,
-                normalize=args.normalize,
-                as_sparse=args.as_sparse,
-                sparse_threshold=args.sparse_threshold
-            )
+            with profiler.span("load B"):
+                matriks_b = load_matrix_from_csv(
+                    b_path,
+                    delimiter=args.delimiter,
+                    skip_header=args.skip_header,
+                    impute_strategy=args.impute,
+                    normalize=args.normalize,
+                    as_sparse=args.as_sparse,
+                    sparse_threshold=args.sparse_threshold,
+                    backend=args.backend,
+                    streaming=args.stream,
+                    chunk_size=args.chunk_size,
+                    workers=args.workers,
+                    cache_dir=cache_dir,
+                    cache_validate=args.cache_validate,
+                    schema=args.schema
+                )
 
             print("\n--- Matriks B (preview) ---")
-            print_matrix(matriks_b)
+            print_matrix(matriks_b, **preview)
 
             print("\n--- Operasi Matriks (A & B) ---")
 
@@ -162,7 +325,7 @@ def main():
             try:
                 hasil_penjumlahan = add_matrices(matriks_a, matriks_b)
                 print("\nHasil Penjumlahan:")
-                print_matrix(hasil_penjumlahan)
+                print_matrix(hasil_penjumlahan, **preview)
             except Exception as e:
                 print(f"[ERROR] Penjumlahan gagal: {e}")
                 hasil_penjumlahan = None
@@ -171,7 +334,7 @@ def main():
             try:
                 hasil_pengurangan = subtract_matrices(matriks_a, matriks_b)
                 print("\nHasil Pengurangan:")
-                print_matrix(hasil_pengurangan)
+                print_matrix(hasil_pengurangan, **preview)
             except Exception as e:
                 print(f"[ERROR] Pengurangan gagal: {e}")
                 hasil_pengurangan = None
@@ -181,7 +344,7 @@ def main():
                 start = time.time()
                 hasil_perkalian = multiply_matrices(matriks_a, matriks_b)
                 print("\nHasil Perkalian:")
-                print_matrix(hasil_perkalian)
+                print_matrix(hasil_perkalian, **preview)
                 print(f"\nWaktu eksekusi perkalian: {time.time() - start:.4f} detik")
             except Exception as e:
                 print(f"[ERROR] Perkalian gagal: {e}")
@@ -203,25 +366,29 @@ def main():
         try:
             transpose_a = transpose_matrix(matriks_a)
             print("\nTranspose Matriks A:")
-            print_matrix(transpose_a)
+            print_matrix(transpose_a, **preview)
         except Exception as e:
             print(f"[ERROR] Transpose gagal: {e}")
 
-        # Determinan & Invers hanya untuk matriks kecil (2x2 atau 3x3)
-        if matriks_a.rows <= 3 and matriks_a.rows == matriks_a.cols:
+        # Determinan & Invers untuk matriks persegi (LU dipakai bersama, faktorisasi sekali)
+        square_a = square_ops_operand(matriks_a) if is_square(matriks_a) else None
+        if square_a is not None:
             from operations.determinant import find_determinant
             try:
-                print(f"\nDeterminan Matriks A: {find_determinant(matriks_a)}")
+                print(f"\nDeterminan Matriks A: {find_determinant(square_a)}")
             except Exception:
                 print("[ERROR] Gagal menghitung determinan")
 
             try:
                 print("\nInvers Matriks A:")
-                print_matrix(inverse_matrix(matriks_a))
+                print_matrix(inverse_matrix(square_a), **preview)
             except Exception:
                 print("[ERROR] Gagal menghitung invers")
+        elif is_square(matriks_a):
+            limit = BUFFER_LU_MAX_N if np is not None else PYTHON_LU_MAX_N
+            print(f"\n[INFO] Determinan dan invers dilewati: Matriks lebih besar dari {limit}x{limit}.")
         else:
-            print("\n[INFO] Determinan dan invers dilewati: Matriks tidak persegi kecil.")
+            print("\n[INFO] Determinan dan invers dilewati: Matriks tidak persegi.")
 
         # === Regresi Linear Sederhana ===
         if matriks_a.rows >= 2 and matriks_a.cols >= 2:
@@ -241,14 +408,10 @@ def main():
 
             # === Multiple Linear Regression (pakai operations.mlr) ===
             print("\n--- Multiple Linear Regression ---")
-            # X: tambah kolom bias (1.0), fitur = semua kolom kecuali target terakhir
-            X = [[1.0] + row[:-1] for row in matriks_a.data]
-            # Y: list target
-            Y = [row[-1] for row in matriks_a.data]
-
-            # Panggil MLR dari module mlr (kembalian list atau string error)
+            # X^T X dan X^T y diakumulasi per chunk baris matriks A: kolom bias (1.0)
+            # ditambahkan otomatis, fitur = semua kolom kecuali target terakhir
             try:
-                Beta = mlr_module.multiple_linear_regression(X, Y)
+                Beta = mlr_module.fit_matrix(matriks_a, target=-1)
             except Exception as e:
                 Beta = f"Error: {e}"
 
@@ -260,7 +423,7 @@ def main():
                 try:
                     # Pastikan iterable
                     print("\nKoefisien MLR (Beta):")
-                    for i, coef in enumerate(Beta):
+                    for i, coef in enumerate(Beta.ravel() if hasattr(Beta, "ravel") else Beta):
                         print(f"b{i} = {float(coef):.6f}")
                 except Exception:
                     # Fallback: print mentah
@@ -277,12 +440,32 @@ def main():
             except Exception:
                 # abaikan jika exporter json tidak kompatibel
                 pass
+            # format biner (mmap) untuk konsumen seperti visualizer_flask
+            export_to_binary(matriks_a, "matriks_a_copy.mtxb")
 
-            print("\nMatriks A diekspor ke: matriks_a_copy.csv & matriks_a_copy.json")
+            print("\nMatriks A diekspor ke: matriks_a_copy.csv, matriks_a_copy.json & matriks_a_copy.mtxb")
 
     except Exception as e:
         print(f"[ERROR] Program berhenti: {e}")
         sys.exit(1)
+    finally:
+        _report_profile(args)
+        if result_cache.is_enabled():
+            stats = result_cache.stats()
+            print("\nResult cache: " + ", ".join(
+                f"{k}={stats[k]}" for k in ("hits", "disk_hits", "misses", "evictions", "entries", "bytes")))
+
+
+def _report_profile(args):
+    """Cetak / tulis hasil profiler bila diaktifkan lewat --profile / --profile-out."""
+    if not profiler.is_enabled():
+        return
+    if args.profile or args.profile_cprofile:
+        print("\n--- Profil Stage ---")
+        profiler.print_report()
+    if args.profile_out:
+        path = profiler.write_trace(make_abs_and_normalize(args.profile_out))
+        print(f"\nTrace profiler ditulis ke: {path}")
 
 
 if __name__ == "__main__":
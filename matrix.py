@@ -1,35 +1,322 @@
 # matrix.py
-from validators.is_square import is_square
-from validators.is_symmetric import is_symmetric
-from validators.is_identity import is_identity
+from array import array
+
+from validators.structure import scan_structure
+
+try:
+    import numpy as np
+except ImportError:  # numpy opsional: tanpa numpy Matrix tetap memakai list of lists
+    np = None
+
+
+class _ReadOnlyList(list):
+    """
+    list hanya-baca untuk .data backend numpy / array: bisa dibaca, dibandingkan
+    dan disalin seperti list biasa, tetapi perubahan ditolak karena tidak akan
+    sampai ke buffer (dan ke cache LU / flag / sidik jari yang dihitung darinya).
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Matrix.data pada backend numpy / array hanya-baca; "
+                        "assign m.data = [...] untuk mengganti isi.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        # Salinan (copy / pickle) berupa list biasa yang boleh diubah
+        return list, (list(self),)
+
 
 class Matrix:
     """
     Kelas untuk merepresentasikan objek matriks.
+
+    Penyimpanan default berupa list of lists (backend "list"). Jika diberi
+    numpy.ndarray 2 dimensi, data disimpan sebagai buffer kontigu
+    (backend "numpy") dan .data hanya dibentuk (lazy) saat diakses, berupa
+    list hanya-baca.
+    Backend "array" (Matrix.from_flat / Matrix.compact) menyimpan isi dalam
+    satu array('q') / array('d') row-major tanpa numpy: 8 byte per elemen,
+    elemen (i, j) ada di indeks i * cols + j dan row(i) berupa memoryview.
+
+    Flag struktur (simetris, identitas, diagonal, segitiga) dihitung sekali
+    saat pertama ditanya lalu di-cache di _flags; operasi yang bisa
+    menurunkan flag hasil (mis. transpose matriks simetris) mengisinya
+    langsung lewat carry_flags. Seperti cache LU, isi matriks dianggap tidak
+    diubah di tempat; mengganti isi lewat `m.data = ...` mengosongkan semua cache.
     """
+    __slots__ = ("rows", "cols", "backend", "_buffer", "_flat", "_data", "_lu_cache", "_flags", "_fingerprint")
+
     def __init__(self, data):
+        self._flat = None
+        if np is not None and isinstance(data, np.ndarray):
+            if data.ndim != 2:
+                raise ValueError("Buffer ndarray harus berdimensi 2.")
+            self._buffer = np.ascontiguousarray(data)
+            self._data = None
+            self._lu_cache = None
+            self._fingerprint = None
+            self._flags = {}
+            self.rows, self.cols = self._buffer.shape
+            self.backend = "numpy"
+            return
+
+        self._set_rows(data)
+
+    def _set_rows(self, data):
+        """Pasang list of lists sebagai isi (backend "list") dan kosongkan semua cache."""
         if not isinstance(data, list) or not all(isinstance(row, list) for row in data):
             raise TypeError("Data harus berupa list of lists.")
-        self.data = data
-        self.rows = len(data)
-        self.cols = len(data[0]) if self.rows > 0 else 0
-        if not all(len(row) == self.cols for row in data):
+        rows = len(data)
+        cols = len(data[0]) if rows > 0 else 0
+        if not all(len(row) == cols for row in data):
+            raise ValueError("Semua baris harus memiliki jumlah kolom yang sama.")
+        self._buffer = None
+        self._flat = None
+        self._data = data
+        self._lu_cache = None
+        self._fingerprint = None
+        self._flags = {}
+        self.rows, self.cols = rows, cols
+        self.backend = "list"
+
+    @classmethod
+    def from_array(cls, data, dtype=None):
+        """Buat Matrix dengan backend buffer numpy dari list of lists / array-like."""
+        if np is None:
+            raise ImportError("Backend buffer membutuhkan numpy.")
+        array = np.array(data, dtype=dtype)
+        if array.ndim == 1 and array.size == 0:
+            array = array.reshape(0, 0)
+        return cls(array)
+
+    @classmethod
+    def from_flat(cls, flat, rows, cols):
+        """Buat Matrix backend "array" dari array('q' / 'd') row-major (tanpa salinan)."""
+        if not isinstance(flat, array) or flat.typecode not in ("q", "d"):
+            raise TypeError("Buffer flat harus berupa array('q') atau array('d').")
+        if len(flat) != rows * cols:
+            raise ValueError("Panjang buffer flat harus sama dengan rows * cols.")
+        self = cls.__new__(cls)
+        self._buffer = None
+        self._flat = flat
+        self._data = None
+        self._lu_cache = None
+        self._fingerprint = None
+        self._flags = {}
+        self.rows, self.cols = rows, cols
+        self.backend = "array"
+        return self
+
+    @classmethod
+    def compact(cls, data):
+        """
+        Buat Matrix backend "array" dari list of lists / Matrix / ndarray:
+        array('q') jika semua nilai int (dan muat di int64), selain itu array('d').
+        """
+        if isinstance(data, Matrix):
+            return data if data.backend == "array" else cls.from_flat(data.to_flat(), data.rows, data.cols)
+        if np is not None and isinstance(data, np.ndarray):
+            return cls(data).to_compact()
+        rows = len(data)
+        cols = len(data[0]) if rows else 0
+        if not all(len(row) == cols for row in data):
             raise ValueError("Semua baris harus memiliki jumlah kolom yang sama.")
+        return cls.from_flat(flat_array(lambda: (v for row in data for v in row)), rows, cols)
+
+    def to_compact(self):
+        """Matrix ini dalam backend "array" (self jika sudah)."""
+        return Matrix.compact(self)
+
+    @property
+    def data(self):
+        """
+        List of lists isi matriks.
+        Pada backend numpy / array, list dibentuk sekali dari buffer lalu disimpan
+        sebagai salinan hanya-baca (TypeError saat diubah) agar tidak berbeda
+        diam-diam dengan buffer; list(row) / copy menghasilkan list biasa.
+        """
+        if self._data is None:
+            if self._flat is not None:
+                rows = (self.row(i).tolist() for i in range(self.rows))
+            else:
+                rows = self._buffer.tolist()
+            self._data = _ReadOnlyList(map(_ReadOnlyList, rows))
+        return self._data
+
+    @data.setter
+    def data(self, rows):
+        """
+        Ganti isi matriks dengan list of lists (backend menjadi "list"). Cache LU,
+        flag struktur dan sidik jari result cache dikosongkan; setelah mengubah
+        .data backend list di tempat, assign ulang (m.data = m.data) agar cache
+        tidak basi.
+        """
+        self._set_rows(rows)
+
+    def row(self, i):
+        """Baris ke-i: memoryview (backend array), view ndarray (numpy) atau list (list)."""
+        if self._flat is not None:
+            return memoryview(self._flat)[i * self.cols:(i + 1) * self.cols]
+        if self._data is not None:
+            return self._data[i]
+        return self._buffer[i]
+
+    def get_value(self, row, col):
+        """Elemen (row, col) tanpa membentuk .data."""
+        if self._flat is not None:
+            return self._flat[row * self.cols + col]
+        if self._data is not None:
+            return self._data[row][col]
+        return self._buffer[row, col].item()
+
+    def iter_rows(self):
+        """Iterasi baris sebagai list tanpa membentuk seluruh .data (buffer dibaca per baris)."""
+        if self._data is not None:
+            yield from self._data
+            return
+        if self._flat is not None:
+            for i in range(self.rows):
+                yield self.row(i).tolist()
+            return
+        for row in self._buffer:
+            yield row.tolist()
+
+    def to_array(self):
+        """Kembalikan isi matriks sebagai numpy.ndarray (tanpa salinan pada backend numpy / array)."""
+        if self._buffer is not None:
+            return self._buffer
+        if np is None:
+            raise ImportError("to_array membutuhkan numpy.")
+        if self._flat is not None:
+            dtype = np.int64 if self._flat.typecode == "q" else np.float64
+            return np.frombuffer(self._flat, dtype=dtype).reshape(self.rows, self.cols)
+        return np.array(self._data).reshape(self.rows, self.cols)
+
+    def to_flat(self):
+        """Isi matriks sebagai array('q' / 'd') row-major (tanpa salinan pada backend array)."""
+        if self._flat is not None:
+            return self._flat
+        if self._buffer is not None:
+            if self._buffer.dtype.kind in "iub":
+                return array("q", self._buffer.astype(np.int64, copy=False).tobytes())
+            return array("d", self._buffer.astype(np.float64, copy=False).tobytes())
+        return flat_array(lambda: (v for row in self._data for v in row))
+
+    # ------------------------------------------------------------
+    # Flag struktur (di-cache)
+    # ------------------------------------------------------------
+    def _structure(self, name):
+        if name not in self._flags:
+            self._flags.update(self._scan_structure())
+        return self._flags[name]
+
+    def _scan_structure(self):
+        """Hitung semua flag struktur dalam satu scan (vektor numpy bila ber-buffer)."""
+        if not self.is_square():
+            return {"symmetric": False, "upper": False, "lower": False, "identity": False}
+        if self._buffer is not None or (self._flat is not None and np is not None):
+            a = self.to_array()
+            upper = not np.any(np.tril(a, -1))
+            lower = not np.any(np.triu(a, 1))
+            symmetric = (upper and lower) or bool(np.array_equal(a, a.T))
+            unit_diag = bool(np.all(np.diagonal(a) == 1))
+        else:
+            rows = self._data if self._data is not None else [self.row(i) for i in range(self.rows)]
+            scanned = scan_structure(rows)
+            symmetric, upper, lower = scanned["symmetric"], scanned["upper"], scanned["lower"]
+            unit_diag = scanned["unit_diag"]
+        return {
+            "symmetric": symmetric,
+            "upper": upper,
+            "lower": lower,
+            "identity": upper and lower and unit_diag,
+        }
+
+    @property
+    def flags(self):
+        """Salinan flag struktur yang sudah diketahui (tanpa memicu scan)."""
+        return dict(self._flags)
 
     def is_square(self):
-        """Periksa apakah matriks persegi."""
-        return is_square(self.data)
+        """Periksa apakah matriks persegi (dari bentuk, O(1))."""
+        return self.rows > 0 and self.rows == self.cols
 
     def is_symmetric(self):
         """Periksa apakah matriks simetris."""
-        return is_symmetric(self.data)
+        return self._structure("symmetric")
 
     def is_identity(self):
         """Periksa apakah matriks identitas."""
-        return is_identity(self.data)
+        return self._structure("identity")
+
+    def is_diagonal(self):
+        """Periksa apakah matriks diagonal."""
+        return self._structure("upper") and self._structure("lower")
+
+    def is_triangular(self, kind=None):
+        """Periksa apakah matriks segitiga. kind: None (atas atau bawah) | "upper" | "lower"."""
+        if kind is None:
+            return self._structure("upper") or self._structure("lower")
+        if kind not in ("upper", "lower"):
+            raise ValueError(f"Jenis segitiga tidak dikenal: {kind}")
+        return self._structure(kind)
 
     def __repr__(self):
         return f"Matrix(rows={self.rows}, cols={self.cols})"
 
     def __str__(self):
-        return "\n".join(" ".join(map(str, row)) for row in self.data)
\ No newline at end of file
+        return "\n".join(" ".join(map(str, row)) for row in self.data)
+
+
+def uses_buffer(*matrices):
+    """True jika semua operand memakai backend buffer numpy."""
+    return all(getattr(m, "backend", None) == "numpy" for m in matrices)
+
+
+def uses_flat(*matrices):
+    """True jika semua operand memakai backend array (buffer flat pure-Python)."""
+    return all(getattr(m, "backend", None) == "array" for m in matrices)
+
+
+def flat_array(make_values, typecode=None):
+    """
+    Bentuk array('q') / array('d') dari iterator nilai hasil make_values().
+    Tanpa typecode: 'q' jika semua nilai int. Nilai int di luar jangkauan int64
+    (OverflowError) diulang sebagai array('d'); karena itu nilai diminta lewat
+    fungsi agar iteratornya bisa dibuat ulang.
+    """
+    if typecode is None:
+        typecode = "q" if all(type(v) is int for v in make_values()) else "d"
+    if typecode == "q":
+        try:
+            return array("q", make_values())
+        except OverflowError:
+            pass
+    return array("d", make_values())
+
+
+def known_flags(matrix):
+    """Flag struktur yang sudah diketahui pada operand (dict kosong untuk selain Matrix)."""
+    return dict(getattr(matrix, "_flags", None) or {})
+
+
+def carry_flags(result, **flags):
+    """
+    Catat flag struktur hasil operasi yang bisa diturunkan dari operand
+    (nilai None = tidak diketahui, dilewati). Hasil selain Matrix diabaikan.
+    """
+    if isinstance(result, Matrix):
+        result._flags.update({k: v for k, v in flags.items() if v is not None})
+    return result
+
+
+def elementwise_flags(matrix1, matrix2):
+    """
+    Flag hasil A ± B: simetris / segitiga atas / segitiga bawah tetap berlaku
+    jika berlaku pada kedua operand (selain itu tidak diketahui).
+    """
+    f1, f2 = known_flags(matrix1), known_flags(matrix2)
+    return {k: True for k in ("symmetric", "upper", "lower") if f1.get(k) and f2.get(k)}
@@ -0,0 +1,166 @@
+# chain.py
+"""
+Perkalian rantai matriks A0 · A1 · ... · An-1 dengan urutan termurah.
+
+Urutan kurung dipilih dengan dynamic programming matrix-chain klasik
+(O(n^3) pada jumlah operand) berdasarkan bentuk operand. Biaya memakai
+perkiraan jumlah perkalian skalar yang memperhitungkan kepadatan operand
+sparse:
+
+    biaya(A[m×k] · B[k×n]) ≈ m · k · n · dA · dB
+
+dengan d = nnz / (baris · kolom) untuk SparseMatrix dan 1 untuk dense.
+Hasil sparse × sparse tetap sparse dengan kepadatan perkiraan
+1 - (1 - dA·dB)^k; hasil yang melibatkan operand dense menjadi dense.
+
+plan_chain() mengembalikan ChainPlan yang bisa diperiksa (urutan, langkah,
+perkiraan flop, dibanding urutan kiri-ke-kanan) tanpa menghitung apa pun.
+"""
+
+from collections import namedtuple
+
+from . import sparse_kernels
+from .multiplier import multiply_matrices
+from utilities import profiler
+
+# Satu perkalian pada rencana: label operand kiri/kanan, bentuk hasil, perkiraan flop
+ChainStep = namedtuple("ChainStep", ["left", "right", "shape", "flops"])
+
+
+def _density(matrix):
+    if sparse_kernels.is_sparse(matrix):
+        size = matrix.rows * matrix.cols
+        return matrix.nnz / size if size else 0.0
+    return 1.0
+
+
+def _product(shape1, density1, shape2, density2, sparse_result):
+    """Perkiraan (flop, kepadatan hasil) untuk satu perkalian."""
+    m, k = shape1
+    n = shape2[1]
+    flops = m * k * n * density1 * density2
+    if sparse_result:
+        density = 1.0 - (1.0 - density1 * density2) ** k
+    else:
+        density = 1.0
+    return flops, density
+
+
+class ChainPlan:
+    """
+    Rencana eksekusi rantai perkalian.
+    order      : kurung bersarang berisi indeks operand, mis. ((0, 1), 2)
+    flops      : perkiraan flop urutan terpilih
+    naive_flops: perkiraan flop urutan kiri-ke-kanan
+    steps      : daftar ChainStep sesuai urutan eksekusi
+    """
+    def __init__(self, shapes, densities, sparse, split, flops, naive_flops):
+        self.shapes = shapes
+        self.densities = densities
+        self.order = self._build_order(split, 0, len(shapes) - 1)
+        self.flops = flops
+        self.naive_flops = naive_flops
+        self.steps = []
+        self._collect_steps(self.order, sparse)
+
+    @classmethod
+    def _build_order(cls, split, i, j):
+        if i == j:
+            return i
+        k = split[i][j]
+        return (cls._build_order(split, i, k), cls._build_order(split, k + 1, j))
+
+    def _collect_steps(self, node, sparse):
+        """Kembalikan (label, bentuk, kepadatan, sparse) subrantai sambil mencatat langkah."""
+        if isinstance(node, int):
+            return f"A{node}", self.shapes[node], self.densities[node], sparse[node]
+        left = self._collect_steps(node[0], sparse)
+        right = self._collect_steps(node[1], sparse)
+        is_sparse = left[3] and right[3]
+        flops, density = _product(left[1], left[2], right[1], right[2], is_sparse)
+        shape = (left[1][0], right[1][1])
+        self.steps.append(ChainStep(left[0], right[0], shape, flops))
+        return f"({left[0]}·{right[0]})", shape, density, is_sparse
+
+    @property
+    def expression(self):
+        """Urutan kurung sebagai teks, mis. '((A0·A1)·A2)'."""
+        def render(node):
+            if isinstance(node, int):
+                return f"A{node}"
+            return f"({render(node[0])}·{render(node[1])})"
+        return render(self.order)
+
+    def __repr__(self):
+        return (f"ChainPlan({self.expression}, flops={self.flops:.0f}, "
+                f"naive_flops={self.naive_flops:.0f})")
+
+
+def plan_chain(*matrices):
+    """Pilih urutan kurung termurah untuk A0 · A1 · ... tanpa melakukan perkalian."""
+    n = len(matrices)
+    if n == 0:
+        raise ValueError("Rantai perkalian membutuhkan minimal satu matriks.")
+    for idx in range(n - 1):
+        if matrices[idx].cols != matrices[idx + 1].rows:
+            raise ValueError(
+                f"Jumlah kolom matriks ke-{idx} harus sama dengan jumlah baris matriks ke-{idx + 1}."
+            )
+
+    shapes = [(m.rows, m.cols) for m in matrices]
+    densities = [_density(m) for m in matrices]
+    sparse = [sparse_kernels.is_sparse(m) for m in matrices]
+
+    # cost[i][j] / density[i][j] / is_sp[i][j]: subrantai Ai..Aj; split[i][j]: posisi kurung terbaik
+    cost = [[0.0] * n for _ in range(n)]
+    density = [[0.0] * n for _ in range(n)]
+    is_sp = [[False] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+    for i in range(n):
+        density[i][i] = densities[i]
+        is_sp[i][i] = sparse[i]
+
+    for length in range(2, n + 1):
+        for i in range(n - length + 1):
+            j = i + length - 1
+            best = None
+            for k in range(i, j):
+                result_sparse = is_sp[i][k] and is_sp[k + 1][j]
+                flops, d = _product((shapes[i][0], shapes[k][1]), density[i][k],
+                                    (shapes[k + 1][0], shapes[j][1]), density[k + 1][j],
+                                    result_sparse)
+                total = cost[i][k] + cost[k + 1][j] + flops
+                if best is None or total < best[0]:
+                    best = (total, k, d, result_sparse)
+            cost[i][j], split[i][j], density[i][j], is_sp[i][j] = best
+
+    # Pembanding: urutan kiri-ke-kanan seperti kode ditulis
+    naive = 0.0
+    shape, d, sp = shapes[0], densities[0], sparse[0]
+    for idx in range(1, n):
+        result_sparse = sp and sparse[idx]
+        flops, d = _product(shape, d, shapes[idx], densities[idx], result_sparse)
+        naive += flops
+        shape, sp = (shape[0], shapes[idx][1]), result_sparse
+
+    return ChainPlan(shapes, densities, sparse, split, cost[0][n - 1], naive)
+
+
+@profiler.timed()
+def multiply_chain(*matrices, plan=None, strategy=None, workers=None):
+    """
+    Hitung A0 · A1 · ... dengan urutan kurung termurah (lihat plan_chain).
+    plan             : ChainPlan yang sudah dihitung (opsional)
+    strategy/workers : diteruskan ke multiply_matrices untuk setiap langkah
+    """
+    if plan is None:
+        plan = plan_chain(*matrices)
+    elif len(plan.shapes) != len(matrices):
+        raise ValueError("Rencana tidak sesuai dengan jumlah matriks.")
+
+    def run(node):
+        if isinstance(node, int):
+            return matrices[node]
+        return multiply_matrices(run(node[0]), run(node[1]), strategy=strategy, workers=workers)
+
+    return run(plan.order)
@@ -1,16 +1,38 @@
 # determinant.py
+import math
+
 from validators.is_square import is_square
 from matrix import Matrix
+from .lu import lu_decompose
+from . import result_cache
+from utilities import profiler
+
+
+def _diagonal(matrix):
+    if matrix.backend == "numpy":
+        return matrix.to_array().diagonal().tolist()
+    return [matrix.get_value(i, i) for i in range(matrix.rows)]
 
+
+@profiler.timed()
+@result_cache.cached("determinant")
 def find_determinant(matrix):
     """
-    Menghitung determinan dari matriks persegi 2x2 atau 3x3.
+    Menghitung determinan dari matriks persegi n×n.
+    Matriks segitiga/diagonal (flag struktur Matrix): hasil kali diagonal.
+    2x2 dan 3x3 memakai rumus langsung (hasil eksak untuk bilangan bulat);
+    ukuran lain memakai dekomposisi LU yang di-cache pada matrix (faktor dari
+    inverse_matrix / solve sebelumnya dipakai ulang).
     matrix: Matrix (objek)
     """
-    data = matrix.data if hasattr(matrix, "data") else matrix
-    if not is_square(matrix.data):
+    if not is_square(matrix):
         raise ValueError("Matrix harus persegi untuk menghitung determinan.")
 
+    # Urutan jalur tetap (tidak bergantung pada cache LU) agar tipe dan nilai hasil
+    # sama untuk setiap pemanggilan; lu_decompose memakai ulang faktor yang sudah ada.
+    if isinstance(matrix, Matrix) and matrix.is_triangular():
+        return math.prod(_diagonal(matrix))
+
     data = matrix.data
     n = len(data)
 
@@ -24,4 +46,4 @@ def find_determinant(matrix):
         )
         return det
     else:
-        raise NotImplementedError("Determinant hanya didukung untuk 2x2 dan 3x3.")
+        return lu_decompose(matrix).determinant()
@@ -0,0 +1,72 @@
+# flat_kernels.py
+"""
+Kernel pure-Python untuk Matrix backend "array" (satu array('q') / array('d')
+row-major). Loop berjalan langsung di atas buffer flat tanpa membentuk list
+of lists:
+ - penjumlahan / pengurangan: map() elemen demi elemen atas kedua buffer
+ - transpose: slice berlangkah a[j::cols] per kolom (disalin di level C)
+ - perkalian: dot product memoryview baris A × baris B^T, diblok seperti
+   _multiply_python
+Hasil tetap berupa Matrix backend array; int64 yang meluap menjadi array('d').
+"""
+
+from array import array
+from operator import add, mul, sub
+
+from matrix import Matrix, flat_array
+
+
+def _typecode(*matrices):
+    return "q" if all(m.to_flat().typecode == "q" for m in matrices) else "d"
+
+
+def add_flat(matrix1, matrix2, sign=1):
+    """A + sign*B elemen demi elemen atas buffer flat."""
+    a, b = matrix1.to_flat(), matrix2.to_flat()
+    op = add if sign == 1 else sub
+    flat = flat_array(lambda: map(op, a, b), _typecode(matrix1, matrix2))
+    return Matrix.from_flat(flat, matrix1.rows, matrix1.cols)
+
+
+def transpose_flat(matrix):
+    """Transpose: kolom j buffer row-major adalah slice berlangkah a[j::cols]."""
+    a = matrix.to_flat()
+    cols = matrix.cols
+    out = array(a.typecode)
+    for j in range(cols):
+        out.extend(a[j::cols])
+    return Matrix.from_flat(out, cols, matrix.rows)
+
+
+def _multiply_into(out, a_rows, b_cols, n, block_size):
+    for jj in range(0, len(b_cols), block_size):
+        col_block = b_cols[jj:jj + block_size]
+        for ii in range(0, len(a_rows), block_size):
+            for i in range(ii, min(ii + block_size, len(a_rows))):
+                a_row = a_rows[i]
+                base = i * n
+                for j, b_col in enumerate(col_block, jj):
+                    out[base + j] = sum(map(mul, a_row, b_col))
+    return out
+
+
+def multiply_flat(matrix1, matrix2, block_size):
+    """
+    A · B: B ditranspose sekali (transpose_flat) sehingga setiap elemen hasil
+    adalah dot product dua memoryview kontigu atas buffer flat.
+    """
+    m, k, n = matrix1.rows, matrix1.cols, matrix2.cols
+    a = memoryview(matrix1.to_flat())
+    bt = memoryview(transpose_flat(matrix2).to_flat())
+    a_rows = [a[i * k:(i + 1) * k] for i in range(m)]
+    b_cols = [bt[j * k:(j + 1) * k] for j in range(n)]
+
+    typecode = _typecode(matrix1, matrix2)
+    if typecode == "q":
+        try:
+            out = _multiply_into(array("q", bytes(8 * m * n)), a_rows, b_cols, n, block_size)
+            return Matrix.from_flat(out, m, n)
+        except OverflowError:
+            pass
+    out = _multiply_into(array("d", bytes(8 * m * n)), a_rows, b_cols, n, block_size)
+    return Matrix.from_flat(out, m, n)
@@ -1,63 +1,54 @@
 # inverse.py
-from matrix import Matrix
-# Pastikan impor relatif yang benar untuk find_determinant (dari file .determinant)
-from .determinant import find_determinant 
+from matrix import Matrix, carry_flags, known_flags, uses_flat, np
+from .lu import lu_decompose
+from .determinant import _diagonal
+from . import result_cache
 from validators.is_square import is_square
+from utilities import profiler
 
-def inverse_matrix(matrix):
-    """
-    Menghitung invers matriks 2x2 atau 3x3.
-    """
-    data = matrix.data
-    if not is_square(data):
-        raise ValueError("Matrix harus persegi untuk menghitung invers.")
 
-    n = len(data)
-    # PENTING: find_determinant membutuhkan objek Matrix. Jika Anda menggunakan list (data)
-    # untuk mencari minor 3x3, Anda harus mengubah find_determinant agar menerima list.
-    # Karena sintaks Anda menunjukkan find_determinant menerima Matrix, kita buat Matrix baru.
-    
-    # 1. Hitung Determinan dari objek Matrix
-    det = find_determinant(matrix) 
-    
-    if det == 0:
+def _inverse_diagonal(matrix):
+    """Invers matriks diagonal: kebalikan setiap elemen diagonal (O(n))."""
+    diagonal = _diagonal(matrix)
+    if any(d == 0 for d in diagonal):
         raise ValueError("Matriks singular, tidak memiliki invers.")
+    n = matrix.rows
+    if matrix.backend == "numpy":
+        return Matrix(np.diag([1.0 / d for d in diagonal]))
+    result = [[0.0] * n for _ in range(n)]
+    for i, d in enumerate(diagonal):
+        result[i][i] = 1.0 / d
+    return Matrix(result)
 
-    # Kasus 2x2
-    if n == 2:
-        a, b = data[0]
-        c, d = data[1]
-        inv_data = [[d/det, -b/det], [-c/det, a/det]]
-        return Matrix(inv_data)
 
-    # Kasus 3x3 (pakai kofaktor)
-    elif n == 3:
-        cofactor = [[0]*3 for _ in range(3)]
-        for i in range(3):
-            for j in range(3):
-                # Ekstrak minor sebagai list of lists
-                minor_list = [
-                    [data[x][y] for y in range(3) if y != j]
-                    for x in range(3) if x != i
-                ]
-                sign = (-1) ** (i + j)
-                
-                # UBAH: Untuk minor (2x2) kita kirim List of List ke find_determinant, 
-                # ASUMSI find_determinant dapat memproses list untuk 2x2 (seperti di kode Anda sebelumnya)
-                # JIKA find_determinant HANYA menerima Matrix, ini adalah BUG!
-                
-                # SOLUSI PALING AMAN: Pastikan find_determinant di determinant.py menerima list
-                # atau buat objek Matrix dari minor_list:
-                minor_det = find_determinant(Matrix(minor_list)) 
-                
-                cofactor[i][j] = sign * minor_det
-                
-        # transpose kofaktor
-        cofactor_T = [[cofactor[j][i] for j in range(3)] for i in range(3)]
-        inv_data = [[cofactor_T[i][j] / det for j in range(3)] for i in range(3)]
-        return Matrix(inv_data)
+@profiler.timed()
+@result_cache.cached("inverse")
+def inverse_matrix(matrix):
+    """
+    Menghitung invers matriks persegi n×n lewat dekomposisi LU (O(n^3)).
+    Matriks diagonal/identitas (flag struktur Matrix) dibalik langsung.
+    Faktor LU di-cache pada matrix sehingga find_determinant / solve
+    berikutnya pada matriks yang sama tidak memfaktorkan ulang.
+    """
+    if not is_square(matrix):
+        raise ValueError("Matrix harus persegi untuk menghitung invers.")
 
+    if isinstance(matrix, Matrix) and matrix.is_diagonal():
+        result = _inverse_diagonal(matrix)
     else:
-        # Perlu dikoreksi: find_determinant di atas hanya dipanggil dengan Matrix.
-        # Jika find_determinant Anda hanya menerima Matrix, pastikan minor_list diubah ke Matrix.
-        raise NotImplementedError("Inverse hanya didukung untuk matriks 2x2 dan 3x3.")
+        factors = lu_decompose(matrix)
+        if factors.singular:
+            raise ValueError("Matriks singular, tidak memiliki invers.")
+        result = Matrix(factors.inverse())
+    if uses_flat(matrix):
+        result = result.to_compact()
+
+    # Invers mempertahankan simetri, bentuk segitiga dan identitas
+    flags = known_flags(matrix)
+    return carry_flags(
+        result,
+        symmetric=flags.get("symmetric"),
+        upper=flags.get("upper"),
+        lower=flags.get("lower"),
+        identity=flags.get("identity"),
+    )
@@ -0,0 +1,302 @@
+# lazy.py
+"""
+Mode lazy untuk operasi element-wise (add / subtract / transpose / skala).
+
+Operasi dengan lazy=True (atau yang salah satu operandnya sudah LazyMatrix)
+tidak menghitung apa pun, melainkan mengembalikan LazyMatrix. Karena semua
+operasi tersebut linear, ekspresi disimpan dalam bentuk kanonik
+
+    c1·op(L1) + c2·op(L2) + ...      op = identitas | transpose
+
+dengan Li matriks asli (daun). Saat hasil dipaksa (evaluate(), .data,
+to_array(), ...) seluruh rantai dihitung dalam satu pass dengan satu alokasi
+output, tanpa Matrix perantara. Daun yang sama digabung (A + A → 2·A) dan
+transpose hanya mengubah cara indeks daun dibaca.
+"""
+
+from itertools import repeat
+from operator import add, mul, sub
+
+from matrix import Matrix, flat_array, uses_buffer, uses_flat, np
+from sparsematrix import SparseMatrix, _pack_values
+from validators.is_identity import is_identity
+from validators.is_symmetric import is_symmetric
+from . import flat_kernels, sparse_kernels
+
+
+def is_lazy(matrix):
+    return isinstance(matrix, LazyMatrix)
+
+
+def as_lazy(matrix):
+    """Bungkus Matrix / SparseMatrix sebagai LazyMatrix satu suku (tanpa salinan)."""
+    if is_lazy(matrix):
+        return matrix
+    return LazyMatrix(((1, matrix, False),), matrix.rows, matrix.cols)
+
+
+def scale(matrix, factor):
+    """factor · matrix sebagai ekspresi lazy."""
+    return as_lazy(matrix) * factor
+
+
+class LazyMatrix:
+    """
+    Ekspresi element-wise yang belum dievaluasi.
+    terms: tuple (koefisien, daun, ditranspose) — lihat docstring modul.
+    Hasil evaluasi disimpan sehingga ekspresi hanya dihitung sekali.
+    """
+    def __init__(self, terms, rows, cols):
+        self.terms = tuple(terms)
+        self.rows = rows
+        self.cols = cols
+        self._value = None
+
+    # ------------------------------------------------------------
+    # Pembentukan ekspresi
+    # ------------------------------------------------------------
+    def _combine(self, other, sign, operation):
+        other = as_lazy(other)
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError(f"Matriks harus memiliki dimensi yang sama untuk {operation}.")
+        merged = {}
+        for coef, leaf, transposed in self.terms + tuple((sign * c, l, t) for c, l, t in other.terms):
+            key = (id(leaf), transposed)
+            if key in merged:
+                merged[key] = (merged[key][0] + coef, leaf, transposed)
+            else:
+                merged[key] = (coef, leaf, transposed)
+        terms = [term for term in merged.values() if term[0] != 0]
+        if not terms:
+            # Semua suku saling menghapus: pertahankan satu suku nol agar bentuk tetap diketahui
+            coef, leaf, transposed = self.terms[0]
+            terms = [(0, leaf, transposed)]
+        return LazyMatrix(terms, self.rows, self.cols)
+
+    def __add__(self, other):
+        return self._combine(other, 1, "penjumlahan")
+
+    def __sub__(self, other):
+        return self._combine(other, -1, "pengurangan")
+
+    def __mul__(self, factor):
+        if not isinstance(factor, (int, float)):
+            return NotImplemented
+        return LazyMatrix([(c * factor, l, t) for c, l, t in self.terms], self.rows, self.cols)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return self * -1
+
+    def transpose(self):
+        return LazyMatrix([(c, l, not t) for c, l, t in self.terms], self.cols, self.rows)
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    # ------------------------------------------------------------
+    # Evaluasi
+    # ------------------------------------------------------------
+    def single_leaf(self):
+        """(daun, ditranspose) jika ekspresi hanya 1·op(L), selain itu None."""
+        if len(self.terms) == 1 and self.terms[0][0] == 1:
+            return self.terms[0][1], self.terms[0][2]
+        return None
+
+    def evaluate(self):
+        """Hitung ekspresi (sekali) dan kembalikan Matrix / SparseMatrix."""
+        if self._value is None:
+            self._value = _evaluate(self.terms, self.rows, self.cols)
+        return self._value
+
+    @property
+    def backend(self):
+        leaves = [leaf for _, leaf, _ in self.terms]
+        if uses_buffer(*leaves):
+            return "numpy"
+        return "array" if uses_flat(*leaves) else "list"
+
+    @property
+    def data(self):
+        return self.evaluate().data
+
+    def get_value(self, row, col):
+        """Elemen (row, col) langsung dari suku-suku ekspresi (tanpa evaluasi penuh)."""
+        if self._value is not None:
+            return self._value.get_value(row, col)
+        total = 0
+        for coef, leaf, transposed in self.terms:
+            value = leaf.get_value(col, row) if transposed else leaf.get_value(row, col)
+            total += coef * value
+        return total
+
+    def iter_rows(self):
+        value = self.evaluate()
+        if hasattr(value, "iter_rows"):
+            return value.iter_rows()
+        return iter(value.data)
+
+    def to_array(self):
+        """
+        numpy.ndarray hasil ekspresi. Untuk transpose murni dari daun ber-buffer
+        dikembalikan view .T tanpa salinan (dipakai perkalian matriks).
+        """
+        single = self.single_leaf()
+        if single is not None and uses_buffer(single[0]):
+            leaf, transposed = single
+            return leaf.to_array().T if transposed else leaf.to_array()
+        value = self.evaluate()
+        if sparse_kernels.is_sparse(value):
+            return np.array(value.data).reshape(self.rows, self.cols)
+        return value.to_array()
+
+    def is_square(self):
+        return self.rows > 0 and self.rows == self.cols
+
+    def is_symmetric(self):
+        return is_symmetric(self.evaluate())
+
+    def is_identity(self):
+        return is_identity(self.evaluate())
+
+    def __repr__(self):
+        return f"LazyMatrix(rows={self.rows}, cols={self.cols}, terms={len(self.terms)})"
+
+    def __str__(self):
+        return str(self.evaluate())
+
+
+def operand(matrix):
+    """
+    Siapkan operand untuk operasi non-element-wise (mis. perkalian):
+     - bukan LazyMatrix → apa adanya
+     - 1·op(L) dengan L sparse → L / L.transpose() (tanpa salinan)
+     - 1·op(L) dengan L ber-buffer → tetap lazy (to_array() berupa view)
+     - selain itu → dievaluasi
+    """
+    if not is_lazy(matrix):
+        return matrix
+    single = matrix.single_leaf()
+    if single is not None:
+        leaf, transposed = single
+        if sparse_kernels.is_sparse(leaf):
+            return leaf.transpose() if transposed else leaf
+        if not transposed:
+            return leaf
+        if uses_buffer(leaf):
+            return matrix
+    return matrix.evaluate()
+
+
+# ------------------------------------------------------------
+# Kernel evaluasi terfusi
+# ------------------------------------------------------------
+def _evaluate(terms, rows, cols):
+    sparse_terms = [t for t in terms if sparse_kernels.is_sparse(t[1])]
+    dense_terms = [t for t in terms if not sparse_kernels.is_sparse(t[1])]
+
+    sparse = _evaluate_sparse(sparse_terms) if sparse_terms else None
+    if not dense_terms:
+        return sparse
+    leaves = [leaf for _, leaf, _ in dense_terms]
+    if uses_buffer(*leaves):
+        dense = _evaluate_buffer(dense_terms, rows, cols)
+    elif uses_flat(*leaves):
+        dense = _evaluate_flat(dense_terms, rows, cols)
+    else:
+        dense = _evaluate_python(dense_terms, rows)
+    if sparse is None:
+        return dense
+    return sparse_kernels.add_sparse_dense(sparse, dense)
+
+
+def _evaluate_buffer(terms, rows, cols):
+    """Satu buffer output; suku berkoefisien ±1 ditambahkan in-place tanpa array sementara."""
+    views = [(c, leaf.to_array().T if t else leaf.to_array()) for c, leaf, t in terms]
+    dtype = np.result_type(*[v for _, v in views], *[c for c, _ in views])
+    out = np.empty((rows, cols), dtype=dtype)
+    scratch = None
+    for k, (c, view) in enumerate(views):
+        if k == 0:
+            if c == 1:
+                np.copyto(out, view)
+            else:
+                np.multiply(view, c, out=out)
+        elif c == 1:
+            np.add(out, view, out=out)
+        elif c == -1:
+            np.subtract(out, view, out=out)
+        else:
+            if scratch is None:
+                scratch = np.empty_like(out)
+            np.multiply(view, c, out=scratch)
+            np.add(out, scratch, out=out)
+    return Matrix(out)
+
+
+def _evaluate_flat(terms, rows, cols):
+    """Satu pass elemen demi elemen atas buffer flat; daun yang ditranspose disalin sekali."""
+    coefs = [c for c, _, _ in terms]
+    flats = [flat_kernels.transpose_flat(leaf).to_flat() if t else leaf.to_flat()
+             for _, leaf, t in terms]
+    exact = all(f.typecode == "q" for f in flats) and all(type(c) is int for c in coefs)
+
+    def values():
+        # Rantai map() di level C: tiap suku ditambahkan tanpa loop Python per elemen
+        it = flats[0] if coefs[0] == 1 else map(mul, repeat(coefs[0]), flats[0])
+        for c, flat in zip(coefs[1:], flats[1:]):
+            if c == 1:
+                it = map(add, it, flat)
+            elif c == -1:
+                it = map(sub, it, flat)
+            else:
+                it = map(add, it, map(mul, repeat(c), flat))
+        return it
+
+    return Matrix.from_flat(flat_array(values, "q" if exact else "d"), rows, cols)
+
+
+def _evaluate_python(terms, rows):
+    """Satu pass baris demi baris; kolom daun yang ditranspose dibaca langsung tanpa membentuk transpose."""
+    coefs = [c for c, _, _ in terms]
+    getters = []
+    for _, leaf, transposed in terms:
+        data = leaf.data
+        if transposed:
+            getters.append(lambda i, data=data: [row[i] for row in data])
+        else:
+            getters.append(data.__getitem__)
+
+    result = []
+    if len(terms) == 1:
+        c = coefs[0]
+        get = getters[0]
+        for i in range(rows):
+            result.append([c * x for x in get(i)] if c != 1 else list(get(i)))
+        return Matrix(result)
+
+    for i in range(rows):
+        vectors = [get(i) for get in getters]
+        result.append([sum(map(mul, coefs, values)) for values in zip(*vectors)])
+    return Matrix(result)
+
+
+def _scaled_sparse(coef, leaf, transposed):
+    matrix = leaf.transpose() if transposed else leaf
+    if coef == 1:
+        return matrix
+    return SparseMatrix.from_compressed(
+        matrix.indptr, matrix.indices, _pack_values([coef * v for v in matrix.values]),
+        shape=matrix.shape, format=matrix.format,
+    )
+
+
+def _evaluate_sparse(terms):
+    result = _scaled_sparse(*terms[0])
+    for term in terms[1:]:
+        result = sparse_kernels.add_sparse(result, _scaled_sparse(*term))
+    if len(terms) == 1:
+        result = result.tocsr()
+    return result
@@ -5,8 +5,11 @@ from matrix import Matrix
 # Import operasi matriks yang sudah Anda buat
 from .transpose import transpose_matrix
 from .multiplier import multiply_matrices
+from .chain import multiply_chain
 from .inverse import inverse_matrix
+from utilities import profiler
 
+@profiler.timed()
 def linear_regression(x_values, y_values):
     """
     Menghitung regresi linear sederhana (y = a + b*x).
@@ -41,6 +44,7 @@ def predict(x_new, a, b):
     return a + b * np.array(x_new)
 
 
+@profiler.timed()
 def multiple_linear_regression(X_matrix: Matrix, Y_vector: Matrix):
     """
     Menghitung koefisien Multiple Linear Regression menggunakan Persamaan Normal:
@@ -52,25 +56,20 @@ def multiple_linear_regression(X_matrix: Matrix, Y_vector: Matrix):
     if X_matrix.rows != Y_vector.rows or Y_vector.cols != 1:
         raise ValueError("Dimensi matriks X dan Y salah untuk MLR.")
         
-    # 1. X Transpose (X^T)
-    X_T = transpose_matrix(X_matrix)
+    # 1. X Transpose (X^T), lazy: tidak disalin, perkalian membaca X secara transpose
+    X_T = transpose_matrix(X_matrix, lazy=True)
 
     # 2. X^T * X
     XT_X = multiply_matrices(X_T, X_matrix)
 
-    # 3. (X^T * X)^-1
-    # Implementasi ini akan gagal jika matriks > 3x3 karena keterbatasan inverse_matrix.
+    # 3. (X^T * X)^-1 (dekomposisi LU, mendukung jumlah fitur berapa pun)
     try:
         XT_X_inv = inverse_matrix(XT_X)
-    except NotImplementedError:
-        return "Error: Inverse (X^T X)^-1 gagal. Hanya 2x2 dan 3x3 yang didukung pada inverse_matrix."
     except ValueError as e:
         return f"Error: {e}"
 
-    # 4. X^T * Y
-    XT_Y = multiply_matrices(X_T, Y_vector)
-
-    # 5. Beta = (X^T * X)^-1 * X^T * Y
-    Beta = multiply_matrices(XT_X_inv, XT_Y)
+    # 4. Beta = (X^T * X)^-1 * X^T * Y, urutan kurung dipilih multiply_chain
+    #    (untuk X tinggi: (X^T * X)^-1 * (X^T * Y), tanpa matriks k×n perantara)
+    Beta = multiply_chain(XT_X_inv, X_T, Y_vector)
     
     return Beta
@@ -0,0 +1,172 @@
+# lu.py
+"""
+Dekomposisi LU dengan partial pivoting (PA = LU) untuk matriks persegi n×n.
+Dipakai bersama oleh find_determinant, inverse_matrix dan solve.
+
+Faktor disimpan pada objek matriks (atribut _lu_cache) sehingga determinan
+lalu invers pada matriks yang sama hanya memfaktorkan sekali. Cache
+mengasumsikan isi matriks tidak diubah in-place setelah difaktorkan.
+"""
+
+from matrix import Matrix, uses_buffer, uses_flat, np
+from utilities import profiler
+
+
+class LUFactors:
+    """
+    Hasil faktorisasi: L (diagonal 1, di bawah diagonal) dan U (diagonal ke atas)
+    disimpan bersama dalam satu matriks `lu`; `perm[i]` adalah baris asal
+    untuk baris ke-i setelah pivoting.
+    """
+    def __init__(self, lu, perm, sign, singular):
+        self.lu = lu
+        self.perm = perm
+        self.sign = sign
+        self.singular = singular
+        self.n = len(perm)
+
+    def determinant(self):
+        if self.singular:
+            return 0.0
+        det = float(self.sign)
+        for i in range(self.n):
+            det *= float(self.lu[i][i])
+        return det
+
+    def _require_regular(self):
+        if self.singular:
+            raise ValueError("Matriks singular, sistem tidak memiliki solusi tunggal.")
+
+    def solve_columns(self, b):
+        """
+        Selesaikan A X = B untuk B berbentuk list of lists (n × m) atau ndarray.
+        Mengembalikan X dengan tipe yang sama dengan penyimpanan faktor.
+        """
+        self._require_regular()
+        n = self.n
+        if np is not None and isinstance(self.lu, np.ndarray):
+            x = np.array(b, dtype=float).reshape(n, -1)[self.perm]
+            for i in range(n):
+                x[i] -= self.lu[i, :i] @ x[:i]
+            for i in range(n - 1, -1, -1):
+                x[i] = (x[i] - self.lu[i, i + 1:] @ x[i + 1:]) / self.lu[i, i]
+            return x
+
+        lu = self.lu
+        x = [list(map(float, b[p])) for p in self.perm]
+        # Substitusi maju: L y = P b
+        for i in range(n):
+            row = lu[i]
+            xi = x[i]
+            for k in range(i):
+                f = row[k]
+                if f:
+                    xi = [u - f * v for u, v in zip(xi, x[k])]
+            x[i] = xi
+        # Substitusi mundur: U x = y
+        for i in range(n - 1, -1, -1):
+            row = lu[i]
+            xi = x[i]
+            for k in range(i + 1, n):
+                f = row[k]
+                if f:
+                    xi = [u - f * v for u, v in zip(xi, x[k])]
+            pivot = row[i]
+            x[i] = [v / pivot for v in xi]
+        return x
+
+    def inverse(self):
+        """Invers A = solusi A X = I."""
+        if np is not None and isinstance(self.lu, np.ndarray):
+            return self.solve_columns(np.eye(self.n))
+        identity = [[1.0 if i == j else 0.0 for j in range(self.n)] for i in range(self.n)]
+        return self.solve_columns(identity)
+
+
+def _factor_python(rows):
+    a = [list(map(float, row)) for row in rows]
+    n = len(a)
+    perm = list(range(n))
+    sign = 1
+    singular = False
+
+    for k in range(n):
+        p = max(range(k, n), key=lambda i: abs(a[i][k]))
+        if a[p][k] == 0:
+            singular = True
+            continue
+        if p != k:
+            a[k], a[p] = a[p], a[k]
+            perm[k], perm[p] = perm[p], perm[k]
+            sign = -sign
+        row_k = a[k]
+        pivot = row_k[k]
+        tail_k = row_k[k + 1:]
+        for i in range(k + 1, n):
+            row_i = a[i]
+            f = row_i[k] / pivot
+            row_i[k] = f
+            if f:
+                row_i[k + 1:] = [x - f * y for x, y in zip(row_i[k + 1:], tail_k)]
+    return LUFactors(a, perm, sign, singular)
+
+
+def _factor_buffer(array):
+    n = array.shape[0]
+    a = np.array(array, dtype=float)
+    perm = np.arange(n)
+    sign = 1
+    singular = False
+
+    for k in range(n):
+        p = k + int(np.argmax(np.abs(a[k:, k])))
+        if a[p, k] == 0:
+            singular = True
+            continue
+        if p != k:
+            a[[k, p]] = a[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+            sign = -sign
+        a[k + 1:, k] /= a[k, k]
+        a[k + 1:, k + 1:] -= np.outer(a[k + 1:, k], a[k, k + 1:])
+    return LUFactors(a, perm, sign, singular)
+
+
+@profiler.timed()
+def lu_decompose(matrix):
+    """
+    Faktorkan matriks persegi (Matrix) menjadi PA = LU dalam O(n^3).
+    Hasil disimpan pada matriks dan dipakai ulang pada pemanggilan berikutnya.
+    """
+    cached = getattr(matrix, "_lu_cache", None)
+    if cached is not None:
+        return cached
+    if matrix.rows == 0 or matrix.rows != matrix.cols:
+        raise ValueError("Matrix harus persegi untuk dekomposisi LU.")
+
+    n = matrix.rows
+    profiler.count("flops", 2 * n * n * n // 3)
+    if uses_buffer(matrix) or (uses_flat(matrix) and np is not None):
+        factors = _factor_buffer(matrix.to_array())
+    else:
+        factors = _factor_python(matrix.iter_rows())
+    matrix._lu_cache = factors
+    return factors
+
+
+def solve(A, b):
+    """
+    Selesaikan sistem linear A x = b memakai faktor LU dari A (di-cache).
+    b: Matrix (n × m) → hasil Matrix; list angka (vektor) → hasil list.
+    """
+    factors = lu_decompose(A)
+    if isinstance(b, list) and (not b or not isinstance(b[0], list)):
+        if len(b) != A.rows:
+            raise ValueError("Panjang vektor b harus sama dengan jumlah baris A.")
+        x = factors.solve_columns([[v] for v in b])
+        return [float(row[0]) for row in x]
+
+    if b.rows != A.rows:
+        raise ValueError("Jumlah baris b harus sama dengan jumlah baris A.")
+    rhs = b.to_array() if uses_buffer(b) else b.data
+    return Matrix(factors.solve_columns(rhs))
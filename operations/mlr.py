@@ -1,10 +1,288 @@
+"""
+Multiple Linear Regression berbasis statistik cukup (persamaan normal).
+
+Data tidak perlu dimuat sekaligus: faktor R dari QR [X | y] ((k+1)×(k+1),
+setara X^T X dan X^T y tetapi tanpa mengkuadratkan bilangan kondisi) dan
+jumlah baris diakumulasi per chunk, akumulator dari worker berbeda bisa
+digabung, lalu sistem segitiga k×k diselesaikan di akhir dengan cutoff
+seperti pinv. Memori O(k^2 + chunk), bukan O(n·k).
+"""
 import numpy as np
 
-def multiple_linear_regression(X, y):
-    # Konversi ke numpy
-    X = np.array(X, dtype=float)
-    y = np.array(y, dtype=float).reshape(-1, 1)
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import locale
+import warnings
+
+from utilities.csv_stream import DEFAULT_CHUNK_SIZE, iter_row_chunks, read_header
+from utilities import csv_parallel
+from utilities import profiler
+from . import result_cache
+
+
+class NormalEquations:
+    """
+    Akumulator statistik cukup regresi: faktor R (QR) dari [X | y], (k+1)×(k+1).
+    n_features  : jumlah kolom fitur (tanpa bias)
+    fit_intercept: tambahkan kolom bias 1.0 di depan setiap baris
+
+    R diperbarui per chunk (QR atas [R; X_chunk | y_chunk]) sehingga nilai
+    singular R_xx sama dengan nilai singular X: solve() memberi solusi yang
+    sama dengan pinv(X) @ y (cutoff yang sama) juga untuk fitur yang hampir
+    kolinear, tanpa mengkuadratkan bilangan kondisi seperti X^T X.
+    xtx / xty tetap tersedia (diturunkan dari R).
+    """
+    def __init__(self, n_features, fit_intercept=True):
+        k = n_features + (1 if fit_intercept else 0)
+        self.n_features = n_features
+        self.fit_intercept = fit_intercept
+        self.k = k
+        self.r = np.zeros((0, k + 1))
+        self.count = 0
+
+    def _absorb(self, block):
+        self.r = np.linalg.qr(np.vstack((self.r, block)), mode="r")
+
+    def update(self, X, y):
+        """Tambahkan satu chunk baris (X: [m × n_features], y: [m])."""
+        X = np.asarray(X, dtype=float).reshape(-1, self.n_features)
+        y = np.asarray(y, dtype=float).reshape(-1)
+        if X.shape[0] != y.shape[0]:
+            raise ValueError("Jumlah baris X dan y harus sama.")
+        if X.shape[0] == 0:
+            return self
+        if self.fit_intercept:
+            X = np.column_stack((np.ones(X.shape[0]), X))
+        self._absorb(np.column_stack((X, y)))
+        self.count += X.shape[0]
+        return self
+
+    def merge(self, other):
+        """Gabungkan akumulator lain (mis. dari worker paralel)."""
+        if self.k != other.k or self.fit_intercept != other.fit_intercept:
+            raise ValueError("Akumulator tidak kompatibel untuk digabung.")
+        if other.count:
+            self._absorb(other.r)
+            self.count += other.count
+        return self
+
+    def _square_r(self):
+        """R dilengkapi baris nol menjadi (k+1)×(k+1) (chunk awal bisa < k+1 baris)."""
+        r = np.zeros((self.k + 1, self.k + 1))
+        r[:self.r.shape[0]] = self.r
+        return r
+
+    @property
+    def xtx(self):
+        r = self._square_r()[:, :self.k]
+        return r.T @ r
+
+    @property
+    def xty(self):
+        r = self._square_r()
+        return r[:, :self.k].T @ r[:, self.k]
+
+    def solve(self):
+        """Selesaikan min ||X w - y|| (seperti pinv(X) @ y). Mengembalikan bobot berbentuk [k × 1]."""
+        if self.count == 0:
+            raise ValueError("Tidak ada baris data untuk regresi.")
+        r = self._square_r()
+        # Cutoff nilai singular sama dengan default pinv atas X (n × k): max(n, k) · eps
+        rcond = max(self.count, self.k) * np.finfo(float).eps
+        w = np.linalg.lstsq(r[:self.k, :self.k], r[:self.k, self.k], rcond=rcond)[0]
+        return w.reshape(-1, 1)
+
+
+@result_cache.cached("mlr", ignore=("chunk_size",))
+def multiple_linear_regression(X, y, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    X sudah berisi kolom bias (jika diinginkan); dikembalikan bobot [k × 1].
+    X diproses per chunk baris sehingga tidak ada pseudo-inverse n×k.
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float).reshape(-1)
+    if X.ndim != 2 or X.shape[0] != y.shape[0]:
+        raise ValueError("Dimensi X dan y salah untuk MLR.")
+    acc = NormalEquations(X.shape[1], fit_intercept=False)
+    for start in range(0, X.shape[0], chunk_size):
+        acc.update(X[start:start + chunk_size], y[start:start + chunk_size])
+    return acc.solve()
+
+
+@profiler.timed()
+def fit_matrix(matrix, target=-1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    MLR dengan bias dari Matrix/SparseMatrix: kolom `target` sebagai y, kolom lain
+    sebagai fitur (urutan dipertahankan). Baris dibaca per chunk, X tidak pernah dibentuk.
+    Bobot: [b0 (bias), b1..bk] berbentuk [k+1 × 1].
+    """
+    target = target % matrix.cols
+    features = [c for c in range(matrix.cols) if c != target]
+    acc = NormalEquations(len(features))
+    rows = matrix.iter_rows() if hasattr(matrix, "iter_rows") else iter(matrix.data)
+
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            block = np.asarray(chunk, dtype=float)
+            acc.update(block[:, features], block[:, target])
+            chunk = []
+    if chunk:
+        block = np.asarray(chunk, dtype=float)
+        acc.update(block[:, features], block[:, target])
+    return acc.solve()
+
+
+# ------------------------------------------------------------
+# MLR langsung dari file CSV (satu pass, memori terbatas)
+# ------------------------------------------------------------
+IMPUTE_STRATEGIES = ("zero", "mean", "skip")
+
+
+def _cell_value(row, c):
+    """Sel kolom c sebagai float, None jika kosong / tidak ada; ValueError jika non-numerik."""
+    s = row[c].strip() if c < len(row) else ""
+    if s == "":
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        raise ValueError(f"Kolom {c} berisi nilai non-numerik '{s}'; pilih kolom lewat features "
+                         "atau pakai impute_strategy='skip'.") from None
+
+
+def _rows_to_block(rows, columns, fill=None):
+    """
+    Konversi baris teks ke array float untuk kolom terpakai (baris kosong dibuang).
+    fill=None: baris dengan sel kosong / non-numerik dilewati; fill=[nilai per kolom]:
+    sel kosong diisi nilai tersebut seperti imputasi loader, sel non-numerik → ValueError.
+    Mengembalikan (block, jumlah baris yang dilewati).
+    """
+    block = []
+    skipped = 0
+    for row in rows:
+        try:
+            block.append([float(row[c]) for c in columns])
+            continue
+        except (ValueError, IndexError):
+            pass
+        if not any(map(str.strip, row)):
+            continue
+        if fill is None:
+            skipped += 1
+            continue
+        values = [_cell_value(row, c) for c in columns]
+        block.append([f if v is None else v for v, f in zip(values, fill)])
+    return np.asarray(block, dtype=float).reshape(-1, len(columns)), skipped
+
+
+def _column_means(chunks, columns):
+    """Rata-rata sel terisi per kolom (satu pass statistik untuk imputasi 'mean')."""
+    sums = [0.0] * len(columns)
+    counts = [0] * len(columns)
+    for rows in chunks:
+        for row in rows:
+            for j, c in enumerate(columns):
+                v = _cell_value(row, c)
+                if v is not None:
+                    sums[j] += v
+                    counts[j] += 1
+    return [total / n if n else 0.0 for total, n in zip(sums, counts)]
+
+
+def _accumulate_chunks(chunks, features, target, fit_intercept, fill=None):
+    """Akumulator untuk semua chunk beserta jumlah baris yang dilewati."""
+    acc = NormalEquations(len(features), fit_intercept)
+    columns = list(features) + [target]
+    skipped = 0
+    for rows in chunks:
+        block, n_skipped = _rows_to_block(rows, columns, fill)
+        skipped += n_skipped
+        if block.shape[0]:
+            acc.update(block[:, :-1], block[:, -1])
+    return acc, skipped
+
+
+def _accumulate_range(task):
+    path, start, end, delimiter, features, target, fit_intercept, chunk_size, encoding, fill = task
+    lines = csv_parallel.iter_range_lines(path, start, end, encoding)
+    reader = csv.reader(lines, delimiter=delimiter) if delimiter else csv.reader(lines)
+
+    def chunks():
+        chunk = []
+        for row in reader:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    return _accumulate_chunks(chunks(), features, target, fit_intercept, fill)
+
+
+def _resolve_column(header, column):
+    if isinstance(column, int):
+        return column
+    if column not in header:
+        raise ValueError(f"Selected column name '{column}' not found in header.")
+    return header.index(column)
+
+
+@profiler.timed()
+def fit_csv(path, target=-1, features=None, delimiter=None, skip_header=False,
+            fit_intercept=True, chunk_size=DEFAULT_CHUNK_SIZE, workers=None,
+            impute_strategy="zero"):
+    """
+    MLR langsung dari CSV dalam satu pass berbatas memori.
+    target / features: indeks kolom atau nama (jika skip_header); features=None → semua kolom selain target.
+    workers > 1: rentang byte file diproses paralel, akumulator digabung berurutan.
+    impute_strategy: sel kosong pada kolom terpakai, sama dengan load_matrix_from_csv
+      'zero' (default) | 'mean' (rata-rata kolom, satu pass statistik tambahan) → hasil
+      sama dengan fit_matrix(load_matrix_from_csv(path, impute_strategy=...)); sel
+      non-numerik menjadi ValueError.
+      'skip': baris dengan sel kosong / non-numerik dilewati; jumlahnya dilaporkan
+      lewat RuntimeWarning dan counter profiler 'mlr_skipped_rows'.
+    """
+    if impute_strategy not in IMPUTE_STRATEGIES:
+        raise ValueError(f"Strategi imputasi fit_csv tidak dikenal: {impute_strategy} "
+                         f"(pilihan: {', '.join(IMPUTE_STRATEGIES)})")
+    first = read_header(path, delimiter)
+    header = first if skip_header else []
+    width = len(first)
+    target = _resolve_column(header, target) % width
+    if features is None:
+        features = [c for c in range(width) if c != target]
+    else:
+        features = [_resolve_column(header, c) % width for c in features]
+    columns = list(features) + [target]
+    if impute_strategy == "zero":
+        fill = [0.0] * len(columns)
+    elif impute_strategy == "mean":
+        fill = _column_means(iter_row_chunks(path, delimiter, skip_header, chunk_size), columns)
+    else:
+        fill = None
+
+    acc = None
+    if (workers or 1) > 1:
+        encoding = locale.getpreferredencoding(False)
+        ranges = csv_parallel.byte_ranges(path, workers, skip_header)
+        tasks = [(path, a, b, delimiter, features, target, fit_intercept, chunk_size, encoding, fill)
+                 for a, b in ranges]
+        if len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+                partials = list(pool.map(_accumulate_range, tasks))
+            acc, skipped = partials[0]
+            for part, n_skipped in partials[1:]:
+                acc.merge(part)
+                skipped += n_skipped
+    if acc is None:
+        chunks = iter_row_chunks(path, delimiter, skip_header, chunk_size)
+        acc, skipped = _accumulate_chunks(chunks, features, target, fit_intercept, fill)
 
-    # Hitung bobot dengan pseudo-inverse
-    w = np.linalg.pinv(X) @ y
-    return w
+    if skipped:
+        profiler.count("mlr_skipped_rows", skipped)
+        warnings.warn(f"fit_csv: {skipped} baris dengan sel kosong / non-numerik dilewati "
+                      "(impute_strategy='skip').", RuntimeWarning, stacklevel=2)
+    return acc.solve()
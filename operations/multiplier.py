@@ -1,20 +1,209 @@
 # multiplier.py
-from matrix import Matrix
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from operator import mul
+
+from matrix import Matrix, carry_flags, known_flags, uses_buffer, uses_flat, np
+from . import flat_kernels, sparse_kernels, tiled_kernels
+from . import lazy as lazy_ops
+from . import result_cache
 from validators.is_square import is_square  # opsional untuk validasi tambahan
+from utilities import profiler
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # opsional: tanpa threadpoolctl jumlah thread BLAS dibaca dari environment
+    threadpool_limits = None
+
+# Ukuran blok (tile) baris/kolom pada jalur pure-Python
+BLOCK_SIZE = 64
+# Batas jumlah perkalian skalar (rows * inner * cols) yang masih dikerjakan pure-Python
+# bila operand berupa list dan numpy tersedia
+PYTHON_MAX_FLOPS = 64 ** 3
+# Mulai jumlah perkalian skalar ini, jalur buffer dibagi per pita baris ke worker
+PARALLEL_MIN_FLOPS = 512 ** 3
+# Tinggi minimum satu pita baris pada jalur paralel
+MIN_BAND_ROWS = 64
+# Variabel environment yang membatasi thread BLAS (nilai "1" = BLAS satu thread)
+BLAS_THREAD_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "BLIS_NUM_THREADS")
+
+
+def _choose_strategy(matrix1, matrix2, workers):
+    """
+    Dispatcher berbasis ukuran:
+      - "python"   : operand kecil atau numpy tidak tersedia
+      - "buffer"   : satu panggilan matmul numpy
+      - "parallel" : matmul numpy dipecah per pita baris di thread pool
+    """
+    if np is None:
+        return "python"
+    flops = matrix1.rows * matrix1.cols * matrix2.cols
+    if not uses_buffer(matrix1, matrix2) and flops <= PYTHON_MAX_FLOPS:
+        return "python"
+    if workers > 1 and flops >= PARALLEL_MIN_FLOPS and matrix1.rows >= 2 * MIN_BAND_ROWS:
+        return "parallel"
+    return "buffer"
+
+
+def _multiply_python(a, b, block_size=BLOCK_SIZE):
+    """
+    Perkalian pure-Python: B ditranspose sekali sehingga setiap elemen hasil
+    adalah dot product dua list kontigu, lalu loop i/j dikerjakan per blok
+    agar kolom B yang sama dipakai ulang selagi masih hangat di cache.
+    """
+    n = len(a)
+    b_cols = [list(col) for col in zip(*b)]
+    m = len(b_cols)
+    result = [[0] * m for _ in range(n)]
+
+    for jj in range(0, m, block_size):
+        col_block = b_cols[jj:jj + block_size]
+        for ii in range(0, n, block_size):
+            for i in range(ii, min(ii + block_size, n)):
+                a_row = a[i]
+                out_row = result[i]
+                for j, b_col in enumerate(col_block, jj):
+                    out_row[j] = sum(map(mul, a_row, b_col))
+    return result
+
+
+def _blas_single_threaded():
+    return any(os.environ.get(name) == "1" for name in BLAS_THREAD_VARS)
+
 
-def multiply_matrices(matrix1, matrix2):
+def _multiply_parallel(a, b, workers):
+    """
+    Bagi baris A menjadi pita dan hitung A[pita] @ B di thread pool (numpy melepas GIL).
+    Matmul float / complex memakai BLAS yang sudah multithread: pool hanya dipakai bila
+    thread BLAS bisa dibatasi ke 1 selama pool berjalan (threadpoolctl) atau BLAS memang
+    satu thread (OMP_NUM_THREADS=1 dll.); selain itu satu panggilan a @ b agar core
+    tidak di-oversubscribe. Matmul int / bool / object (bukan BLAS) selalu dibagi.
+    """
+    dtype = np.result_type(a, b)
+    blas_limit = nullcontext()
+    if dtype.kind in "fc":
+        if threadpool_limits is not None:
+            blas_limit = threadpool_limits(limits=1, user_api="blas")
+        elif not _blas_single_threaded():
+            return a @ b
+
+    out = np.empty((a.shape[0], b.shape[1]), dtype=dtype)
+    band = max(MIN_BAND_ROWS, -(-a.shape[0] // workers))
+
+    def run(start):
+        stop = min(start + band, a.shape[0])
+        np.matmul(a[start:stop], b, out=out[start:stop])
+
+    with blas_limit, ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run, range(0, a.shape[0], band)))
+    return out
+
+
+def abs_bound(a):
+    """max|a| sebagai int Python (0 untuk array kosong)."""
+    return max(-int(a.min()), int(a.max())) if a.size else 0
+
+
+def int64_product_fits(bound_a, bound_b, inner):
+    """True jika setiap jumlah hasil kali (max|a| · max|b| · k) dijamin muat di int64."""
+    return bound_a * bound_b * inner < 2 ** 63
+
+
+def _exact_in_numpy(a, b):
+    """
+    True jika matmul numpy atas a, b memberi hasil yang sama dengan jalur Python:
+    dtype bukan object (int Python di luar int64) dan untuk operand int setiap
+    jumlah hasil kali dijamin muat di int64 (max|a| · max|b| · k < 2**63).
+    """
+    if a.dtype == object or b.dtype == object:
+        return False
+    if a.dtype.kind not in "iub" or b.dtype.kind not in "iub" or a.size == 0 or b.size == 0:
+        return True
+    return int64_product_fits(abs_bound(a), abs_bound(b), a.shape[1])
+
+
+def _product_flags(matrix1, matrix2):
+    """Flag hasil A·B: I·B mewarisi flag B (dan sebaliknya), segitiga atas/bawah tertutup terhadap perkalian."""
+    f1, f2 = known_flags(matrix1), known_flags(matrix2)
+    if f1.get("identity"):
+        return f2
+    if f2.get("identity"):
+        return f1
+    return {k: True for k in ("upper", "lower") if f1.get(k) and f2.get(k)}
+
+
+def _sparse_flops(matrix1, matrix2):
+    if sparse_kernels.is_sparse(matrix1):
+        return 2 * matrix1.nnz * matrix2.cols
+    return 2 * matrix2.nnz * matrix1.rows
+
+
+@profiler.timed()
+@result_cache.cached("multiply", ignore=("workers", "memory_budget"))
+def multiply_matrices(matrix1, matrix2, strategy=None, workers=None, memory_budget=None):
     """
     Perkalian matriks (mengembalikan Matrix).
-    Implementasi sederhana (O(n^3)).
+    strategy: None (otomatis berdasarkan ukuran) | "python" | "buffer" | "parallel"
+              ("buffer"/"parallel" kembali ke "python" bila int operand list / array
+              bisa meluap di int64)
+    workers : jumlah thread untuk strategi "parallel" (default: jumlah CPU); untuk
+              matmul float tanpa threadpoolctl / BLAS satu thread, paralelisme
+              diserahkan ke BLAS (lihat _multiply_parallel)
+    Backend hasil mengikuti operand: list × list → list, array × array → array,
+    kombinasi lain dengan numpy → numpy.
+    memory_budget: batas byte working set bila salah satu operand TiledMatrix
+                   (default: tiledmatrix.memory_budget()); hasilnya TiledMatrix
     """
     if matrix1.cols != matrix2.rows:
         raise ValueError("Jumlah kolom matriks pertama harus sama dengan jumlah baris matriks kedua.")
 
-    result_data = [
-        [
-            sum(matrix1.data[i][k] * matrix2.data[k][j] for k in range(matrix1.cols))
-            for j in range(matrix2.cols)
-        ]
-        for i in range(matrix1.rows)
-    ]
-    return Matrix(result_data)
+    # Operand TiledMatrix (out-of-core) → panel-k dialirkan dari disk per blok hasil
+    if tiled_kernels.is_tiled(matrix1) or tiled_kernels.is_tiled(matrix2):
+        profiler.count("flops", 2 * matrix1.rows * matrix1.cols * matrix2.cols)
+        return tiled_kernels.multiply_tiled(matrix1, matrix2, memory_budget)
+
+    # Operand lazy: transpose murni dipakai langsung (view numpy / CSR↔CSC), sisanya dievaluasi
+    matrix1 = lazy_ops.operand(matrix1)
+    matrix2 = lazy_ops.operand(matrix2)
+
+    # Operand sparse → kernel CSR tanpa densifikasi (flop ≈ nnz operand sparse × sisi lain)
+    if sparse_kernels.is_sparse(matrix1) or sparse_kernels.is_sparse(matrix2):
+        profiler.count("flops", _sparse_flops(matrix1, matrix2))
+    if sparse_kernels.is_sparse(matrix1) and sparse_kernels.is_sparse(matrix2):
+        return sparse_kernels.multiply_sparse(matrix1, matrix2)
+    if sparse_kernels.is_sparse(matrix1):
+        return sparse_kernels.multiply_sparse_dense(matrix1, matrix2)
+    if sparse_kernels.is_sparse(matrix2):
+        return sparse_kernels.multiply_dense_sparse(matrix1, matrix2)
+
+    workers = workers or os.cpu_count() or 1
+    strategy = strategy or _choose_strategy(matrix1, matrix2, workers)
+    if strategy not in ("python", "buffer", "parallel"):
+        raise ValueError(f"Strategi perkalian tidak dikenal: {strategy}")
+    profiler.count("flops", 2 * matrix1.rows * matrix1.cols * matrix2.cols)
+
+    if strategy != "python":
+        if np is None:
+            raise ImportError(f"Strategi '{strategy}' membutuhkan numpy.")
+        a = matrix1.to_array()
+        b = matrix2.to_array()
+        # Operand list / array berisi int besar: int64 numpy bisa meluap → tetap di jalur Python (eksak)
+        if not uses_buffer(matrix1, matrix2) and not _exact_in_numpy(a, b):
+            strategy = "python"
+
+    if strategy == "python" and uses_flat(matrix1, matrix2):
+        result = flat_kernels.multiply_flat(matrix1, matrix2, BLOCK_SIZE)
+    elif strategy == "python":
+        result = Matrix(_multiply_python(matrix1.data, matrix2.data))
+    else:
+        if strategy == "parallel" and workers > 1:
+            result = Matrix(_multiply_parallel(a, b, workers))
+        else:
+            result = Matrix(a @ b)
+        # Operand array / list dibaca numpy; hasil dikembalikan ke backend operand
+        if uses_flat(matrix1, matrix2):
+            result = result.to_compact()
+        elif matrix1.backend == matrix2.backend == "list":
+            result = Matrix(result.to_array().tolist())
+    return carry_flags(result, **_product_flags(matrix1, matrix2))
@@ -0,0 +1,397 @@
+# result_cache.py
+"""
+Cache hasil operasi mahal (multiply_matrices, inverse_matrix, find_determinant,
+mlr.multiple_linear_regression) berbasis isi operand.
+
+Kunci = nama operasi + sidik jari setiap argumen (diikat ke signature fungsi,
+sehingga operand yang dikirim sebagai kata kunci ikut di-hash). Sidik jari
+adalah BLAKE2b atas bentuk, backend/dtype dan byte nilai (buffer numpy /
+array flat / CSR di-hash langsung tanpa salinan; baris list dikemas per baris
+ke array('q' / 'd')). Sidik jari Matrix / SparseMatrix disimpan pada objeknya
+sehingga operand yang sama hanya di-hash sekali; seperti cache LU, isi matriks
+dianggap tidak diubah setelah dibuat. Setiap pemanggil menerima objek hasil
+sendiri (buffer numpy dibagi read-only, lihat cached()).
+
+Nonaktif secara default (fungsi ber-@cached hanya memeriksa satu variabel):
+
+    from operations import result_cache
+    result_cache.enable(max_bytes=256 * 2**20, disk_dir="/var/cache/matriks")
+    ...
+    result_cache.stats()   # hits, misses, evictions, disk_hits, bytes, ...
+
+Tier memori: LRU yang dibatasi total ukuran hasil (perkiraan byte). Tier disk
+(opsional): satu file pickle per kunci, ditulis saat miss dan dibaca saat miss
+di memori; dengan disk_max_bytes file terlama (mtime, diperbarui saat hit)
+dihapus lebih dulu. Tier disk bisa dipakai bersama beberapa proses.
+"""
+
+from array import array
+from collections import OrderedDict
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+import threading
+
+from matrix import Matrix, np
+from sparsematrix import SparseMatrix
+from tiledmatrix import is_tiled
+from utilities import profiler
+
+DEFAULT_MAX_BYTES = 256 * 2 ** 20
+_LIST_CELL_BYTES = 32   # perkiraan per sel backend list (pointer + objek angka)
+
+
+# ------------------------------------------------------------
+# Sidik jari operand
+# ------------------------------------------------------------
+def _hash_rows(h, rows):
+    for row in rows:
+        typecode = "q" if all(type(v) is int for v in row) else "d"
+        try:
+            packed = array(typecode, row)
+        except (OverflowError, TypeError):
+            h.update(b"r" + repr(list(row)).encode())
+            continue
+        h.update(typecode.encode())
+        h.update(packed)
+
+
+def fingerprint(value):
+    """Sidik jari isi (hex) untuk Matrix, SparseMatrix, LazyMatrix, ndarray atau nilai biasa."""
+    memo = getattr(value, "_fingerprint", None)
+    if memo is not None:
+        return memo
+
+    h = hashlib.blake2b(digest_size=16)
+    if hasattr(value, "terms"):
+        # LazyMatrix: ekspresi (koefisien, transpose, daun) tanpa dievaluasi
+        h.update(f"lazy:{value.rows}x{value.cols}".encode())
+        for coef, leaf, transposed in value.terms:
+            h.update(f"|{coef!r}:{transposed}:{fingerprint(leaf)}".encode())
+    elif isinstance(value, SparseMatrix):
+        h.update(f"sparse:{value.format}:{value.rows}x{value.cols}".encode())
+        h.update(value.indptr)
+        h.update(value.indices)
+        if isinstance(value.values, array):
+            h.update(value.values.typecode.encode())
+            h.update(value.values)
+        else:
+            _hash_rows(h, [value.values])
+    elif isinstance(value, Matrix):
+        h.update(f"matrix:{value.backend}:{value.rows}x{value.cols}".encode())
+        if value.backend == "numpy":
+            buffer = value.to_array()
+            h.update(buffer.dtype.str.encode())
+            h.update(np.ascontiguousarray(buffer))
+        elif value.backend == "array":
+            flat = value.to_flat()
+            h.update(flat.typecode.encode())
+            h.update(flat)
+        else:
+            _hash_rows(h, value.data)
+    elif np is not None and isinstance(value, np.ndarray):
+        h.update(f"ndarray:{value.dtype.str}:{value.shape}".encode())
+        h.update(np.ascontiguousarray(value))
+    elif isinstance(value, (list, tuple)) and value and isinstance(value[0], (list, tuple)):
+        h.update(f"rows:{len(value)}".encode())
+        _hash_rows(h, value)
+    else:
+        h.update(f"{type(value).__name__}:{value!r}".encode())
+
+    digest = h.hexdigest()
+    if isinstance(value, (Matrix, SparseMatrix)):
+        value._fingerprint = digest
+    return digest
+
+
+def make_key(name, arguments):
+    """
+    Kunci dari nama operasi + pasangan (nama parameter, nilai) yang sudah diikat
+    ke signature fungsi: argumen posisi dan kata kunci yang sama menghasilkan
+    kunci yang sama, dan setiap nilai (termasuk kwargs) lewat fingerprint().
+    """
+    h = hashlib.blake2b(name.encode(), digest_size=20)
+    for k, v in arguments:
+        h.update(f"|{k}={fingerprint(v)}".encode())
+    return h.hexdigest()
+
+
+def _bound_arguments(signature, args, kwargs, ignore):
+    """Argumen terikat (default ikut diisi) tanpa parameter di `ignore`; **kwargs diratakan."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = []
+    for k, v in bound.arguments.items():
+        if k in ignore:
+            continue
+        kind = signature.parameters[k].kind
+        if kind is inspect.Parameter.VAR_POSITIONAL:
+            arguments.extend((f"{k}[{i}]", item) for i, item in enumerate(v))
+        elif kind is inspect.Parameter.VAR_KEYWORD:
+            arguments.extend((f"{k}.{name}", v[name]) for name in sorted(v) if name not in ignore)
+        else:
+            arguments.append((k, v))
+    return arguments
+
+
+def _nbytes(value):
+    """Perkiraan ukuran hasil di memori (untuk batas LRU)."""
+    if isinstance(value, SparseMatrix):
+        values = value.values
+        values_bytes = values.itemsize * len(values) if isinstance(values, array) else _LIST_CELL_BYTES * len(values)
+        return 8 * (len(value.indptr) + len(value.indices)) + values_bytes
+    if isinstance(value, Matrix):
+        if value.backend == "numpy":
+            return value.to_array().nbytes
+        if value.backend == "array":
+            return 8 * value.rows * value.cols
+        return _LIST_CELL_BYTES * value.rows * value.cols
+    if np is not None and isinstance(value, np.ndarray):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+def _freeze(value):
+    """Buffer numpy hasil yang disimpan dijadikan read-only (dibagi tanpa salinan)."""
+    if isinstance(value, Matrix) and value.backend == "numpy":
+        value.to_array().setflags(write=False)
+    return value
+
+
+def _handout(value):
+    """
+    Objek hasil untuk satu pemanggil: Matrix selalu dibungkus ulang (list .data
+    sendiri); buffer numpy read-only dibagi, buffer list / array / CSR dan
+    ndarray disalin. Flag struktur dan sidik jari ikut dibawa.
+    """
+    if isinstance(value, SparseMatrix):
+        result = SparseMatrix.from_compressed(array(value.indptr.typecode, value.indptr),
+                                              array(value.indices.typecode, value.indices),
+                                              value.values[:],
+                                              shape=value.shape, format=value.format)
+    elif isinstance(value, Matrix):
+        if value.backend == "numpy":
+            result = Matrix(value.to_array())
+        elif value.backend == "array":
+            flat = value.to_flat()
+            result = Matrix.from_flat(array(flat.typecode, flat), value.rows, value.cols)
+        else:
+            result = Matrix([list(row) for row in value.data])
+        result._flags = dict(value._flags)
+    elif np is not None and isinstance(value, np.ndarray):
+        return value.copy()
+    else:
+        return value
+    result._fingerprint = getattr(value, "_fingerprint", None)
+    return result
+
+
+# ------------------------------------------------------------
+# Cache
+# ------------------------------------------------------------
+class ResultCache:
+    """
+    LRU dibatasi byte (max_bytes) + tier disk opsional (disk_dir, disk_max_bytes).
+    Counter: hits, misses, evictions, oversize (hasil > max_bytes, tidak disimpan
+    di memori), disk_hits, disk_writes, disk_evictions.
+    """
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, disk_dir=None, disk_max_bytes=None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.bytes = 0
+        self.counters = OrderedDict(
+            (k, 0) for k in ("hits", "misses", "evictions", "oversize",
+                             "disk_hits", "disk_writes", "disk_evictions"))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def get(self, key):
+        """Kembalikan (ditemukan, nilai)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.counters["hits"] += 1
+                return True, entry[0]
+        if self.disk_dir:
+            value = self._disk_get(key)
+            if value is not None:
+                with self._lock:
+                    self.counters["disk_hits"] += 1
+                self._remember(key, value)
+                return True, value
+        with self._lock:
+            self.counters["misses"] += 1
+        return False, None
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.disk_dir:
+            self._disk_put(key, value)
+
+    def _remember(self, key, value):
+        size = _nbytes(value)
+        with self._lock:
+            if size > self.max_bytes:
+                self.counters["oversize"] += 1
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.counters["evictions"] += 1
+
+    # --- tier disk ---
+    def _path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.pkl")
+
+    def _disk_get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError):
+            # File rusak / tidak lengkap: anggap miss dan buang
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def _disk_put(self, key, value):
+        fd, tmp = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            self.counters["disk_writes"] += 1
+        if self.disk_max_bytes is not None:
+            self._disk_prune()
+
+    def _disk_prune(self):
+        files = []
+        for name in os.listdir(self.disk_dir):
+            if name.endswith(".pkl"):
+                try:
+                    st = os.stat(os.path.join(self.disk_dir, name))
+                except OSError:
+                    continue
+                files.append((st.st_mtime, st.st_size, name))
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.disk_dir, name))
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self.counters["disk_evictions"] += 1
+
+    def clear(self):
+        """Kosongkan tier memori (file di tier disk tidak dihapus)."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+            stats.update(entries=len(self._entries), bytes=self.bytes, max_bytes=self.max_bytes,
+                         disk_dir=self.disk_dir)
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+
+_cache = None
+
+
+def enable(max_bytes=DEFAULT_MAX_BYTES, disk_dir=None, disk_max_bytes=None):
+    """Aktifkan cache global (mengganti cache sebelumnya) dan kembalikan objeknya."""
+    global _cache
+    _cache = ResultCache(max_bytes, disk_dir, disk_max_bytes)
+    return _cache
+
+
+def disable():
+    global _cache
+    _cache = None
+
+
+def is_enabled():
+    return _cache is not None
+
+
+def clear():
+    if _cache is not None:
+        _cache.clear()
+
+
+def stats():
+    """Counter cache global (dict kosong jika nonaktif)."""
+    return _cache.stats() if _cache is not None else {}
+
+
+def cached(name, ignore=()):
+    """
+    Dekorator: hasil fungsi di-cache dengan kunci nama + sidik jari setiap argumen
+    yang diikat ke signature fungsi (posisi maupun kata kunci, kecuali `ignore`,
+    mis. jumlah worker) saat cache aktif.
+    Exception tidak di-cache; operand TiledMatrix (isi di disk, bisa berubah)
+    selalu melewati cache.
+
+    Setiap pemanggil (miss maupun hit) menerima objek hasil sendiri sehingga
+    mengubah .data / buffer hasil tidak merusak entry cache: Matrix dibungkus
+    ulang dengan salinan list / array / CSR, ndarray disalin, sedangkan buffer
+    numpy Matrix dibagi tanpa salinan tetapi read-only (menulis ke
+    to_array() hasil memunculkan ValueError; salin dulu bila perlu mengubahnya).
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = _cache
+            if cache is None:
+                return func(*args, **kwargs)
+            arguments = _bound_arguments(signature, args, kwargs, ignore)
+            if any(is_tiled(v) for _, v in arguments):
+                return func(*args, **kwargs)
+            key = make_key(name, arguments)
+            found, value = cache.get(key)
+            if found:
+                profiler.count("result_cache_hits")
+                # Entry dari tier disk baru saja di-unpickle (buffer bisa ditulis lagi)
+                return _handout(_freeze(value))
+            value = _freeze(func(*args, **kwargs))
+            cache.put(key, value)
+            return _handout(value)
+        return wrapper
+    return decorator
@@ -0,0 +1,150 @@
+# sparse_kernels.py
+"""
+Kernel native untuk SparseMatrix (CSR/CSC) yang tidak pernah membentuk
+matriks dense penuh dari operand sparse:
+ - penjumlahan / pengurangan sparse ± sparse dan sparse ± dense
+ - perkalian sparse × sparse (Gustavson), sparse × dense, dense × sparse
+ - transpose O(nnz)
+"""
+
+from array import array
+
+from matrix import Matrix, uses_buffer, np
+from sparsematrix import SparseMatrix, _pack_values, _as_ndarray
+
+
+def is_sparse(matrix):
+    return isinstance(matrix, SparseMatrix)
+
+
+def _csr_rows(matrix):
+    """Kembalikan (indptr, indices, values) versi CSR."""
+    csr = matrix.tocsr()
+    return csr.indptr, csr.indices, csr.values
+
+
+def add_sparse(matrix1, matrix2, sign=1):
+    """A + sign*B untuk dua SparseMatrix: merge indeks kolom per baris, hasil CSR."""
+    ap, ai, av = _csr_rows(matrix1)
+    bp, bi, bv = _csr_rows(matrix2)
+    indptr = array("q", [0])
+    indices = array("q")
+    values = []
+
+    for r in range(matrix1.rows):
+        p, p_end = ap[r], ap[r + 1]
+        q, q_end = bp[r], bp[r + 1]
+        while p < p_end or q < q_end:
+            if q >= q_end or (p < p_end and ai[p] < bi[q]):
+                col, v = ai[p], av[p]
+                p += 1
+            elif p >= p_end or bi[q] < ai[p]:
+                col, v = bi[q], sign * bv[q]
+                q += 1
+            else:
+                col, v = ai[p], av[p] + sign * bv[q]
+                p += 1
+                q += 1
+            if v != 0:
+                indices.append(col)
+                values.append(v)
+        indptr.append(len(indices))
+
+    return SparseMatrix.from_compressed(indptr, indices, _pack_values(values), shape=matrix1.shape)
+
+
+def add_sparse_dense(sparse, dense, sparse_sign=1, dense_sign=1):
+    """sparse_sign*S + dense_sign*D: salin D lalu tambahkan elemen bukan nol S. Hasil Matrix dense."""
+    if uses_buffer(dense):
+        csr = sparse.tocsr()
+        vals = _as_ndarray(csr.values)
+        out = dense.to_array() * dense_sign
+        out = out.astype(np.result_type(out, vals), copy=False)
+        row_idx = np.repeat(np.arange(csr.rows), np.diff(_as_ndarray(csr.indptr)))
+        out[row_idx, _as_ndarray(csr.indices)] += sparse_sign * vals
+        return Matrix(out)
+
+    result = [list(row) if dense_sign == 1 else [-x for x in row] for row in dense.data]
+    for r, c, v in sparse.iter_nonzero():
+        result[r][c] += sparse_sign * v
+    return Matrix(result)
+
+
+def multiply_sparse(matrix1, matrix2):
+    """Sparse × sparse (algoritma Gustavson baris demi baris), hasil CSR."""
+    ap, ai, av = _csr_rows(matrix1)
+    bp, bi, bv = _csr_rows(matrix2)
+    indptr = array("q", [0])
+    indices = array("q")
+    values = []
+
+    for r in range(matrix1.rows):
+        acc = {}
+        for p in range(ap[r], ap[r + 1]):
+            k, a = ai[p], av[p]
+            for q in range(bp[k], bp[k + 1]):
+                c = bi[q]
+                acc[c] = acc.get(c, 0) + a * bv[q]
+        for c in sorted(acc):
+            v = acc[c]
+            if v != 0:
+                indices.append(c)
+                values.append(v)
+        indptr.append(len(indices))
+
+    return SparseMatrix.from_compressed(
+        indptr, indices, _pack_values(values), shape=(matrix1.rows, matrix2.cols)
+    )
+
+
+def multiply_sparse_dense(sparse, dense):
+    """Sparse × dense: setiap baris hasil = kombinasi linear baris-baris D yang dirujuk S."""
+    ap, ai, av = _csr_rows(sparse)
+    m = dense.cols
+
+    if uses_buffer(dense):
+        b = dense.to_array()
+        vals = _as_ndarray(av)
+        cols = _as_ndarray(ai)
+        out = np.zeros((sparse.rows, m), dtype=np.result_type(vals, b))
+        for r in range(sparse.rows):
+            s, e = ap[r], ap[r + 1]
+            if s != e:
+                out[r] = vals[s:e] @ b[cols[s:e]]
+        return Matrix(out)
+
+    b = dense.data
+    result = []
+    for r in range(sparse.rows):
+        out_row = [0] * m
+        for p in range(ap[r], ap[r + 1]):
+            a = av[p]
+            out_row = [x + a * y for x, y in zip(out_row, b[ai[p]])]
+        result.append(out_row)
+    return Matrix(result)
+
+
+def multiply_dense_sparse(dense, sparse):
+    """Dense × sparse: untuk setiap baris D, sebar D[i][k] ke baris k dari S (CSR)."""
+    if uses_buffer(dense):
+        # (D S) = (S^T D^T)^T, dan S^T dalam CSR adalah CSC dari S
+        st = sparse.tocsc().transpose()
+        return Matrix(multiply_sparse_dense(st, Matrix(dense.to_array().T)).to_array().T)
+
+    bp, bi, bv = _csr_rows(sparse)
+    m = sparse.cols
+
+    result = []
+    for row in dense.data:
+        out_row = [0] * m
+        for k, a in enumerate(row):
+            if a != 0:
+                for q in range(bp[k], bp[k + 1]):
+                    out_row[bi[q]] += a * bv[q]
+        result.append(out_row)
+    return Matrix(result)
+
+
+def transpose_sparse(matrix):
+    """Transpose O(nnz): reinterpretasi CSR↔CSC lalu kompres ulang ke CSR."""
+    return matrix.transpose().tocsr()
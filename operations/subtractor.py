@@ -1,16 +1,49 @@
 # subtractor.py
-from matrix import Matrix
+from matrix import Matrix, carry_flags, elementwise_flags, uses_buffer, uses_flat
+from . import flat_kernels, sparse_kernels, tiled_kernels
+from .lazy import as_lazy, is_lazy
 from validators.is_square import is_square  # opsional jika diperlukan
+from utilities import profiler
 
-def subtract_matrices(matrix1, matrix2):
+@profiler.timed()
+def subtract_matrices(matrix1, matrix2, lazy=False):
     """
     Pengurangan dua matriks.
     """
     if matrix1.rows != matrix2.rows or matrix1.cols != matrix2.cols:
         raise ValueError("Matriks harus memiliki dimensi yang sama untuk pengurangan.")
 
+    # Operand TiledMatrix (out-of-core) → kernel per tile, hasil TiledMatrix
+    if tiled_kernels.is_tiled(matrix1) or tiled_kernels.is_tiled(matrix2):
+        profiler.count("flops", matrix1.rows * matrix1.cols)
+        return tiled_kernels.add_tiled(matrix1, matrix2, sign=-1)
+
+    # Mode lazy: kembalikan ekspresi, dievaluasi terfusi saat dipaksa (lihat lazy.py)
+    if lazy or is_lazy(matrix1) or is_lazy(matrix2):
+        return as_lazy(matrix1) - as_lazy(matrix2)
+
+    profiler.count("flops", matrix1.rows * matrix1.cols)
+
+    # Operand sparse → kernel CSR tanpa densifikasi
+    if sparse_kernels.is_sparse(matrix1) and sparse_kernels.is_sparse(matrix2):
+        return sparse_kernels.add_sparse(matrix1, matrix2, sign=-1)
+    if sparse_kernels.is_sparse(matrix1):
+        return sparse_kernels.add_sparse_dense(matrix1, matrix2, dense_sign=-1)
+    if sparse_kernels.is_sparse(matrix2):
+        return sparse_kernels.add_sparse_dense(matrix2, matrix1, sparse_sign=-1)
+
+    # Kedua operand memakai buffer numpy → kernel vektor
+    if uses_buffer(matrix1, matrix2):
+        result = Matrix(matrix1.to_array() - matrix2.to_array())
+        return carry_flags(result, **elementwise_flags(matrix1, matrix2))
+
+    # Kedua operand memakai buffer flat array → map() atas buffer
+    if uses_flat(matrix1, matrix2):
+        result = flat_kernels.add_flat(matrix1, matrix2, sign=-1)
+        return carry_flags(result, **elementwise_flags(matrix1, matrix2))
+
     result_data = [
         [matrix1.data[i][j] - matrix2.data[i][j] for j in range(matrix1.cols)]
         for i in range(matrix1.rows)
     ]
-    return Matrix(result_data)
+    return carry_flags(Matrix(result_data), **elementwise_flags(matrix1, matrix2))
@@ -0,0 +1,171 @@
+# tiled_kernels.py
+"""
+Kernel out-of-core untuk TiledMatrix (lihat tiledmatrix.py). Operand boleh
+campuran TiledMatrix dan matriks di memori; hasil selalu TiledMatrix baru di
+direktori scratch. Working set (blok yang disalin dari tile ke RAM) dibatasi
+memory budget:
+ - penjumlahan / pengurangan: per tile hasil, blok A ± blok B
+ - transpose: view tanpa salinan (tile (i, j) = transpose tile (j, i) sumber)
+ - perkalian: hasil dikerjakan per blok (gabungan tile sebesar mungkin, maks.
+   sepertiga budget); untuk tiap blok, panel-k A dan B dialirkan dari disk dan
+   diakumulasi dengan matmul numpy. XᵀX (view transpose × matriks yang sama)
+   membaca setiap panel X sekali untuk kedua sisi dan hanya menghitung blok di
+   atas diagonal (sisanya dicerminkan). Operand int diakumulasi di int64 hanya
+   bila hasil dijamin tidak overflow (cek yang sama dengan multiplier), selain
+   itu di float64.
+"""
+
+from matrix import np
+from tiledmatrix import TiledMatrix, is_tiled, memory_budget
+from utilities import profiler
+
+
+def _dense(matrix):
+    """Isi operand di memori sebagai ndarray (tanpa salinan bila memungkinkan)."""
+    if hasattr(matrix, "to_array"):
+        return matrix.to_array()
+    return np.asarray(matrix.data)
+
+
+def _reader(matrix):
+    """Fungsi (r0, r1, c0, c1) → ndarray blok operand."""
+    if is_tiled(matrix):
+        def read(r0, r1, c0, c1):
+            block = matrix.read_block(r0, r1, c0, c1)
+            profiler.count("tiled_bytes_read", block.nbytes)
+            return block
+        return read
+    array = _dense(matrix)
+    return lambda r0, r1, c0, c1: array[r0:r1, c0:c1]
+
+
+def _dtype(*matrices):
+    return np.result_type(*(m.dtype if is_tiled(m) else _dense(m).dtype for m in matrices))
+
+
+def _abs_bound(matrix):
+    """max|x| operand int; operand tiled dipindai per tile (satu pass baca)."""
+    from .multiplier import abs_bound
+    if not is_tiled(matrix):
+        return abs_bound(_dense(matrix))
+    bound = 0
+    rows, cols = matrix.grid
+    for i in range(rows):
+        for j in range(cols):
+            tile = matrix.tile(i, j)
+            profiler.count("tiled_bytes_read", tile.nbytes)
+            bound = max(bound, abs_bound(tile))
+    return bound
+
+
+def _accumulator_dtype(matrix1, matrix2, inner, gram):
+    """int64 jika operand int dan A·B dijamin muat di int64, selain itu float64."""
+    from .multiplier import int64_product_fits
+    if _dtype(matrix1, matrix2).kind not in "iub":
+        return np.dtype(np.float64)
+    bound1 = _abs_bound(matrix1)
+    bound2 = bound1 if gram else _abs_bound(matrix2)
+    if int64_product_fits(bound1, bound2, inner):
+        return np.dtype(np.int64)
+    return np.dtype(np.float64)
+
+
+def _write(result, r0, c0, block):
+    result.write_block(r0, c0, block)
+    result.flush()
+    profiler.count("tiled_bytes_written", block.nbytes)
+
+
+def add_tiled(matrix1, matrix2, sign=1):
+    """A + sign*B per tile hasil (grid tile mengikuti operand tiled pertama)."""
+    ref = matrix1 if is_tiled(matrix1) else matrix2
+    result = TiledMatrix.create(ref.rows, ref.cols, tile_shape=ref.tile_shape,
+                                dtype=_dtype(matrix1, matrix2))
+    read1, read2 = _reader(matrix1), _reader(matrix2)
+    tr, tc = result.tile_shape
+    for r0 in range(0, result.rows, tr):
+        r1 = min(r0 + tr, result.rows)
+        for c0 in range(0, result.cols, tc):
+            c1 = min(c0 + tc, result.cols)
+            a, b = read1(r0, r1, c0, c1), read2(r0, r1, c0, c1)
+            _write(result, r0, c0, a + b if sign == 1 else a - b)
+    return result
+
+
+def transpose_tiled(matrix):
+    return matrix.transpose()
+
+
+def _is_gram(matrix1, matrix2):
+    """True jika matrix1 adalah view transpose dari penyimpanan yang sama dengan matrix2."""
+    return (is_tiled(matrix1) and is_tiled(matrix2)
+            and matrix1.path == matrix2.path and matrix1.transposed != matrix2.transposed)
+
+
+def _block_shape(rows, cols, tile_rows, tile_cols, budget_items, square):
+    """
+    Ukuran blok hasil (kelipatan tile) yang akumulatornya + hasil matmul sementara
+    memakai paling banyak sepertiga budget; sisanya untuk panel-k.
+    """
+    br, bc = rows, cols
+    while 2 * br * bc > budget_items // 3 and (br > tile_rows or bc > tile_cols):
+        if square:
+            br = bc = max(tile_rows, -(-br // 2 // tile_rows) * tile_rows)
+        elif br > tile_rows and (br >= bc or bc <= tile_cols):
+            br = max(tile_rows, -(-br // 2 // tile_rows) * tile_rows)
+        else:
+            bc = max(tile_cols, -(-bc // 2 // tile_cols) * tile_cols)
+    return br, bc
+
+
+def multiply_tiled(matrix1, matrix2, budget=None):
+    """
+    A·B dengan working set ≤ budget byte (default: tiledmatrix.memory_budget()).
+    ValueError jika budget bahkan tidak cukup untuk satu tile hasil + panel selebar 1.
+    Hasil int64 hanya bila tidak mungkin overflow; selain itu float64 (tanpa wrap).
+    """
+    budget = budget or memory_budget()
+    rows, inner, cols = matrix1.rows, matrix1.cols, matrix2.cols
+    # Grid tile hasil: baris dari A, kolom dari B (operand di memori memakai tile operand lainnya)
+    tile_rows = (matrix1 if is_tiled(matrix1) else matrix2).tile_rows
+    tile_cols = (matrix2 if is_tiled(matrix2) else matrix1).tile_cols
+    tile_rows, tile_cols = min(tile_rows, max(rows, 1)), min(tile_cols, max(cols, 1))
+    # Tinggi tile sisi k (untuk menyelaraskan panel dengan batas tile di disk)
+    tile_inner = matrix2.tile_rows if is_tiled(matrix2) else matrix1.tile_cols
+
+    gram = _is_gram(matrix1, matrix2) and tile_rows == tile_cols
+    dtype = _accumulator_dtype(matrix1, matrix2, inner, _is_gram(matrix1, matrix2))
+    items = budget // dtype.itemsize
+    br, bc = _block_shape(rows, cols, tile_rows, tile_cols, items, gram)
+    panel = (items - 2 * br * bc) // (br + bc)
+    if panel < 1:
+        raise ValueError(
+            f"Memory budget {budget} byte terlalu kecil untuk tile hasil {tile_rows}x{tile_cols}; "
+            "perbesar budget atau perkecil tile_shape.")
+    if panel >= tile_inner:
+        panel -= panel % tile_inner
+    panel = min(panel, max(inner, 1))
+    result = TiledMatrix.create(rows, cols, tile_shape=(tile_rows, tile_cols), dtype=dtype)
+
+    read1, read2 = _reader(matrix1), _reader(matrix2)
+    for r0 in range(0, rows, br):
+        r1 = min(r0 + br, rows)
+        for c0 in range(0, cols, bc):
+            c1 = min(c0 + bc, cols)
+            if gram and c0 < r0:
+                # Blok di bawah diagonal XᵀX = transpose blok di atasnya (sudah ditulis)
+                _write(result, r0, c0, result.read_block(c0, c1, r0, r1).T)
+                continue
+            acc = np.zeros((r1 - r0, c1 - c0), dtype=dtype)
+            for k0 in range(0, inner, panel):
+                k1 = min(k0 + panel, inner)
+                b = read2(k0, k1, c0, c1)
+                # Blok diagonal XᵀX: panel A adalah transpose panel B yang sudah dibaca
+                a = b.T if gram and r0 == c0 else read1(r0, r1, k0, k1)
+                if a.dtype != dtype:
+                    a = a.astype(dtype)
+                if b.dtype != dtype:
+                    b = b.astype(dtype)
+                acc += a @ b
+            _write(result, r0, c0, acc)
+    return result
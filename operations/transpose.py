@@ -1,9 +1,36 @@
 # transpose.py
-from matrix import Matrix
+from matrix import Matrix, carry_flags, known_flags, uses_buffer, uses_flat
+from . import flat_kernels, sparse_kernels, tiled_kernels
+from .lazy import as_lazy, is_lazy
+from utilities import profiler
 
-def transpose_matrix(matrix):
+@profiler.timed()
+def transpose_matrix(matrix, lazy=False):
     """
     Mengembalikan transpose dari matriks.
+    lazy=True: kembalikan LazyMatrix (tanpa menyalin data, lihat lazy.py).
+    TiledMatrix selalu menghasilkan view transpose tanpa salinan.
     """
-    transposed_data = [[matrix.data[j][i] for j in range(matrix.rows)] for i in range(matrix.cols)]
-    return Matrix(transposed_data)
+    if tiled_kernels.is_tiled(matrix):
+        return tiled_kernels.transpose_tiled(matrix)
+    if lazy or is_lazy(matrix):
+        return as_lazy(matrix).transpose()
+    if sparse_kernels.is_sparse(matrix):
+        return sparse_kernels.transpose_sparse(matrix)
+    if uses_buffer(matrix):
+        result = Matrix(matrix.to_array().T)
+    elif uses_flat(matrix):
+        result = flat_kernels.transpose_flat(matrix)
+    else:
+        transposed_data = [[matrix.data[j][i] for j in range(matrix.rows)] for i in range(matrix.cols)]
+        result = Matrix(transposed_data)
+
+    # Simetris / identitas tetap, segitiga atas ↔ bawah
+    flags = known_flags(matrix)
+    return carry_flags(
+        result,
+        symmetric=flags.get("symmetric"),
+        identity=flags.get("identity"),
+        upper=flags.get("lower"),
+        lower=flags.get("upper"),
+    )
@@ -1,31 +1,114 @@
 # sparsematrix.py
-"""SparseMatrix: menyimpan hanya elemen != 0, tetapi menyediakan .data sebagai list-of-lists on-demand."""
+"""SparseMatrix: menyimpan hanya elemen != 0 dalam format terkompresi (CSR/CSC), .data tetap tersedia on-demand."""
 
-from validators.is_square import is_square
-from validators.is_symmetric import is_symmetric
+from array import array
+from bisect import bisect_left
+
+from matrix import np
 
 """
 Modul ini berisi kelas SparseMatrix dengan komentar diperluas.
-SparseMatrix menyimpan hanya elemen yang bukan nol dalam bentuk kamus (dict)
-untuk menghemat memori dan mempercepat operasi tertentu.
-Penambahan komentar dilakukan agar setiap bagian kode lebih mudah dipahami.
+SparseMatrix menyimpan hanya elemen yang bukan nol dalam format terkompresi:
+ - CSR (compressed sparse row)   : indptr per baris, indices = kolom
+ - CSC (compressed sparse column): indptr per kolom, indices = baris
+Ketiga array (indptr, indices, values) memakai modul array sehingga setiap
+elemen bukan nol hanya memakan 16 byte (indeks + nilai). Nilai yang tidak
+bisa disimpan persis di array('q') / array('d') (campuran int dan float,
+int di luar int64) tetap berupa list Python seperti storage dict lama.
+Bentuk lama {(i, j): val} (COO/dict) tetap diterima dan bisa diminta kembali.
 """
 
+
+def _pack_values(values):
+    """
+    Kemas nilai ke array('q') jika semuanya int (muat di int64), ke array('d')
+    jika semuanya float; selain itu list biasa agar tipe dan nilai tidak berubah.
+    """
+    values = list(values)
+    if np is not None:
+        integer, real = (int, np.integer), (float, np.floating)
+    else:
+        integer, real = int, float
+    if all(isinstance(v, integer) for v in values):
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    if all(isinstance(v, real) for v in values):
+        return array("d", values)
+    return values
+
+
+def _as_ndarray(arr):
+    """Pandangan numpy atas array.array 'q' / 'd' (tanpa salinan) atau list nilai campuran."""
+    if isinstance(arr, array):
+        return np.frombuffer(arr, dtype=arr.typecode)
+    return np.asarray(arr)
+
+
+def _compress(entries, n_major):
+    """
+    Ubah daftar (major, minor, nilai) yang sudah terurut menjadi
+    (indptr, indices, values). Nilai nol dibuang.
+    """
+    indptr = array("q", [0]) * (n_major + 1)
+    indices = array("q")
+    values = []
+    for major, minor, v in entries:
+        if v != 0:
+            indptr[major + 1] += 1
+            indices.append(minor)
+            values.append(v)
+    for i in range(n_major):
+        indptr[i + 1] += indptr[i]
+    return indptr, indices, _pack_values(values)
+
+
+def _swap_compression(indptr, indices, values, n_major, n_minor):
+    """
+    Konversi CSR <-> CSC dengan counting sort dalam O(nnz + n).
+    Indeks minor pada hasil otomatis terurut.
+    """
+    nnz = len(indices)
+    new_indptr = array("q", [0]) * (n_minor + 1)
+    for j in indices:
+        new_indptr[j + 1] += 1
+    for j in range(n_minor):
+        new_indptr[j + 1] += new_indptr[j]
+
+    cursor = new_indptr[:-1]
+    new_indices = array("q", [0]) * nnz
+    new_values = array(values.typecode, [0]) * nnz if isinstance(values, array) else [0] * nnz
+    for i in range(n_major):
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            q = cursor[j]
+            new_indices[q] = i
+            new_values[q] = values[p]
+            cursor[j] = q + 1
+    return new_indptr, new_indices, new_values
+
+
 class SparseMatrix:
     """
     Representasi matriks jarang (sparse).
+
+    data  : dict {(i, j): val} (COO) atau list of lists
+    shape : (rows, cols) opsional; wajib bila baris/kolom terakhir seluruhnya nol
     """
-    def __init__(self, data):
-        self._sparse_data = {}
+    def __init__(self, data, shape=None):
         self._dense_cache = None
+        self.format = "csr"
 
         if isinstance(data, dict):
-            self._sparse_data = dict(data)
-            if self._sparse_data:
-                self.rows = max(i for i, _ in self._sparse_data.keys()) + 1
-                self.cols = max(j for _, j in self._sparse_data.keys()) + 1
+            if shape is not None:
+                self.rows, self.cols = shape
+            elif data:
+                self.rows = max(i for i, _ in data.keys()) + 1
+                self.cols = max(j for _, j in data.keys()) + 1
             else:
                 self.rows = self.cols = 0
+            entries = ((i, j, v) for (i, j), v in sorted(data.items()))
         else:
             if not isinstance(data, list) or not all(isinstance(row, list) for row in data):
                 raise TypeError("Data harus berupa list of lists atau dict {(i,j): val}.")
@@ -33,35 +116,221 @@ class SparseMatrix:
             self.cols = len(data[0]) if self.rows > 0 else 0
             if not all(len(row) == self.cols for row in data):
                 raise ValueError("Semua baris harus memiliki jumlah kolom yang sama.")
-            for r, row in enumerate(data):
-                for c, val in enumerate(row):
-                    if val != 0:
-                        self._sparse_data[(r, c)] = val
+            entries = ((r, c, val) for r, row in enumerate(data) for c, val in enumerate(row))
+
+        self.indptr, self.indices, self.values = _compress(entries, self.rows)
+
+    @classmethod
+    def from_compressed(cls, indptr, indices, values, shape, format="csr"):
+        """
+        Bangun SparseMatrix langsung dari array terkompresi (tanpa salinan).
+        Indeks minor di setiap baris/kolom harus terurut dan tanpa duplikat.
+        """
+        if format not in ("csr", "csc"):
+            raise ValueError(f"Format sparse tidak dikenal: {format}")
+        obj = cls.__new__(cls)
+        obj._dense_cache = None
+        obj.format = format
+        obj.rows, obj.cols = shape
+        obj.indptr = indptr if isinstance(indptr, array) else array("q", indptr)
+        obj.indices = indices if isinstance(indices, array) else array("q", indices)
+        obj.values = values if isinstance(values, array) else _pack_values(values)
+        if len(obj.indptr) != (obj.rows if format == "csr" else obj.cols) + 1:
+            raise ValueError("Panjang indptr tidak sesuai dengan bentuk matriks.")
+        if len(obj.indices) != len(obj.values) or obj.indptr[-1] != len(obj.indices):
+            raise ValueError("indices, values dan indptr tidak konsisten.")
+        return obj
+
+    @classmethod
+    def from_coo(cls, row_indices, col_indices, values, shape):
+        """
+        Bangun SparseMatrix (CSR) dari tiga list paralel (format COO / triplet).
+        Triplet dengan (baris, kolom) yang sama dijumlahkan, seperti konvensi COO
+        (scipy.sparse.coo_matrix); hasil penjumlahan 0 tidak disimpan.
+        """
+        row_indices, col_indices, values = list(row_indices), list(col_indices), list(values)
+        if not len(row_indices) == len(col_indices) == len(values):
+            raise ValueError("row_indices, col_indices dan values harus sama panjang.")
+        entries = {}
+        for key, v in zip(zip(row_indices, col_indices), values):
+            entries[key] = entries[key] + v if key in entries else v
+        return cls(entries, shape=shape)
+
+    @property
+    def shape(self):
+        return (self.rows, self.cols)
+
+    @property
+    def nnz(self):
+        return len(self.values)
+
+    def _major_minor(self):
+        if self.format == "csr":
+            return self.rows, self.cols
+        return self.cols, self.rows
+
+    def tocsr(self):
+        """Kembalikan versi CSR (self jika sudah CSR)."""
+        if self.format == "csr":
+            return self
+        arrays = _swap_compression(self.indptr, self.indices, self.values, self.cols, self.rows)
+        return SparseMatrix.from_compressed(*arrays, shape=self.shape, format="csr")
+
+    def tocsc(self):
+        """Kembalikan versi CSC (self jika sudah CSC)."""
+        if self.format == "csc":
+            return self
+        arrays = _swap_compression(self.indptr, self.indices, self.values, self.rows, self.cols)
+        return SparseMatrix.from_compressed(*arrays, shape=self.shape, format="csc")
+
+    def transpose(self):
+        """
+        Transpose tanpa menyalin: CSR dari A adalah CSC dari A^T (dan sebaliknya),
+        sehingga cukup menukar bentuk dan label format.
+        """
+        return SparseMatrix.from_compressed(
+            self.indptr, self.indices, self.values,
+            shape=(self.cols, self.rows),
+            format="csc" if self.format == "csr" else "csr",
+        )
+
+    def iter_nonzero(self):
+        """Iterasi (i, j, nilai) untuk setiap elemen bukan nol, urut sesuai format."""
+        n_major, _ = self._major_minor()
+        indptr, indices, values = self.indptr, self.indices, self.values
+        for major in range(n_major):
+            for p in range(indptr[major], indptr[major + 1]):
+                if self.format == "csr":
+                    yield major, indices[p], values[p]
+                else:
+                    yield indices[p], major, values[p]
+
+    def to_dict(self):
+        """Kembalikan bentuk COO {(i, j): val}."""
+        return {(i, j): v for i, j, v in self.iter_nonzero()}
 
     @property
     def data(self):
         if self._dense_cache is not None:
             return self._dense_cache
         dense = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
-        for (r, c), v in self._sparse_data.items():
+        for r, c, v in self.iter_nonzero():
             dense[r][c] = v
         self._dense_cache = dense
         return self._dense_cache
 
+    # ------------------------------------------------------------
+    # Validator struktur langsung dari array terkompresi: O(nnz), tanpa .data
+    # ------------------------------------------------------------
+    def _nonzero_coords(self):
+        """
+        (major, minor, values) untuk elemen yang benar-benar bukan nol
+        (nol eksplisit di values diabaikan). Array numpy bila tersedia.
+        """
+        n_major, _ = self._major_minor()
+        if np is not None:
+            indptr = np.frombuffer(self.indptr, dtype=self.indptr.typecode)
+            minor = np.frombuffer(self.indices, dtype=self.indices.typecode)
+            values = _as_ndarray(self.values)
+            major = np.repeat(np.arange(n_major, dtype=np.int64), np.diff(indptr))
+            mask = values != 0
+            if not mask.all():
+                major, minor, values = major[mask], minor[mask], values[mask]
+            return major, minor, values
+        major, minor, values = [], [], []
+        for m in range(n_major):
+            for p in range(self.indptr[m], self.indptr[m + 1]):
+                if self.values[p] != 0:
+                    major.append(m)
+                    minor.append(self.indices[p])
+                    values.append(self.values[p])
+        return major, minor, values
+
     def is_square(self):
-        return is_square(self.data)
+        """Persegi dari bentuk yang tersimpan (O(1))."""
+        return self.rows > 0 and self.rows == self.cols
 
     def is_symmetric(self):
-        return is_symmetric(self.data)
+        """
+        Simetris jika setiap elemen (i, j) punya pasangan (j, i) bernilai sama.
+        Kunci major*n+minor sudah terurut (indeks minor terurut per baris/kolom),
+        sehingga pasangan dicari dengan binary search.
+        """
+        if not self.is_square():
+            return False
+        major, minor, values = self._nonzero_coords()
+        n = self.rows
+        if np is not None:
+            keys = major * n + minor
+            mirror = minor * n + major
+            pos = np.searchsorted(keys, mirror)
+            pos[pos == len(keys)] = 0
+            return bool(len(keys) == 0 or (np.all(keys[pos] == mirror) and np.all(values[pos] == values)))
+        # get_value(baris, kolom): pada CSC major adalah kolom
+        rows, cols = (major, minor) if self.format == "csr" else (minor, major)
+        for i, j, v in zip(rows, cols, values):
+            if i != j and self.get_value(j, i) != v:
+                return False
+        return True
+
+    def is_diagonal(self):
+        """Semua elemen bukan nol berada di diagonal."""
+        if not self.is_square():
+            return False
+        major, minor, _ = self._nonzero_coords()
+        if np is not None:
+            return bool(np.all(major == minor))
+        return all(i == j for i, j in zip(major, minor))
+
+    def is_identity(self):
+        """Identitas: tepat n elemen bukan nol, semuanya bernilai 1 di diagonal."""
+        if not self.is_square():
+            return False
+        major, minor, values = self._nonzero_coords()
+        if len(values) != self.rows:
+            return False
+        if np is not None:
+            return bool(np.all(major == minor) and np.all(values == 1))
+        return all(i == j and v == 1 for i, j, v in zip(major, minor, values))
+
+    def is_triangular(self, kind=None):
+        """Segitiga dari posisi elemen bukan nol. kind: None (atas atau bawah) | "upper" | "lower"."""
+        if kind not in (None, "upper", "lower"):
+            raise ValueError(f"Jenis segitiga tidak dikenal: {kind}")
+        if not self.is_square():
+            return False
+        major, minor, _ = self._nonzero_coords()
+        rows, cols = (major, minor) if self.format == "csr" else (minor, major)
+        if np is not None:
+            upper = bool(np.all(rows <= cols))
+            lower = bool(np.all(rows >= cols))
+        else:
+            upper = all(i <= j for i, j in zip(rows, cols))
+            lower = all(i >= j for i, j in zip(rows, cols))
+        if kind is None:
+            return upper or lower
+        return upper if kind == "upper" else lower
 
     def get_value(self, row, col):
-        return self._sparse_data.get((row, col), 0)
+        if self.format == "csr":
+            major, minor = row, col
+        else:
+            major, minor = col, row
+        start, end = self.indptr[major], self.indptr[major + 1]
+        p = bisect_left(self.indices, minor, start, end)
+        if p < end and self.indices[p] == minor:
+            return self.values[p]
+        return 0
 
     def __repr__(self):
-        return f"SparseMatrix(rows={self.rows}, cols={self.cols}, nnz={len(self._sparse_data)})"
+        return f"SparseMatrix(rows={self.rows}, cols={self.cols}, nnz={self.nnz}, format={self.format})"
 
     def __str__(self):
-        return "\n".join(
-            " ".join(str(self.get_value(r, c)) for c in range(self.cols))
-            for r in range(self.rows)
-        )
+        csr = self.tocsr()
+        lines = []
+        for r in range(self.rows):
+            row = [0] * self.cols
+            for p in range(csr.indptr[r], csr.indptr[r + 1]):
+                row[csr.indices[p]] = csr.values[p]
+            lines.append(" ".join(map(str, row)))
+        return "\n".join(lines)
@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# Modul proyek di-import dari root repo (tanpa instalasi paket)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
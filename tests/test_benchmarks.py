@@ -0,0 +1,38 @@
+# tests/test_benchmarks.py
+import json
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.runner import compare_results
+
+
+def _suite(**results):
+    return {"meta": {}, "results": results}
+
+
+OK = {"median": 1.0}
+SLOW = {"median": 2.0}
+FAILED = {"error": "ValueError: boom"}
+
+
+@pytest.mark.parametrize("base, cur, status", [
+    (OK, OK, "ok"),
+    (OK, SLOW, "regression"),
+    (OK, FAILED, "regression"),
+    (FAILED, FAILED, "error"),
+    (FAILED, OK, "error"),
+])
+def test_compare_status(base, cur, status):
+    (row,) = compare_results(_suite(case=base), _suite(case=cur))
+    assert row["status"] == status
+
+
+@pytest.mark.parametrize("cur, code", [(OK, 0), (FAILED, 1)])
+def test_compare_exit_code_fails_on_newly_broken_case(tmp_path, capsys, cur, code):
+    base_path, cur_path = tmp_path / "base.json", tmp_path / "cur.json"
+    base_path.write_text(json.dumps(_suite(case=OK)))
+    cur_path.write_text(json.dumps(_suite(case=cur)))
+    assert main(["--compare", str(base_path), "--against", str(cur_path)]) == code
+    if code:
+        assert "ValueError: boom" in capsys.readouterr().out
@@ -0,0 +1,51 @@
+# tests/test_binary_format.py
+import os
+
+import pytest
+
+from matrix import Matrix
+from sparsematrix import SparseMatrix
+from exporters.binary_exporter import export_to_binary
+from utilities.binary_loader import load_matrix_from_binary
+
+
+def _dense(matrix):
+    return [[matrix.get_value(i, j) for j in range(matrix.cols)] for i in range(matrix.rows)]
+
+
+@pytest.mark.parametrize("make", [
+    lambda rows: Matrix(rows),
+    lambda rows: Matrix.compact(rows),
+    lambda rows: Matrix.from_array(rows),
+])
+@pytest.mark.parametrize("rows", [
+    [[1, -2, 3], [4, 5, 2 ** 62]],
+    [[1.5, 0.0, -2.25], [3.0, 4.0, 5.0]],
+])
+def test_dense_round_trip(tmp_path, make, rows):
+    path = str(tmp_path / "m.mtxb")
+    export_to_binary(make(rows), path)
+    loaded = load_matrix_from_binary(path)
+    assert (loaded.rows, loaded.cols) == (2, 3)
+    assert _dense(loaded) == rows
+
+
+def test_sparse_round_trip(tmp_path):
+    rows = [[0, 0, 3], [4, 0, 0], [0, 0, 0]]
+    path = str(tmp_path / "s.mtxb")
+    export_to_binary(SparseMatrix(rows), path)
+    loaded = load_matrix_from_binary(path)
+    assert isinstance(loaded, SparseMatrix)
+    assert _dense(loaded) == rows
+
+
+def test_rewrite_while_mapped(tmp_path):
+    path = str(tmp_path / "y.mtxb")
+    export_to_binary(Matrix([[1, 2], [3, 4]]), path)
+    mapped = load_matrix_from_binary(path)
+    # Menulis ulang file yang sedang di-mmap tidak boleh memotong halaman pembaca
+    export_to_binary(mapped, path)
+    export_to_binary(Matrix([[9, 9, 9]]), path)
+    assert _dense(mapped) == [[1, 2], [3, 4]]
+    assert _dense(load_matrix_from_binary(path)) == [[9, 9, 9]]
+    assert os.listdir(tmp_path) == ["y.mtxb"]
@@ -0,0 +1,56 @@
+# tests/test_csv_cache.py
+import os
+
+import pytest
+
+from utilities import csv_cache
+from utilities.csv_loader import load_matrix_from_csv
+
+CSV = "a,b,c\n1,2,3\n4,,6.5\n7,8,9\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV)
+    return str(path)
+
+
+@pytest.mark.parametrize("backend", [None, "list", "numpy", "array"])
+@pytest.mark.parametrize("normalize", [None, "minmax"])
+def test_hit_matches_fresh_load(tmp_path, csv_path, backend, normalize):
+    cache_dir = str(tmp_path / "cache")
+    options = dict(skip_header=True, backend=backend, normalize=normalize, impute_strategy="mean")
+    fresh = load_matrix_from_csv(csv_path, **options)
+    miss = load_matrix_from_csv(csv_path, cache_dir=cache_dir, **options)
+    hit = load_matrix_from_csv(csv_path, cache_dir=cache_dir, **options)
+    assert len(os.listdir(cache_dir)) == 1
+    for m in (miss, hit):
+        assert m.backend == fresh.backend
+        assert m.data == fresh.data
+        assert [type(v) for v in m.data[0]] == [type(v) for v in fresh.data[0]]
+
+
+@pytest.mark.parametrize("validate", ["mtime", "hash"])
+def test_changed_file_misses(tmp_path, csv_path, validate):
+    cache_dir = str(tmp_path / "cache")
+    load_matrix_from_csv(csv_path, skip_header=True, cache_dir=cache_dir, cache_validate=validate)
+    with open(csv_path, "a") as f:
+        f.write("10,11,12\n")
+    m = load_matrix_from_csv(csv_path, skip_header=True, cache_dir=cache_dir, cache_validate=validate)
+    assert m.rows == 4
+
+
+def test_corrupt_entry_is_discarded(tmp_path, csv_path):
+    cache_dir = str(tmp_path / "cache")
+    load_matrix_from_csv(csv_path, skip_header=True, cache_dir=cache_dir)
+    (entry,) = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, entry), "wb") as f:
+        f.write(b"junk")
+    assert csv_cache.lookup(cache_dir, entry[:-len(".mtxb")]) is None
+    assert load_matrix_from_csv(csv_path, skip_header=True, cache_dir=cache_dir).rows == 3
+
+
+def test_unknown_validate_mode(csv_path, tmp_path):
+    with pytest.raises(ValueError):
+        load_matrix_from_csv(csv_path, cache_dir=str(tmp_path), cache_validate="size")
@@ -0,0 +1,45 @@
+# tests/test_csv_exporter.py
+import csv
+
+import pytest
+
+from matrix import Matrix
+from sparsematrix import SparseMatrix
+from exporters.csv_exporter import export_to_csv
+
+ROWS = [[0, 0, 3, 0], [4, 0, 0, 0], [0, 0, 0, 0]]
+
+
+def _read(path):
+    with open(path, newline='') as f:
+        return list(csv.reader(f))
+
+
+def test_sparse_defaults_to_dense_layout(tmp_path):
+    dense, sparse = str(tmp_path / "dense.csv"), str(tmp_path / "sparse.csv")
+    export_to_csv(Matrix(ROWS), dense)
+    export_to_csv(SparseMatrix(ROWS), sparse)
+    assert _read(sparse) == _read(dense)
+    assert all(len(row) == 4 for row in _read(sparse))
+
+
+def test_triplet_layout_is_opt_in(tmp_path):
+    path = str(tmp_path / "triplet.csv")
+    export_to_csv(SparseMatrix(ROWS), path, layout="triplet")
+    assert _read(path) == [["row", "col", "value"], ["0", "2", "3"], ["1", "0", "4"]]
+
+
+def test_visualizer_reader_accepts_sparse_export(tmp_path):
+    pd = pytest.importorskip("pandas")
+    path = str(tmp_path / "sparse.csv")
+    export_to_csv(SparseMatrix(ROWS), path)
+    assert pd.read_csv(path, header=None).shape == (3, 4)
+
+
+@pytest.mark.parametrize("matrix, layout", [
+    (SparseMatrix(ROWS), "coo"),
+    (Matrix(ROWS), "triplet"),
+])
+def test_invalid_layout_rejected(tmp_path, matrix, layout):
+    with pytest.raises(ValueError):
+        export_to_csv(matrix, str(tmp_path / "x.csv"), layout=layout)
@@ -0,0 +1,103 @@
+# tests/test_csv_loader.py
+import pytest
+
+from sparsematrix import SparseMatrix
+from utilities.csv_loader import load_matrix_from_csv
+
+MODES = {
+    "classic": {},
+    "streaming": {"streaming": True, "chunk_size": 2},
+    "parallel": {"workers": 2, "chunk_size": 2},
+}
+
+CSV = "a,b,c,d\n1,2,,4\n5,x,7,8\n9,10,11,\n13,14,15,16\n\n17,18,19,20\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV)
+    return str(path)
+
+
+def _dense(matrix):
+    return [[float(matrix.get_value(i, j)) for j in range(matrix.cols)] for i in range(matrix.rows)]
+
+
+def _flat(matrix):
+    return (matrix.rows, matrix.cols), [v for row in _dense(matrix) for v in row]
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("selected", [[0, 9], [9], [-9], [0, 4]])
+def test_out_of_range_selected_column_raises(csv_path, mode, selected):
+    with pytest.raises(IndexError):
+        load_matrix_from_csv(csv_path, skip_header=True, selected_columns=selected, **MODES[mode])
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_negative_selected_column(csv_path, mode):
+    m = load_matrix_from_csv(csv_path, skip_header=True, selected_columns=[-1], **MODES[mode])
+    assert _dense(m) == [[4.0], [8.0], [0.0], [16.0], [20.0]]
+
+
+@pytest.mark.parametrize("options", [
+    dict(impute_strategy="zero"),
+    dict(impute_strategy="mean"),
+    dict(impute_strategy="median"),
+    dict(impute_strategy="drop"),
+    dict(impute_strategy="mean", normalize="minmax"),
+    dict(impute_strategy="median", normalize="zscore"),
+    dict(selected_columns=["d", "a"]),
+    dict(selected_columns=[2, 0]),
+    dict(schema={"a": "float", "b": "skip"}),
+    dict(as_sparse=True),
+])
+def test_modes_agree(csv_path, options):
+    results = {mode: load_matrix_from_csv(csv_path, skip_header=True, **options, **extra)
+               for mode, extra in MODES.items()}
+    shape, expected = _flat(results["classic"])
+    for mode, matrix in results.items():
+        assert isinstance(matrix, SparseMatrix) == bool(options.get("as_sparse")), mode
+        assert _flat(matrix)[0] == shape, mode
+        assert _flat(matrix)[1] == pytest.approx(expected), mode
+
+
+def test_non_numeric_column_rejected_without_drop(csv_path):
+    with pytest.raises(ValueError):
+        load_matrix_from_csv(csv_path, skip_header=True, drop_non_numeric=False)
+
+
+def test_backend_types(csv_path):
+    assert load_matrix_from_csv(csv_path, skip_header=True).backend == "list"
+    assert load_matrix_from_csv(csv_path, skip_header=True, backend="array").backend == "array"
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_out_of_range_error_names_requested_columns(csv_path, mode):
+    with pytest.raises(IndexError, match=r"4 kolom\): \[-9, 7\]"):
+        load_matrix_from_csv(csv_path, skip_header=True, selected_columns=[-9, "a", 7], **MODES[mode])
+
+
+def test_selection_iterator_is_consumed_once(csv_path):
+    m = load_matrix_from_csv(csv_path, skip_header=True, selected_columns=iter([0, 3]))
+    assert (m.rows, m.cols) == (5, 2)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_integers_beyond_int64_stay_exact(tmp_path, mode, recwarn):
+    path = tmp_path / "big.csv"
+    path.write_text("1,2.5\n99999999999999999999,3\n-123456789012345678901234,4\n9007199254740993,5\n,6\n")
+    m = load_matrix_from_csv(str(path), backend="list", **MODES[mode])
+    assert m.data == [[1, 2.5], [99999999999999999999, 3], [-123456789012345678901234, 4],
+                      [9007199254740993, 5], [0, 6]]
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+
+def test_integers_beyond_int64_skip_sidecar_cache(tmp_path):
+    path = tmp_path / "big.csv"
+    path.write_text("5\n99999999999999999999\n7\n")
+    for _ in range(2):
+        m = load_matrix_from_csv(str(path), cache_dir=str(tmp_path / "cache"))
+        assert m.data == [[5], [99999999999999999999], [7]]
+    assert load_matrix_from_csv(str(path), backend="numpy").get_value(1, 0) == pytest.approx(1e20)
@@ -0,0 +1,69 @@
+# tests/test_determinant.py
+import pytest
+
+from matrix import Matrix
+from operations.determinant import find_determinant
+from operations.inverse import inverse_matrix
+from operations.lu import lu_decompose, solve
+
+np = pytest.importorskip("numpy")
+
+CASES = [
+    [[2, 1], [1, 3]],
+    [[2.5, 1.1], [0.3, 3.7]],
+    [[2, 0, 1], [1, 3, 2], [1, 1, 4]],
+    [[4, 1, 2, 3], [0, 3, 1, 1], [0, 0, 2, 5], [0, 0, 0, 7]],
+    [[4, 1, 2, 3], [1, 3, 1, 1], [2, 1, 2, 5], [3, 1, 5, 7]],
+]
+BACKENDS = (Matrix, Matrix.from_array, Matrix.compact)
+
+
+def _history(matrix, step):
+    if step == "inverse":
+        inverse_matrix(matrix)
+    elif step == "solve":
+        solve(matrix, Matrix([[1]] * matrix.rows))
+    elif step == "lu":
+        lu_decompose(matrix)
+
+
+@pytest.mark.parametrize("rows", CASES)
+@pytest.mark.parametrize("make", BACKENDS)
+@pytest.mark.parametrize("step", ["inverse", "solve", "lu"])
+def test_result_independent_of_history(rows, make, step):
+    fresh = find_determinant(make(rows))
+    matrix = make(rows)
+    _history(matrix, step)
+    after = find_determinant(matrix)
+    assert type(after) is type(fresh)
+    assert after == fresh
+
+
+@pytest.mark.parametrize("rows", CASES)
+def test_value(rows):
+    assert find_determinant(Matrix(rows)) == pytest.approx(np.linalg.det(np.array(rows)))
+
+
+def test_exact_int_for_small_and_triangular():
+    assert find_determinant(Matrix([[2, 1], [1, 3]])) == 5
+    assert type(find_determinant(Matrix([[2, 1], [1, 3]]))) is int
+    assert find_determinant(Matrix(CASES[3])) == 168
+    assert type(find_determinant(Matrix(CASES[3]))) is int
+
+
+def test_non_square_rejected():
+    with pytest.raises(ValueError):
+        find_determinant(Matrix([[1, 2, 3]]))
+
+
+def test_cli_moves_large_matrices_to_buffer_and_caps_size():
+    main = pytest.importorskip("main")
+    small = Matrix([[1, 2], [3, 4]])
+    assert main.square_ops_operand(small) is small
+    n = main.PYTHON_LU_MAX_N + 1
+    large = Matrix([[float(i == j) * 2 for j in range(n)] for i in range(n)])
+    moved = main.square_ops_operand(large)
+    assert moved.backend == "numpy"
+    assert find_determinant(moved) == pytest.approx(2.0 ** n)
+    huge = Matrix.compact([[0] * (main.BUFFER_LU_MAX_N + 1)] * (main.BUFFER_LU_MAX_N + 1))
+    assert main.square_ops_operand(huge) is None
@@ -0,0 +1,48 @@
+# tests/test_elementwise.py
+import pytest
+
+from matrix import Matrix
+from sparsematrix import SparseMatrix
+from operations.adder import add_matrices
+from operations.subtractor import subtract_matrices
+from operations.transpose import transpose_matrix
+
+np = pytest.importorskip("numpy")
+
+A = [[1, 0, 2], [0, -3, 0], [4, 0, 5.5]]
+B = [[0, 7, 0], [1, 0, 0], [0, -2, 1]]
+
+BACKENDS = {
+    "list": lambda rows: Matrix([list(r) for r in rows]),
+    "numpy": Matrix.from_array,
+    "array": Matrix.compact,
+    "sparse": SparseMatrix,
+}
+
+
+def _dense(matrix):
+    return [[matrix.get_value(i, j) for j in range(matrix.cols)] for i in range(matrix.rows)]
+
+
+@pytest.mark.parametrize("b1", BACKENDS)
+@pytest.mark.parametrize("b2", BACKENDS)
+@pytest.mark.parametrize("lazy", [False, True])
+def test_add_subtract_parity(b1, b2, lazy):
+    a, b = BACKENDS[b1](A), BACKENDS[b2](B)
+    added = add_matrices(a, b, lazy=lazy)
+    subtracted = subtract_matrices(a, b, lazy=lazy)
+    assert _dense(added) == (np.array(A) + np.array(B)).tolist()
+    assert _dense(subtracted) == (np.array(A) - np.array(B)).tolist()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("lazy", [False, True])
+def test_transpose_parity(backend, lazy):
+    result = transpose_matrix(BACKENDS[backend](A), lazy=lazy)
+    assert _dense(result) == np.array(A).T.tolist()
+
+
+@pytest.mark.parametrize("op", [add_matrices, subtract_matrices])
+def test_shape_mismatch_rejected(op):
+    with pytest.raises(ValueError):
+        op(Matrix([[1, 2]]), Matrix([[1], [2]]))
@@ -0,0 +1,57 @@
+# tests/test_formatter.py
+import io
+
+import pytest
+
+from matrix import Matrix
+from operations.adder import add_matrices
+from operations.transpose import transpose_matrix
+from utilities import to_string
+from utilities.formatter import DEFAULT_MAX_COLS, format_lines, write_matrix
+
+
+def _big(n=40):
+    return Matrix([[i * n + j for j in range(n)] for i in range(n)])
+
+
+def test_to_string_defaults_to_full_dump():
+    m = _big()
+    text = to_string(m)
+    lines = text.split("\n")
+    assert len(lines) == 40
+    assert lines[0] == " ".join(str(j) for j in range(40))
+    assert "..." not in text
+
+
+def test_to_string_preview_with_options():
+    text = to_string(_big(), max_rows=4, max_cols=4)
+    assert "..." in text
+    assert text.endswith("[40 baris × 40 kolom]")
+
+
+def test_lazy_preview_does_not_evaluate():
+    a = _big()
+    expr = add_matrices(a, transpose_matrix(a, lazy=True), lazy=True)
+    out = io.StringIO()
+    write_matrix(expr, out, max_rows=4, max_cols=4)
+    assert expr._value is None
+    first = out.getvalue().split("\n")[0].split()
+    assert first[0] == "0" and first[1] == str(1 + 40)
+    assert out.getvalue() == _preview(expr.evaluate())
+
+
+def _preview(matrix):
+    out = io.StringIO()
+    write_matrix(matrix, out, max_rows=4, max_cols=4)
+    return out.getvalue()
+
+
+def test_cli_preview_cols_zero_shows_full_rows(monkeypatch, tmp_path):
+    main = pytest.importorskip("main")
+    monkeypatch.setattr("sys.argv", ["main.py", "--a", "x.csv", "--preview-rows", "0", "--preview-cols", "0"])
+    args = main.parse_args()
+    wide = Matrix([list(range(12))])
+    lines = list(format_lines(wide, max_rows=args.preview_rows, max_cols=args.preview_cols))
+    assert lines[0].split() == [str(v) for v in range(12)]
+    monkeypatch.setattr("sys.argv", ["main.py", "--a", "x.csv"])
+    assert main.parse_args().preview_cols == DEFAULT_MAX_COLS
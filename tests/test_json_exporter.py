@@ -0,0 +1,45 @@
+# tests/test_json_exporter.py
+import json
+
+import pytest
+
+from matrix import Matrix
+from sparsematrix import SparseMatrix
+from exporters.json_exporter import export_to_json
+
+ROWS = [[0, 0, 3, 0], [4, 0, 0, 0], [0, 0, 0, 0]]
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("mode", ["compact", "ndjson", "pretty"])
+def test_sparse_defaults_to_dense_layout(tmp_path, mode):
+    dense, sparse = str(tmp_path / "dense.json"), str(tmp_path / "sparse.json")
+    export_to_json(Matrix(ROWS), dense, mode=mode)
+    export_to_json(SparseMatrix(ROWS), sparse, mode=mode)
+    assert _read(sparse) == _read(dense)
+
+
+def test_compact_dense_round_trips(tmp_path):
+    path = str(tmp_path / "sparse.json")
+    export_to_json(SparseMatrix(ROWS), path)
+    assert json.loads(_read(path)) == ROWS
+
+
+def test_triplet_layout_is_opt_in(tmp_path):
+    path = str(tmp_path / "triplet.json")
+    export_to_json(SparseMatrix(ROWS), path, layout="triplet")
+    assert json.loads(_read(path)) == {"format": "coo", "shape": [3, 4], "nnz": 2,
+                                       "entries": [[0, 2, 3], [1, 0, 4]]}
+
+
+@pytest.mark.parametrize("matrix, layout", [
+    (SparseMatrix(ROWS), "coo"),
+    (Matrix(ROWS), "triplet"),
+])
+def test_invalid_layout_rejected(tmp_path, matrix, layout):
+    with pytest.raises(ValueError):
+        export_to_json(matrix, str(tmp_path / "x.json"), layout=layout)
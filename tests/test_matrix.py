@@ -0,0 +1,78 @@
+# tests/test_matrix.py
+import copy
+import pickle
+
+import pytest
+
+from matrix import Matrix
+
+np = pytest.importorskip("numpy")
+
+BUFFER_BACKENDS = [Matrix.from_array, Matrix.compact]
+
+
+@pytest.mark.parametrize("make", BUFFER_BACKENDS)
+def test_buffer_data_is_read_only_and_never_forks(make):
+    m = make([[1, 2], [3, 4]])
+    assert m.data == [[1, 2], [3, 4]]
+    with pytest.raises(TypeError):
+        m.data[0][0] = 99
+    with pytest.raises(TypeError):
+        m.data[1] = [0, 0]
+    with pytest.raises(TypeError):
+        m.data.append([5, 6])
+    assert list(m.row(0)) == [1, 2]
+    assert m.to_array().tolist() == [[1, 2], [3, 4]]
+    assert m.is_symmetric() is False
+
+
+@pytest.mark.parametrize("make", BUFFER_BACKENDS)
+def test_buffer_data_copies_are_plain_lists(make):
+    m = make([[1.5, 2.5]])
+    for clone in (copy.deepcopy(m.data), pickle.loads(pickle.dumps(m.data)), [list(r) for r in m.data]):
+        clone[0][0] = 0
+        assert type(clone) is list and type(clone[0]) is list
+    assert m.data == [[1.5, 2.5]]
+
+
+def test_list_backend_data_stays_mutable():
+    m = Matrix([[1, 2], [3, 4]])
+    m.data[0][0] = 9
+    assert m.get_value(0, 0) == 9
+
+
+@pytest.mark.parametrize("make", [Matrix, *BUFFER_BACKENDS])
+def test_data_setter_replaces_contents_and_resets_caches(make):
+    from operations.determinant import find_determinant
+    from operations.lu import lu_decompose
+    from operations.result_cache import fingerprint
+
+    m = make([[2, 0, 0, 0], [0, 2, 0, 0], [0, 0, 2, 0], [0, 0, 0, 2]])
+    assert m.is_diagonal() and find_determinant(m) == 16
+    lu_decompose(m)
+    before = fingerprint(m)
+    m.data = [[1, 2], [3, 4]]
+    assert (m.rows, m.cols, m.backend) == (2, 2, "list")
+    assert m.to_array().tolist() == [[1, 2], [3, 4]]
+    assert not m.is_diagonal()
+    assert lu_decompose(m).determinant() == pytest.approx(-2)
+    assert fingerprint(m) != before
+
+
+def test_in_place_edit_then_reassign_refreshes_fingerprint():
+    from operations.result_cache import fingerprint
+
+    m = Matrix([[1, 2], [3, 4]])
+    before = fingerprint(m)
+    m.data[0][0] = 5
+    m.data = m.data
+    assert fingerprint(m) != before
+
+
+def test_data_setter_validates():
+    m = Matrix([[1]])
+    with pytest.raises(ValueError):
+        m.data = [[1, 2], [3]]
+    with pytest.raises(TypeError):
+        m.data = "abc"
+    assert m.data == [[1]]
@@ -0,0 +1,96 @@
+# tests/test_mlr.py
+import pytest
+
+from matrix import Matrix
+from operations import mlr
+
+np = pytest.importorskip("numpy")
+
+
+def _design(n, collinear=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    x1 = rng.normal(size=n)
+    x2 = 2 * x1 + collinear * rng.normal(size=n) if collinear else rng.normal(size=n)
+    X = np.column_stack((np.ones(n), x1, x2))
+    y = 3 + x1 - 0.5 * x2 + 0.1 * rng.normal(size=n)
+    return X, y
+
+
+@pytest.mark.parametrize("collinear", [0.0, 1e-4, 1e-8, 1e-12])
+@pytest.mark.parametrize("chunk_size", [7, 1000])
+def test_matches_pinv(collinear, chunk_size):
+    X, y = _design(500, collinear)
+    expected = np.linalg.pinv(X) @ y
+    w = mlr.multiple_linear_regression(X, y, chunk_size=chunk_size).ravel()
+    # Kedua solusi hanya akurat hingga cond(X) · eps relatif
+    rel = max(1e-8, 100 * np.linalg.cond(X) * np.finfo(float).eps)
+    assert w == pytest.approx(expected, rel=rel, abs=rel * np.abs(expected).max())
+
+
+def test_exactly_collinear_gives_minimum_norm_solution():
+    X, y = _design(200)
+    X = np.column_stack((X, X[:, 1]))
+    w = mlr.multiple_linear_regression(X, y).ravel()
+    assert w == pytest.approx(np.linalg.pinv(X) @ y, abs=1e-8)
+
+
+def test_merge_equals_single_pass():
+    X, y = _design(300, 1e-6)
+    whole = mlr.NormalEquations(2).update(X[:, 1:], y)
+    left = mlr.NormalEquations(2).update(X[:100, 1:], y[:100])
+    right = mlr.NormalEquations(2).update(X[100:, 1:], y[100:])
+    assert left.merge(right).solve().ravel() == pytest.approx(whole.solve().ravel())
+    assert left.xtx == pytest.approx(X.T @ X)
+    assert left.xty == pytest.approx(X.T @ y)
+
+
+def test_fit_matrix_and_csv_agree(tmp_path):
+    X, y = _design(120, seed=3)
+    data = np.column_stack((X[:, 1:], y))
+    path = tmp_path / "reg.csv"
+    path.write_text("\n".join(",".join(repr(v) for v in row) for row in data.tolist()))
+    from_matrix = mlr.fit_matrix(Matrix(data), chunk_size=16).ravel()
+    from_csv = mlr.fit_csv(str(path), chunk_size=16).ravel()
+    assert from_matrix == pytest.approx(np.linalg.pinv(X) @ y)
+    assert from_csv == pytest.approx(from_matrix)
+
+
+def test_empty_rejected():
+    with pytest.raises(ValueError):
+        mlr.NormalEquations(2).solve()
+
+
+MISSING_CSV = "x1,x2,y\n1,2,3.5\n2,,4.0\n3,1,\n4,5,9.5\n\n5,3,8.0\n6,2,7.5\n7\n8,4,12.5\n"
+
+
+@pytest.mark.parametrize("strategy", ["zero", "mean"])
+@pytest.mark.parametrize("workers", [None, 2])
+def test_fit_csv_imputes_like_the_loader(tmp_path, strategy, workers):
+    from utilities.csv_loader import load_matrix_from_csv
+
+    path = tmp_path / "missing.csv"
+    path.write_text(MISSING_CSV)
+    loaded = load_matrix_from_csv(str(path), skip_header=True, impute_strategy=strategy)
+    expected = mlr.fit_matrix(loaded).ravel()
+    got = mlr.fit_csv(str(path), skip_header=True, impute_strategy=strategy,
+                      workers=workers, chunk_size=3).ravel()
+    assert got == pytest.approx(expected)
+
+
+def test_fit_csv_skip_reports_dropped_rows(tmp_path):
+    path = tmp_path / "missing.csv"
+    path.write_text(MISSING_CSV)
+    with pytest.warns(RuntimeWarning, match="3 baris"):
+        w = mlr.fit_csv(str(path), skip_header=True, impute_strategy="skip").ravel()
+    X = np.array([[1, 1, 2], [1, 4, 5], [1, 5, 3], [1, 6, 2], [1, 8, 4]], dtype=float)
+    y = np.array([3.5, 9.5, 8.0, 7.5, 12.5])
+    assert w == pytest.approx(np.linalg.pinv(X) @ y)
+
+
+def test_fit_csv_rejects_non_numeric_and_unknown_strategy(tmp_path):
+    path = tmp_path / "text.csv"
+    path.write_text("1,2,3\n4,x,6\n7,8,9\n10,11,13\n")
+    with pytest.raises(ValueError, match="Kolom 1"):
+        mlr.fit_csv(str(path))
+    with pytest.raises(ValueError):
+        mlr.fit_csv(str(path), impute_strategy="median")
@@ -0,0 +1,100 @@
+# tests/test_multiply.py
+import pytest
+
+from matrix import Matrix
+from sparsematrix import SparseMatrix
+from operations.multiplier import multiply_matrices
+from operations.transpose import transpose_matrix
+
+np = pytest.importorskip("numpy")
+
+
+def _reference(a, b):
+    return [[sum(x * y for x, y in zip(row, col)) for col in zip(*b)] for row in a]
+
+
+def _operands(rows, seed):
+    rng = np.random.default_rng(seed)
+    dense = rng.integers(-9, 10, size=(rows, rows))
+    dense[rng.random((rows, rows)) < 0.7] = 0
+    return dense.tolist()
+
+
+def _as_backend(data, backend):
+    if backend == "list":
+        return Matrix([list(row) for row in data])
+    if backend == "numpy":
+        return Matrix.from_array(data)
+    if backend == "array":
+        return Matrix.compact(data)
+    return SparseMatrix(data)
+
+
+BACKENDS = ("list", "numpy", "array", "sparse")
+
+
+@pytest.mark.parametrize("n", [3, 80])
+@pytest.mark.parametrize("backend1", BACKENDS)
+@pytest.mark.parametrize("backend2", BACKENDS)
+def test_backend_parity(n, backend1, backend2):
+    a, b = _operands(n, 1), _operands(n, 2)
+    result = multiply_matrices(_as_backend(a, backend1), _as_backend(b, backend2))
+    assert [list(map(int, row)) for row in result.data] == _reference(a, b)
+
+
+@pytest.mark.parametrize("strategy", [None, "python", "buffer", "parallel"])
+def test_large_python_ints_stay_exact(strategy):
+    n = 80
+    a = Matrix([[2 ** 40] * n for _ in range(n)])
+    result = multiply_matrices(a, a, strategy=strategy, workers=2)
+    assert result.get_value(0, 0) == n * 2 ** 80
+
+
+def test_int64_overflow_on_array_backend_falls_back():
+    n = 80
+    a = Matrix.compact([[2 ** 40] * n for _ in range(n)])
+    assert multiply_matrices(a, a).get_value(0, 0) == float(n * 2 ** 80)
+
+
+@pytest.mark.parametrize("n", [3, 80])
+def test_list_operands_keep_list_backend(n):
+    a = Matrix(_operands(n, 3))
+    assert multiply_matrices(a, a).backend == "list"
+
+
+def test_unknown_strategy_rejected():
+    a = Matrix([[1]])
+    with pytest.raises(ValueError):
+        multiply_matrices(a, a, strategy="gpu")
+
+
+class _NoPool:
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("thread pool dipakai di atas BLAS multithread")
+
+
+@pytest.mark.parametrize("env, pooled", [({}, False), ({"OMP_NUM_THREADS": "1"}, True)])
+def test_parallel_float_matmul_does_not_oversubscribe_blas(monkeypatch, env, pooled):
+    from operations import multiplier
+
+    monkeypatch.setattr(multiplier, "threadpool_limits", None)
+    for name in multiplier.BLAS_THREAD_VARS:
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    if not pooled:
+        monkeypatch.setattr(multiplier, "ThreadPoolExecutor", _NoPool)
+    a = Matrix(np.random.default_rng(0).random((256, 32)))
+    result = multiply_matrices(a, transpose_matrix(a), strategy="parallel", workers=4)
+    assert np.allclose(result.to_array(), a.to_array() @ a.to_array().T)
+
+
+def test_parallel_int_matmul_still_uses_pool(monkeypatch):
+    from operations import multiplier
+
+    used = []
+    real = multiplier.ThreadPoolExecutor
+    monkeypatch.setattr(multiplier, "ThreadPoolExecutor", lambda **kw: used.append(kw) or real(**kw))
+    a = Matrix(np.arange(256 * 8).reshape(256, 8))
+    result = multiply_matrices(a, transpose_matrix(a), strategy="parallel", workers=4)
+    assert used and np.array_equal(result.to_array(), a.to_array() @ a.to_array().T)
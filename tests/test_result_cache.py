@@ -0,0 +1,73 @@
+# tests/test_result_cache.py
+import pytest
+
+from matrix import Matrix
+from operations import result_cache
+from operations.determinant import find_determinant
+from operations.multiplier import multiply_matrices
+
+
+@pytest.fixture
+def cache():
+    yield result_cache.enable()
+    result_cache.disable()
+
+
+def test_keyword_operands_are_fingerprinted(cache):
+    assert find_determinant(matrix=Matrix([[1, 2], [3, 4]])) == -2
+    assert find_determinant(matrix=Matrix([[5, 6], [7, 9]])) == 3
+
+
+def test_keyword_matrix_operands_are_fingerprinted(cache):
+    a = Matrix([[1, 2], [3, 4]])
+    first = multiply_matrices(a, matrix2=Matrix([[1, 0], [0, 1]]))
+    second = multiply_matrices(a, matrix2=Matrix([[0, 1], [1, 0]]))
+    assert first.data == [[1, 2], [3, 4]]
+    assert second.data == [[2, 1], [4, 3]]
+
+
+def test_positional_and_keyword_calls_share_key(cache):
+    a, b = Matrix([[1, 2], [3, 4]]), Matrix([[5, 6], [7, 8]])
+    multiply_matrices(a, b)
+    multiply_matrices(matrix1=a, matrix2=b, strategy=None)
+    assert cache.stats()["hits"] == 1
+
+
+def test_ignored_arguments_do_not_change_key(cache):
+    a, b = Matrix([[1, 2], [3, 4]]), Matrix([[5, 6], [7, 8]])
+    multiply_matrices(a, b, workers=1)
+    multiply_matrices(a, b, workers=4)
+    assert cache.stats()["hits"] == 1
+
+
+def test_hit_is_isolated_from_caller_mutation(cache):
+    a, b = Matrix([[1, 2], [3, 4]]), Matrix([[1, 0], [0, 1]])
+    first = multiply_matrices(a, b)
+    first.data[0][0] = 99
+    second = multiply_matrices(a, b)
+    second.data[1][1] = -1
+    assert multiply_matrices(a, b).data == [[1, 2], [3, 4]]
+
+
+def test_numpy_results_are_shared_read_only(cache):
+    np = pytest.importorskip("numpy")
+    a = Matrix(np.arange(4.0).reshape(2, 2))
+    result = multiply_matrices(a, a)
+    with pytest.raises(ValueError):
+        result.to_array()[0, 0] = 1.0
+    with pytest.raises(TypeError):
+        result.data[0][0] = 99
+    assert multiply_matrices(a, a).data == [[2.0, 3.0], [6.0, 11.0]]
+
+
+def test_disk_tier_hit_is_isolated(tmp_path):
+    cache = result_cache.enable(disk_dir=str(tmp_path))
+    try:
+        a = Matrix([[1, 2], [3, 4]])
+        multiply_matrices(a, a)
+        cache.clear()
+        multiply_matrices(a, a).data[0][0] = 0
+        assert multiply_matrices(a, a).data == [[7, 10], [15, 22]]
+        assert cache.stats()["disk_hits"] == 1
+    finally:
+        result_cache.disable()
@@ -0,0 +1,61 @@
+# tests/test_sparsematrix.py
+import pytest
+
+from sparsematrix import SparseMatrix
+
+
+def test_from_coo_sums_duplicates():
+    m = SparseMatrix.from_coo([0, 0, 1], [0, 0, 1], [1, 2, 3], shape=(2, 2))
+    assert m.data == [[3, 0], [0, 3]]
+    assert m.nnz == 2
+
+
+def test_from_coo_drops_cancelled_duplicates():
+    m = SparseMatrix.from_coo([1, 1, 0], [2, 2, 0], [5, -5, 1.5], shape=(2, 3))
+    assert m.nnz == 1
+    assert m.get_value(0, 0) == 1.5
+    assert m.get_value(1, 2) == 0
+
+
+def test_from_coo_unsorted_input():
+    m = SparseMatrix.from_coo([2, 0, 1], [0, 1, 1], [7, 8, 9], shape=(3, 2))
+    assert m.data == [[0, 8], [0, 9], [7, 0]]
+
+
+def test_from_coo_length_mismatch():
+    with pytest.raises(ValueError):
+        SparseMatrix.from_coo([0, 1], [0], [1, 2], shape=(2, 2))
+
+
+@pytest.mark.parametrize("rows", [
+    [[5, 0], [0, 2.5]],
+    [[0, 99999999999999999999], [-3, 0]],
+])
+def test_values_keep_type_and_precision(rows):
+    m = SparseMatrix(rows)
+    assert m.data == rows
+    assert [[type(v) for v in row] for row in m.data] == [[type(v) for v in row] for row in rows]
+    assert m.tocsc().tocsr().data == rows
+    assert m.transpose().data == [list(col) for col in zip(*rows)]
+    assert SparseMatrix.from_coo(*zip(*((i, j, v) for i, row in enumerate(rows)
+                                        for j, v in enumerate(row) if v)), shape=(2, 2)).data == rows
+
+
+def test_mixed_values_through_kernels_and_validators():
+    from operations.adder import add_matrices
+    from operations.multiplier import multiply_matrices
+    from operations.result_cache import fingerprint
+
+    m = SparseMatrix([[5, 0], [0, 2.5]])
+    assert str(m).split()[0] == "5"
+    assert add_matrices(m, m).data == [[10, 0], [0, 5.0]]
+    assert multiply_matrices(m, m).data == [[25, 0], [0, 6.25]]
+    assert m.is_diagonal() and not m.is_identity()
+    assert fingerprint(m) != fingerprint(SparseMatrix([[5, 0], [0, 2]]))
+
+
+def test_homogeneous_values_stay_packed():
+    from array import array
+
+    assert isinstance(SparseMatrix([[1, 0], [0, 2]]).values, array)
+    assert SparseMatrix([[1.5, 0], [0, 2.0]]).values.typecode == "d"
@@ -0,0 +1,93 @@
+# tests/test_tiledmatrix.py
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from matrix import Matrix
+from tiledmatrix import TiledMatrix
+from operations.adder import add_matrices
+from operations.subtractor import subtract_matrices
+from operations.multiplier import multiply_matrices
+from operations.transpose import transpose_matrix
+
+
+@pytest.fixture
+def operands():
+    rng = np.random.default_rng(0)
+    a, b = rng.random((37, 23)), rng.integers(-5, 5, (23, 19))
+    return a, b, TiledMatrix.from_matrix(a, tile_shape=(5, 7)), TiledMatrix.from_matrix(b, tile_shape=(7, 4))
+
+
+def test_elementwise_and_transpose(operands):
+    a, _, ta, _ = operands
+    other = np.arange(a.size, dtype=float).reshape(a.shape)
+    assert np.allclose(add_matrices(ta, TiledMatrix.from_matrix(other, tile_shape=(4, 9))).to_array(), a + other)
+    assert np.allclose(subtract_matrices(ta, Matrix(other)).to_array(), a - other)
+    assert np.array_equal(transpose_matrix(ta).to_array(), a.T)
+
+
+@pytest.mark.parametrize("budget", [None, 8000, 40000])
+def test_multiply_within_budget(operands, budget):
+    a, b, ta, tb = operands
+    assert np.allclose(multiply_matrices(ta, tb, memory_budget=budget).to_array(), a @ b)
+    assert np.allclose(multiply_matrices(Matrix(a), tb, memory_budget=budget).to_array(), a @ b)
+    gram = multiply_matrices(transpose_matrix(ta), ta, memory_budget=budget)
+    assert np.allclose(gram.to_array(), a.T @ a)
+
+
+def test_int_gram_is_exact(operands):
+    _, b, _, tb = operands
+    gram = multiply_matrices(transpose_matrix(tb), tb)
+    assert gram.dtype == np.int64
+    assert np.array_equal(gram.to_array(), b.T @ b)
+
+
+def test_budget_too_small(operands):
+    _, _, ta, tb = operands
+    with pytest.raises(ValueError):
+        multiply_matrices(ta, tb, memory_budget=16)
+
+
+def test_open_read_only_and_temp_cleanup(tmp_path, operands):
+    a, _, _, _ = operands
+    path = str(tmp_path / "x")
+    TiledMatrix.from_matrix(a, path, tile_shape=(8, 8))
+    opened = TiledMatrix.open(path)
+    assert np.array_equal(opened.to_array(), a)
+    with pytest.raises(ValueError):
+        opened.write_block(0, 0, a[:1, :1])
+    result = multiply_matrices(transpose_matrix(opened), opened)
+    scratch = result.path
+    del result
+    assert not os.path.exists(scratch)
+
+
+def test_from_csv(tmp_path):
+    csv = tmp_path / "a.csv"
+    csv.write_text("h1,h2,h3\n1,2,3\n4,,6.5\n\n7,8,9\n")
+    t = TiledMatrix.from_csv(str(csv), skip_header=True, tile_shape=(2, 2), chunk_size=2)
+    assert t.to_array().tolist() == [[1, 2, 3], [4, 0, 6.5], [7, 8, 9]]
+
+
+@pytest.mark.parametrize("budget", [None, 8000])
+def test_int_multiply_never_wraps(budget):
+    big = np.full((6, 5), 2 ** 31, dtype=np.int64)
+    tiled = TiledMatrix.from_matrix(big, tile_shape=(4, 3))
+    exact = 5 * 2.0 ** 62   # 5 · (2**31)² > 2**63, persis di float64
+    for product in (multiply_matrices(tiled, transpose_matrix(tiled), memory_budget=budget),
+                    multiply_matrices(transpose_matrix(transpose_matrix(tiled)), Matrix(big.T),
+                                      memory_budget=budget)):
+        assert product.dtype == np.float64
+        assert (product.to_array() == exact).all()
+    gram = multiply_matrices(transpose_matrix(tiled), tiled, memory_budget=budget)
+    assert gram.dtype == np.float64 and (gram.to_array() > 0).all()
+
+
+def test_small_int32_operands_accumulate_in_int64():
+    a = np.full((4, 4), 2 ** 20, dtype=np.int32)
+    tiled = TiledMatrix.from_matrix(a, tile_shape=(2, 2))
+    product = multiply_matrices(tiled, tiled)
+    assert product.dtype == np.int64
+    assert (product.to_array() == 4 * 2 ** 40).all()
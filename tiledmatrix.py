@@ -0,0 +1,325 @@
+# tiledmatrix.py
+"""
+TiledMatrix: matriks dense di disk (out-of-core) yang dipecah menjadi tile
+berukuran tetap. Setiap tile adalah file .mtxb dense biasa (lihat
+exporters/binary_exporter.py) yang dibuka lewat np.memmap, sehingga hanya
+halaman yang sedang dibaca/ditulis yang berada di memori dan OS bebas
+membuang halaman bersih kapan saja.
+
+Struktur direktori:
+    tiles.json       : {"rows", "cols", "tile_rows", "tile_cols", "dtype"}
+    r{i}_c{j}.mtxb   : tile baris ke-i, kolom ke-j (tile tepi boleh lebih kecil)
+
+Operasi (add_matrices, subtract_matrices, transpose_matrix,
+multiply_matrices) mengenali TiledMatrix dan memakai kernel di
+operations/tiled_kernels.py: hasil ditulis tile demi tile ke direktori
+scratch dengan working set dibatasi memory_budget(). transpose() hanya
+membuat view (tile (i, j) view = transpose tile (j, i) sumber), tanpa
+menyalin data. inverse / determinan tidak didukung untuk TiledMatrix.
+
+    X = TiledMatrix.from_csv("desain.csv", "/data/desain.tiles", skip_header=True)
+    set_memory_budget(48 * 2**30)
+    xtx = multiply_matrices(transpose_matrix(X), X)   # X dibaca dari disk sekali
+
+Membutuhkan numpy.
+"""
+
+from collections import OrderedDict
+import json
+import os
+import shutil
+import tempfile
+import weakref
+
+from matrix import Matrix, np
+from exporters.binary_exporter import HEADER, HEADER_SIZE, MAGIC, VERSION
+
+META_FILE = "tiles.json"
+DEFAULT_TILE_SIZE = 1024
+DEFAULT_MEMORY_BUDGET = 1 << 30
+# Jumlah memmap tile yang dibiarkan terbuka per matriks (masing-masing memegang satu fd)
+MAX_OPEN_TILES = 256
+
+_memory_budget = DEFAULT_MEMORY_BUDGET
+_scratch_dir = None
+
+
+def set_memory_budget(nbytes):
+    """Batas byte working set kernel tiled (blok operand + akumulator yang disalin ke RAM)."""
+    global _memory_budget
+    if nbytes <= 0:
+        raise ValueError("Memory budget harus lebih besar dari 0.")
+    _memory_budget = int(nbytes)
+
+
+def memory_budget():
+    return _memory_budget
+
+
+def set_scratch_dir(path):
+    """Direktori induk untuk TiledMatrix hasil operasi (None = direktori temp sistem)."""
+    global _scratch_dir
+    if path:
+        os.makedirs(path, exist_ok=True)
+    _scratch_dir = path
+
+
+def is_tiled(matrix):
+    return isinstance(matrix, TiledMatrix)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("TiledMatrix membutuhkan numpy.")
+
+
+def _tile_name(i, j):
+    return f"r{i}_c{j}.mtxb"
+
+
+class TiledMatrix:
+    """
+    Matriks dense rows × cols yang disimpan per tile (tile_rows × tile_cols) di `path`.
+    Buat dengan TiledMatrix.create / from_matrix / from_row_chunks / from_csv,
+    atau buka direktori yang sudah ada dengan TiledMatrix.open.
+    """
+    backend = "tiled"
+
+    def __init__(self, path, rows, cols, tile_rows, tile_cols, dtype, transposed=False,
+                 writable=True, temporary=False, _tiles=None):
+        _require_numpy()
+        self.path = path
+        self.rows, self.cols = rows, cols
+        self.tile_rows, self.tile_cols = tile_rows, tile_cols
+        self.dtype = np.dtype(dtype)
+        self.transposed = transposed
+        self.writable = writable
+        # LRU memmap tile, dibagi bersama view transpose (kunci = indeks tile di penyimpanan)
+        self._tiles = OrderedDict() if _tiles is None else _tiles
+        self._finalizer = weakref.finalize(self, shutil.rmtree, path, True) if temporary else None
+
+    # ------------------------------------------------------------
+    # Pembuatan / pembukaan
+    # ------------------------------------------------------------
+    @classmethod
+    def create(cls, rows, cols, path=None, tile_shape=None, dtype="float64"):
+        """
+        Buat TiledMatrix berisi nol. path=None → direktori sementara di scratch dir
+        yang dihapus saat objek tidak dipakai lagi.
+        """
+        _require_numpy()
+        tile_rows, tile_cols = tile_shape or (DEFAULT_TILE_SIZE, DEFAULT_TILE_SIZE)
+        if rows < 0 or cols < 0 or tile_rows <= 0 or tile_cols <= 0:
+            raise ValueError("Ukuran matriks dan tile harus positif.")
+        dtype = np.dtype(dtype)
+        if dtype.kind not in "iuf":
+            raise ValueError(f"dtype TiledMatrix harus int atau float, bukan {dtype}.")
+        dtype = np.dtype(np.int64 if dtype.kind in "iu" else np.float64)
+
+        temporary = path is None
+        if temporary:
+            path = tempfile.mkdtemp(prefix="tiled-", dir=_scratch_dir)
+        else:
+            os.makedirs(path, exist_ok=True)
+        meta = {"rows": rows, "cols": cols, "tile_rows": tile_rows, "tile_cols": tile_cols,
+                "dtype": dtype.char}
+        with open(os.path.join(path, META_FILE), "w") as f:
+            json.dump(meta, f)
+
+        typecode = b"q" if dtype.kind == "i" else b"d"
+        for i in range(-(-rows // tile_rows)):
+            h = min(tile_rows, rows - i * tile_rows)
+            for j in range(-(-cols // tile_cols)):
+                w = min(tile_cols, cols - j * tile_cols)
+                with open(os.path.join(path, _tile_name(i, j)), "wb") as f:
+                    f.write(HEADER.pack(MAGIC, VERSION, 0, typecode, h, w, 0).ljust(HEADER_SIZE, b"\0"))
+                    # File sparse: isi nol tanpa benar-benar menulis data
+                    f.truncate(HEADER_SIZE + 8 * h * w)
+        return cls(path, rows, cols, tile_rows, tile_cols, dtype, temporary=temporary)
+
+    @classmethod
+    def open(cls, path, writable=False):
+        """Buka TiledMatrix yang sudah ada di direktori `path` (default hanya-baca)."""
+        meta_path = os.path.join(path, META_FILE)
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(meta_path)
+        with open(meta_path) as f:
+            meta = json.load(f)
+        return cls(path, meta["rows"], meta["cols"], meta["tile_rows"], meta["tile_cols"],
+                   meta["dtype"], writable=writable)
+
+    @classmethod
+    def from_matrix(cls, matrix, path=None, tile_shape=None):
+        """Salin Matrix / ndarray (yang muat di memori) ke TiledMatrix."""
+        _require_numpy()
+        array = matrix if isinstance(matrix, np.ndarray) else matrix.to_array()
+        result = cls.create(array.shape[0], array.shape[1], path, tile_shape, array.dtype)
+        result.write_block(0, 0, array)
+        result.flush()
+        return result
+
+    @classmethod
+    def from_row_chunks(cls, chunks, rows, cols, path=None, tile_shape=None, dtype="float64"):
+        """
+        Tulis TiledMatrix dari iterator potongan baris (ndarray / list of lists)
+        secara berurutan; hanya satu potongan yang berada di memori.
+        """
+        result = cls.create(rows, cols, path, tile_shape, dtype)
+        r = 0
+        for chunk in chunks:
+            block = np.asarray(chunk, dtype=result.dtype)
+            if block.size == 0:
+                continue
+            if block.ndim != 2 or block.shape[1] != cols or r + block.shape[0] > rows:
+                raise ValueError("Potongan baris tidak sesuai dengan ukuran TiledMatrix.")
+            result.write_block(r, 0, block)
+            r += block.shape[0]
+        if r != rows:
+            raise ValueError(f"Jumlah baris potongan ({r}) tidak sama dengan rows ({rows}).")
+        result.flush()
+        return result
+
+    @classmethod
+    def from_csv(cls, csv_path, path=None, delimiter=None, skip_header=False, tile_shape=None,
+                 chunk_size=None):
+        """
+        Muat CSV numerik yang lebih besar dari RAM langsung ke tile (sel kosong = 0).
+        File dibaca dua kali: lintasan pertama hanya menghitung baris dan lebar,
+        lintasan kedua mem-parse per chunk dan menulisnya ke tile.
+        """
+        from utilities import csv_stream
+
+        chunk_size = chunk_size or csv_stream.DEFAULT_CHUNK_SIZE
+        rows = cols = 0
+        for chunk in csv_stream.iter_row_chunks(csv_path, delimiter, skip_header, chunk_size):
+            chunk = [row for row in chunk if any(map(str.strip, row))]
+            rows += len(chunk)
+            cols = max([cols, *map(len, chunk)])
+
+        def blocks():
+            for chunk in csv_stream.iter_row_chunks(csv_path, delimiter, skip_header, chunk_size):
+                state = csv_stream.StreamState()
+                state.feed(chunk)
+                if state.n_rows == 0:
+                    continue
+                block = np.zeros((state.n_rows, cols))
+                for c, col in state.columns.items():
+                    if not col.numeric:
+                        raise ValueError(f"Kolom {c}: TiledMatrix.from_csv hanya mendukung kolom numerik.")
+                    block[:, c] = np.frombuffer(col.values, dtype=col.values.typecode)
+                yield block
+
+        return cls.from_row_chunks(blocks(), rows, cols, path, tile_shape)
+
+    # ------------------------------------------------------------
+    # Akses tile
+    # ------------------------------------------------------------
+    @property
+    def shape(self):
+        return (self.rows, self.cols)
+
+    @property
+    def tile_shape(self):
+        return (self.tile_rows, self.tile_cols)
+
+    @property
+    def grid(self):
+        """Jumlah tile (baris, kolom)."""
+        return (-(-self.rows // self.tile_rows), -(-self.cols // self.tile_cols))
+
+    def _stored_tile(self, i, j):
+        tile = self._tiles.get((i, j))
+        if tile is None:
+            # Bentuk di penyimpanan (sebelum transpose view)
+            if self.transposed:
+                rows, cols, tr, tc = self.cols, self.rows, self.tile_cols, self.tile_rows
+            else:
+                rows, cols, tr, tc = self.rows, self.cols, self.tile_rows, self.tile_cols
+            h = min(tr, rows - i * tr)
+            w = min(tc, cols - j * tc)
+            tile = np.memmap(os.path.join(self.path, _tile_name(i, j)), dtype=self.dtype.newbyteorder("<"),
+                             mode="r+" if self.writable else "r", offset=HEADER_SIZE, shape=(h, w))
+            self._tiles[(i, j)] = tile
+            if len(self._tiles) > MAX_OPEN_TILES:
+                _, evicted = self._tiles.popitem(last=False)
+                evicted.flush()
+        else:
+            self._tiles.move_to_end((i, j))
+        return tile
+
+    def tile(self, i, j):
+        """Tile (i, j) sebagai ndarray ber-memmap (view; bisa ditulis bila writable)."""
+        if self.transposed:
+            return self._stored_tile(j, i).T
+        return self._stored_tile(i, j)
+
+    def read_block(self, r0, r1, c0, c1):
+        """Salin blok [r0:r1, c0:c1] dari tile-tile yang beririsan ke ndarray baru."""
+        out = np.empty((r1 - r0, c1 - c0), dtype=self.dtype)
+        tr, tc = self.tile_rows, self.tile_cols
+        for i in range(r0 // tr, -(-r1 // tr)):
+            top = i * tr
+            a0, a1 = max(r0, top), min(r1, top + tr)
+            for j in range(c0 // tc, -(-c1 // tc)):
+                left = j * tc
+                b0, b1 = max(c0, left), min(c1, left + tc)
+                out[a0 - r0:a1 - r0, b0 - c0:b1 - c0] = self.tile(i, j)[a0 - top:a1 - top, b0 - left:b1 - left]
+        return out
+
+    def write_block(self, r0, c0, block):
+        """Tulis ndarray `block` mulai posisi (r0, c0) ke tile-tile yang beririsan."""
+        if not self.writable:
+            raise ValueError("TiledMatrix dibuka hanya-baca (gunakan open(path, writable=True)).")
+        r1, c1 = r0 + block.shape[0], c0 + block.shape[1]
+        if r1 > self.rows or c1 > self.cols:
+            raise ValueError("Blok melewati batas TiledMatrix.")
+        tr, tc = self.tile_rows, self.tile_cols
+        for i in range(r0 // tr, -(-r1 // tr)):
+            top = i * tr
+            a0, a1 = max(r0, top), min(r1, top + tr)
+            for j in range(c0 // tc, -(-c1 // tc)):
+                left = j * tc
+                b0, b1 = max(c0, left), min(c1, left + tc)
+                self.tile(i, j)[a0 - top:a1 - top, b0 - left:b1 - left] = block[a0 - r0:a1 - r0, b0 - c0:b1 - c0]
+
+    def get_value(self, row, col):
+        value = self.tile(row // self.tile_rows, col // self.tile_cols)[row % self.tile_rows, col % self.tile_cols]
+        return value.item()
+
+    def flush(self):
+        """Pastikan semua tile terbuka yang pernah ditulis sudah sampai ke file."""
+        if self.writable:
+            for tile in self._tiles.values():
+                tile.flush()
+
+    # ------------------------------------------------------------
+    # Konversi
+    # ------------------------------------------------------------
+    def transpose(self):
+        """View transpose tanpa salinan (memakai file tile yang sama)."""
+        view = TiledMatrix(self.path, self.cols, self.rows, self.tile_cols, self.tile_rows,
+                           self.dtype, not self.transposed, self.writable, _tiles=self._tiles)
+        # View menjaga sumber (dan direktori sementaranya) tetap hidup
+        view._source = self
+        return view
+
+    def to_array(self):
+        """Seluruh isi sebagai ndarray di memori (hanya untuk matriks yang muat di RAM)."""
+        return self.read_block(0, self.rows, 0, self.cols)
+
+    def to_matrix(self):
+        """Seluruh isi sebagai Matrix backend numpy (hanya untuk matriks yang muat di RAM)."""
+        return Matrix(self.to_array())
+
+    def delete(self):
+        """Hapus direktori tile (view transpose ikut tidak valid)."""
+        self._tiles.clear()
+        if self._finalizer is not None:
+            self._finalizer()
+        else:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def __repr__(self):
+        view = ", transposed" if self.transposed else ""
+        return (f"TiledMatrix({self.rows}x{self.cols}, tile={self.tile_rows}x{self.tile_cols}, "
+                f"dtype={self.dtype}{view}, path={self.path!r})")
@@ -3,5 +3,7 @@ from .formatter import to_string, print_matrix
 from validators.is_square import is_square
 from validators.is_symmetric import is_symmetric
 from validators.is_identity import is_identity
+from validators.is_diagonal import is_diagonal
+from validators.is_triangular import is_triangular
 
-__all__ = ["to_string", "print_matrix", "is_square", "is_symmetric","is_identity"]
+__all__ = ["to_string", "print_matrix", "is_square", "is_symmetric","is_identity", "is_diagonal", "is_triangular"]
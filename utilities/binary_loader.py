@@ -0,0 +1,70 @@
+# matriks/utilities/binary_loader.py
+"""
+Loader file biner .mtxb (lihat exporters/binary_exporter.py).
+
+File di-memory-map sehingga membuka matriks dense berbiaya O(1): buffer numpy
+Matrix langsung menunjuk ke halaman file dan halaman baru dimuat OS saat
+bagian tersebut dibaca (mis. m.to_array()[1000:2000]). Tanpa numpy, atau
+untuk SparseMatrix, array dibaca dari mmap tanpa parsing teks.
+"""
+
+from array import array
+import mmap
+import os
+import sys
+
+from matrix import Matrix, np
+from sparsematrix import SparseMatrix
+from exporters.binary_exporter import FLAG_SPARSE, HEADER, HEADER_SIZE, MAGIC, VERSION
+
+
+def _read_header(buffer, path):
+    if len(buffer) < HEADER_SIZE:
+        raise ValueError(f"File {path} bukan file matriks biner (.mtxb).")
+    magic, version, flags, typecode, rows, cols, nnz = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError(f"File {path} bukan file matriks biner (.mtxb).")
+    if version != VERSION:
+        raise ValueError(f"Versi format .mtxb tidak didukung: {version}")
+    return flags, typecode.decode(), rows, cols, nnz
+
+
+def _array_from(buffer, typecode, offset, count):
+    arr = array(typecode)
+    arr.frombytes(buffer[offset:offset + 8 * count])
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr
+
+
+def load_matrix_from_binary(path: str):
+    """Buka file .mtxb sebagai Matrix (dense, di-mmap) atau SparseMatrix (CSR)."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"File {path} bukan file matriks biner (.mtxb).")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    flags, typecode, rows, cols, nnz = _read_header(buffer, path)
+
+    if flags & FLAG_SPARSE:
+        offset = HEADER_SIZE
+        indptr = _array_from(buffer, "q", offset, rows + 1)
+        offset += 8 * (rows + 1)
+        indices = _array_from(buffer, "q", offset, nnz)
+        offset += 8 * nnz
+        values = _array_from(buffer, typecode, offset, nnz)
+        buffer.close()
+        return SparseMatrix.from_compressed(indptr, indices, values, shape=(rows, cols))
+
+    if np is not None:
+        dtype = np.dtype("<i8" if typecode == "q" else "<f8")
+        data = np.frombuffer(buffer, dtype=dtype, count=rows * cols, offset=HEADER_SIZE)
+        return Matrix(data.reshape(rows, cols))
+
+    # Tanpa numpy: buffer flat langsung menjadi Matrix backend array
+    flat = _array_from(buffer, typecode, HEADER_SIZE, rows * cols)
+    buffer.close()
+    return Matrix.from_flat(flat, rows, cols)
@@ -0,0 +1,138 @@
+# matriks/utilities/column_stats.py
+"""
+Statistik kolom untuk imputasi / normalisasi loader CSV, langsung di atas
+buffer kolom array('q') / array('d').
+
+ - summarize(): n, mean, varians populasi, min, max dalam satu lintasan
+   (Welford); dengan numpy dihitung tervektorisasi atas view buffer tanpa salinan
+ - median(): seleksi waktu linear (np.partition / quickselect), bukan sort penuh
+ - minmax_scale() / zscore_scale(): hasil array('d') baru, ditulis
+   langsung lewat ufunc numpy bila tersedia
+ - fill(): isi sel kosong (indeks baris) dengan satu nilai, in-place
+"""
+
+from array import array
+from collections import namedtuple
+import random
+
+from matrix import np
+
+ColumnStats = namedtuple("ColumnStats", ["n", "mean", "variance", "minimum", "maximum"])
+
+
+def _view(values):
+    """View ndarray atas buffer array (tanpa salinan)."""
+    return np.frombuffer(values, dtype=values.typecode)
+
+
+def _item(x):
+    return x.item() if hasattr(x, "item") else x
+
+
+def present(values, missing):
+    """Nilai tanpa sel kosong (`missing` = indeks baris)."""
+    if not missing:
+        return values
+    if np is not None:
+        kept = np.delete(_view(values), np.frombuffer(missing, dtype=np.int64))
+        return array(values.typecode, kept.tobytes())
+    skip = set(missing)
+    return array(values.typecode, (v for i, v in enumerate(values) if i not in skip))
+
+
+def summarize(values):
+    """ColumnStats dari satu lintasan atas `values` (kolom kosong → n = 0, sisanya None)."""
+    n = len(values)
+    if n == 0:
+        return ColumnStats(0, None, None, None, None)
+    if np is not None:
+        arr = _view(values)
+        return ColumnStats(n, float(arr.mean()), float(arr.var()), _item(arr.min()), _item(arr.max()))
+
+    # Welford: mean dan M2 diperbarui per nilai, stabil untuk nilai besar
+    mean = m2 = 0.0
+    mn = mx = values[0]
+    count = 0
+    for x in values:
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += delta * (x - mean)
+        if x < mn:
+            mn = x
+        elif x > mx:
+            mx = x
+    return ColumnStats(n, mean, m2 / n, mn, mx)
+
+
+def _select(data, k):
+    """Nilai terkecil ke-k (0-based) dengan quickselect (rata-rata O(n))."""
+    while True:
+        pivot = data[random.randrange(len(data))]
+        lows = [x for x in data if x < pivot]
+        if k < len(lows):
+            data = lows
+            continue
+        n_equal = len(data) - len(lows) - sum(1 for x in data if x > pivot)
+        if k < len(lows) + n_equal:
+            return pivot
+        k -= len(lows) + n_equal
+        data = [x for x in data if x > pivot]
+
+
+def median(values):
+    """Median (rata-rata dua nilai tengah untuk n genap) seperti statistics.median."""
+    n = len(values)
+    if n == 0:
+        raise ValueError("Median dari kolom kosong tidak terdefinisi.")
+    mid = n // 2
+    if np is not None:
+        kth = [mid - 1, mid] if n % 2 == 0 else [mid]
+        part = np.partition(_view(values), kth)
+        if n % 2:
+            return _item(part[mid])
+        return (_item(part[mid - 1]) + _item(part[mid])) / 2
+    if n % 2:
+        return _select(values, mid)
+    return (_select(values, mid - 1) + _select(values, mid)) / 2
+
+
+def fill(values, missing, value):
+    """Isi values[r] = value untuk setiap r di `missing` (in-place)."""
+    if not missing:
+        return
+    if np is not None:
+        _view(values)[np.frombuffer(missing, dtype=np.int64)] = value
+        return
+    for r in missing:
+        values[r] = value
+
+
+def _scaled(values, offset, scale):
+    """array('d') berisi (x - offset) / scale."""
+    n = len(values)
+    out = array("d", bytes(8 * n))
+    if np is not None:
+        view = np.frombuffer(out, dtype=np.float64)
+        np.subtract(_view(values), offset, out=view)
+        view /= scale
+        return out
+    for i, x in enumerate(values):
+        out[i] = (x - offset) / scale
+    return out
+
+
+def minmax_scale(values, stats=None):
+    """Normalisasi Min-Max ke [0, 1]; kolom konstan menjadi 0.0."""
+    stats = stats or summarize(values)
+    if stats.n == 0 or stats.maximum == stats.minimum:
+        return array("d", bytes(8 * stats.n))
+    return _scaled(values, stats.minimum, stats.maximum - stats.minimum)
+
+
+def zscore_scale(values, stats=None):
+    """Normalisasi Z-Score (deviasi standar populasi); kolom konstan menjadi 0.0."""
+    stats = stats or summarize(values)
+    if stats.n == 0 or stats.variance == 0:
+        return array("d", bytes(8 * stats.n))
+    return _scaled(values, stats.mean, stats.variance ** 0.5)
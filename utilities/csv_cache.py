@@ -0,0 +1,115 @@
+# matriks/utilities/csv_cache.py
+"""
+Cache sidecar hasil load_matrix_from_csv dalam format biner .mtxb.
+
+Kunci = BLAKE2b atas path absolut file CSV, penanda versi file dan semua
+argumen loader yang mempengaruhi hasil (delimiter, skip_header,
+selected_columns, drop_non_numeric, impute_strategy, normalize, as_sparse,
+sparse_threshold, mode streaming). Penanda versi file:
+ - "mtime": ukuran + st_mtime_ns (murah, default)
+ - "hash" : BLAKE2b isi file (tahan terhadap touch / salin ulang dengan isi sama)
+
+Hit = file .mtxb dibuka lewat mmap (lihat utilities/binary_loader.py) lalu
+dikembalikan ke backend yang diminta, sehingga load hangat berbiaya kira-kira
+sama dengan membaca buffer dari disk. Miss = CSV di-parse seperti biasa lalu
+hasilnya ditulis atomik (file sementara + os.replace) ke direktori cache.
+Backend tidak menjadi bagian kunci: satu entry melayani 'list', 'numpy' dan
+'array'. Entry lama (file CSV sudah berubah) tidak pernah dibaca lagi dan
+boleh dihapus kapan saja.
+"""
+
+import hashlib
+import os
+import tempfile
+
+from matrix import Matrix, np
+from exporters.binary_exporter import write_binary
+from .binary_loader import load_matrix_from_binary
+from . import profiler
+
+FORMAT_VERSION = 1
+VALIDATE_MODES = ("mtime", "hash")
+_HASH_BLOCK = 1 << 20
+
+
+def _file_token(path, validate):
+    st = os.stat(path)
+    if validate == "mtime":
+        return f"{st.st_size}:{st.st_mtime_ns}"
+    if validate == "hash":
+        h = hashlib.blake2b(digest_size=20)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+                h.update(block)
+        return f"{st.st_size}:{h.hexdigest()}"
+    raise ValueError(f"Mode validasi cache tidak dikenal: {validate} (pilih {', '.join(VALIDATE_MODES)})")
+
+
+def cache_key(path, options, validate="mtime"):
+    """Kunci entry cache (hex) untuk file `path` dan dict argumen loader `options`."""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"csv-cache:{FORMAT_VERSION}|{os.path.abspath(path)}|{_file_token(path, validate)}".encode())
+    for name in sorted(options):
+        h.update(f"|{name}={options[name]!r}".encode())
+    return h.hexdigest()
+
+
+def entry_path(cache_dir, key):
+    return os.path.join(cache_dir, f"{key}.mtxb")
+
+
+def restore_backend(matrix, backend=None, streaming=False, normalized=False):
+    """
+    Matrix dari .mtxb ber-buffer numpy (bila tersedia) atau array flat; kembalikan
+    ke backend yang akan dihasilkan loader. Untuk backend 'list' tipe per nilai
+    disamakan dengan loader (pecahan bulat → int kecuali hasil normalisasi).
+    """
+    if not isinstance(matrix, Matrix):
+        return matrix
+    if backend is None:
+        backend = "numpy" if streaming and np is not None else "list"
+    if backend == "numpy":
+        return matrix if matrix.backend == "numpy" else Matrix.from_array(matrix.data)
+    if backend == "array":
+        return matrix.to_compact()
+    rows = matrix.to_array().tolist() if matrix.backend == "numpy" else matrix.data
+    if normalized:
+        return Matrix([[float(v) for v in row] for row in rows])
+    return Matrix([[int(v) if float(v).is_integer() else v for v in row] for row in rows])
+
+
+def lookup(cache_dir, key):
+    """Buka entry cache; None jika belum ada atau rusak (file rusak dihapus)."""
+    path = entry_path(cache_dir, key)
+    try:
+        return load_matrix_from_binary(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+
+def store(cache_dir, key, matrix):
+    """Tulis hasil loader ke cache secara atomik; matriks kosong tidak disimpan."""
+    if matrix.rows == 0 or matrix.cols == 0:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write_binary(f, matrix)
+        os.replace(tmp, entry_path(cache_dir, key))
+    except Exception as e:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        # Bilangan bulat di luar int64 tidak bisa disimpan persis di .mtxb: lewati cache
+        if isinstance(e, OverflowError):
+            return
+        raise
+    profiler.count("csv_cache_writes")
@@ -2,80 +2,42 @@
 """
 Loader CSV yang mengubah CSV menjadi Matrix atau SparseMatrix.
 Fitur:
- - detect kolom numerik otomatis (atau gunakan selected_columns)
+ - detect kolom numerik otomatis dari sampel (atau gunakan selected_columns / schema)
  - skip header
  - imputasi: 'zero' | 'mean' | 'median' | 'drop'
  - normalisasi: None | 'minmax' | 'zscore'
+   (dihitung atas buffer kolom numerik, lihat utilities/column_stats.py)
  - opsi paksa as_sparse atau threshold otomatis
+ - backend penyimpanan Matrix: 'list' | 'numpy' (buffer kontigu) | 'array' (array flat tanpa numpy)
+ - mode streaming: baca per chunk, memori puncak ≈ ukuran matriks output
+ - workers > 1: parsing paralel per rentang byte, hasil identik dengan serial
+ - cache_dir: hasil disimpan sebagai sidecar .mtxb; load berikutnya cukup membuka buffer
 """
 
-from typing import List, Optional, Union, Iterable
+from typing import Dict, List, Optional, Union, Iterable
 import csv
 import os
-import statistics
 
 from matrix import Matrix
 from sparsematrix import SparseMatrix
-
-# Tipe data untuk angka
-Number = Union[int, float]
-
-# ------------------------------------------------------------
-# Fungsi bantuan: mencoba mengubah string menjadi angka jika memungkinkan
-# ------------------------------------------------------------
-def _to_number_if_possible(s: str) -> Optional[Number]:
-    s = s.strip()
-    if s == "":
-        return None
-    try:
-        return int(s)    # coba konversi ke int
-    except ValueError:
-        try:
-            return float(s)  # jika gagal, coba konversi ke float
-        except ValueError:
-            return None  # jika gagal juga, berarti bukan angka
+from . import csv_stream
+from . import csv_parallel
+from . import csv_cache
+from . import profiler
 
 # ------------------------------------------------------------
-# Cek apakah kolom adalah kolom numerik
+# Membaca seluruh baris data CSV sekaligus (mode biasa)
 # ------------------------------------------------------------
-def _is_column_numeric(col_values: List[str]) -> bool:
-    # Ambil nilai yang tidak kosong
-    non_empty = [v for v in col_values if v.strip() != ""]
-    if not non_empty:
-        return False
-    # Jika setiap nilai tak kosong dapat dikonversi ke angka → kolom dianggap numerik
-    return all(_to_number_if_possible(v) is not None for v in non_empty)
-
-# ------------------------------------------------------------
-# Membaca baris CSV dan memisahkan header jika ada
-# ------------------------------------------------------------
-def _parse_rows(path: str, delimiter: Optional[str], skip_header: bool):
-    if not os.path.exists(path):
-        raise FileNotFoundError(path)
-
+def _parse_rows(path: str, delimiter: Optional[str], skip_header: bool,
+                selected: Optional[List[int]], schema: Dict[int, str]) -> csv_stream.StreamState:
     with open(path, newline='') as f:
         reader = csv.reader(f, delimiter=delimiter) if delimiter else csv.reader(f)
         rows = list(reader)
 
-    if not rows:
-        return [], []
-
-    header = []
-    start = 0
-
     # Jika skip_header = True → baris pertama dianggap header
-    if skip_header:
-        header = [h.strip() for h in rows[0]]
-        start = 1
-
-    # Buang baris kosong
-    data_rows = [r for r in rows[start:] if any(cell.strip() != "" for cell in r)]
-
-    # Pastikan semua baris memiliki panjang yang sama
-    maxlen = max((len(r) for r in data_rows), default=0)
-    data_rows = [r + [""] * (maxlen - len(r)) for r in data_rows]
-
-    return header, data_rows
+    state = csv_stream.StreamState(selected, schema)
+    state.feed(rows[1:] if skip_header else rows)
+    return state
 
 # ------------------------------------------------------------
 # Memilih kolom berdasarkan nama (jika header) atau indeks
@@ -96,71 +58,83 @@ def _select_columns_by_names_or_indices(header: List[str], selected: Optional[It
     return sel_indices
 
 # ------------------------------------------------------------
-# Konversi kolom ke angka + imputasi nilai kosong
+# Skema kolom: {nama / indeks: 'int' | 'float' | 'skip'}
 # ------------------------------------------------------------
-def _convert_and_impute(columns: List[List[str]], strategy: str) -> List[Optional[List[Number]]]:
-    numeric_cols = [[_to_number_if_possible(v) for v in col] for col in columns]
-    result = []
-
-    for conv in numeric_cols:
-        non_null = [v for v in conv if v is not None]
-
-        # Jika strategi = drop dan ada nilai kosong → drop kolom
-        if strategy == "drop" and any(v is None for v in conv):
-            result.append(None)
-            continue
-
-        # Tentukan nilai pengganti (fill)
-        if strategy == "zero":
-            fill = 0
-        elif strategy == "mean":
-            fill = statistics.mean(non_null) if non_null else 0
-        elif strategy == "median":
-            fill = statistics.median(non_null) if non_null else 0
-        else:
-            raise ValueError(f"Unknown impute strategy: {strategy}")
+SCHEMA_TYPES = {"int": "int", "float": "float", "skip": "skip", int: "int", float: "float"}
 
-        # Ganti nilai None dengan nilai imputasi
-        filled = [v if v is not None else fill for v in conv]
 
-        # Jika float tapi angkanya bulat → ubah ke int
-        casted = [int(round(x)) if isinstance(x, float) and abs(x - int(x)) < 1e-9 else x for x in filled]
-        result.append(casted)
+def _resolve_schema(header: List[str], schema: Optional[Dict[Union[int, str], object]]) -> Dict[int, str]:
+    resolved = {}
+    for column, kind in (schema or {}).items():
+        try:
+            kind = SCHEMA_TYPES[kind]
+        except (KeyError, TypeError):
+            raise ValueError(f"Tipe skema kolom '{column}' tidak dikenal: {kind!r} (pilih int, float atau skip).")
+        if isinstance(column, str) and column in header:
+            index = header.index(column)
+        elif isinstance(column, int) or (isinstance(column, str) and column.isdigit()):
+            index = int(column)
+        else:
+            raise ValueError(f"Kolom skema '{column}' tidak ditemukan di header.")
+        if index < 0:
+            raise ValueError(f"Indeks kolom skema harus >= 0: {index}")
+        resolved[index] = kind
+    return resolved
 
-    return result
 
 # ------------------------------------------------------------
-# Transpose kolom menjadi baris
+# Parsing bertipe ke buffer kolom (lihat utilities/csv_stream.py)
 # ------------------------------------------------------------
-def _transpose(cols: List[List[Number]]) -> List[List[Number]]:
-    if not cols:
-        return []
-    return [[cols[c][r] for c in range(len(cols))] for r in range(len(cols[0]))]
+def _resolve_columns(path, delimiter, skip_header, selected_columns, schema):
+    """(indeks kolom terpilih atau None, skema per indeks) dari nama / indeks."""
+    header = csv_stream.read_header(path, delimiter) if skip_header and (selected_columns or schema) else []
+    order = None
+    if selected_columns:
+        order = _select_columns_by_names_or_indices(header, selected_columns) if skip_header \
+            else list(map(int, selected_columns))
+    return order, _resolve_schema(header, schema)
 
-# ------------------------------------------------------------
-# Normalisasi Min-Max
-# ------------------------------------------------------------
-def _minmax_scale(cols: List[List[Number]]) -> List[List[Number]]:
-    scaled = []
-    for col in cols:
-        mn, mx = min(col), max(col)
-        scaled.append([0.0 if mx == mn else (x - mn) / (mx - mn) for x in col])
-    return scaled
 
-# ------------------------------------------------------------
-# Normalisasi Z-Score
-# ------------------------------------------------------------
-def _zscore_scale(cols: List[List[Number]]) -> List[List[Number]]:
-    scaled = []
-    for col in cols:
-        mu = statistics.mean(col)
-        stdev = statistics.pstdev(col)
-        scaled.append([0.0 if stdev == 0 else (x - mu) / stdev for x in col])
-    return scaled
+def _load(path, delimiter, skip_header, selected_columns, drop_non_numeric, impute_strategy,
+          normalize, as_sparse, sparse_threshold, backend, streaming, chunk_size, workers, schema):
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    workers = workers or 1
+    if not streaming and workers <= 1:
+        backend = backend or "list"
+
+    if selected_columns is not None:
+        selected_columns = list(selected_columns)
+    order, kinds = _resolve_columns(path, delimiter, skip_header, selected_columns, schema)
+    # Indeks negatif baru bisa diselesaikan setelah lebar baris diketahui
+    parse_all = order is not None and any(i < 0 for i in order)
+    parse_indices = None if parse_all else order
+    with profiler.span("parse") as sp:
+        if workers > 1:
+            state = csv_parallel.load_parallel(path, delimiter, skip_header, parse_indices,
+                                               workers, chunk_size, kinds)
+        elif streaming:
+            state = csv_stream.load_streaming(path, delimiter, skip_header, parse_indices,
+                                              chunk_size, kinds)
+        else:
+            state = _parse_rows(path, delimiter, skip_header, parse_indices, kinds)
+        sp.add("rows_parsed", state.n_rows)
+        sp.add("cells_converted", state.n_rows * len(state.columns))
+    if order is not None:
+        if parse_all:
+            order = [i + state.width if i < 0 else i for i in order]
+        # Laporkan kolom di luar jangkauan sesuai yang diminta pemanggil (nama / indeks asli)
+        bad = [requested for requested, i in zip(selected_columns, order) if not 0 <= i < state.width]
+        if bad and state.n_rows:
+            raise IndexError(f"Kolom terpilih di luar jangkauan (file memiliki {state.width} kolom): {bad}")
+        order = [i for i in order if i not in state.skip]
+    return csv_stream.build_matrix(state, order, drop_non_numeric, impute_strategy, normalize,
+                                   as_sparse, sparse_threshold, backend)
 
 # ------------------------------------------------------------
 # Fungsi utama: Load CSV menjadi Matrix atau SparseMatrix
 # ------------------------------------------------------------
+@profiler.timed("load_matrix_from_csv")
 def load_matrix_from_csv(
     path: str,
     delimiter: Optional[str] = None,
@@ -170,45 +144,56 @@ def load_matrix_from_csv(
     impute_strategy: str = "zero",
     normalize: Optional[str] = None,
     as_sparse: bool = False,
-    sparse_threshold: float = 0.5
+    sparse_threshold: float = 0.5,
+    backend: Optional[str] = None,
+    streaming: bool = False,
+    chunk_size: int = csv_stream.DEFAULT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    cache_validate: str = "mtime",
+    schema: Optional[Dict[Union[int, str], object]] = None
 ) -> Union[Matrix, SparseMatrix]:
+    """
+    backend  : None (otomatis) | 'list' | 'numpy' | 'array'. Otomatis = 'list' pada mode biasa,
+               'numpy' pada mode streaming bila numpy tersedia.
+    streaming: baca file per chunk_size baris, konversi setiap sel sekali langsung
+               ke buffer kolom lalu tulis hasil ke buffer output / builder CSR.
+    workers  : > 1 → parse rentang byte file di beberapa proses lalu gabungkan
+               (mengaktifkan mode streaming; field ber-quote multi-baris tidak didukung).
+    cache_dir: direktori cache sidecar .mtxb (lihat utilities/csv_cache.py); None = nonaktif.
+    cache_validate: 'mtime' (ukuran + waktu modifikasi) | 'hash' (hash isi file).
+    schema   : {nama / indeks kolom: 'int' | 'float' | 'skip'} menimpa tipe hasil
+               inferensi sampel; kolom 'skip' tidak dikonversi sama sekali, sel yang
+               tidak sesuai tipe 'int' / 'float' menjadi ValueError.
+    """
+    if cache_dir is None:
+        return _load(path, delimiter, skip_header, selected_columns, drop_non_numeric,
+                     impute_strategy, normalize, as_sparse, sparse_threshold, backend,
+                     streaming, chunk_size, workers, schema)
 
-    header, data_rows = _parse_rows(path, delimiter, skip_header)
-    if not data_rows:
-        return SparseMatrix({}) if as_sparse else Matrix([])
-
-    # Bentuk kolom dari data
-    cols = [[row[c] for row in data_rows] for c in range(len(data_rows[0]))]
-
-    # Pilih kolom tertentu jika diminta
-    if selected_columns:
-        cols = [cols[i] for i in (_select_columns_by_names_or_indices(header, selected_columns) if skip_header else map(int, selected_columns))]
-
-    # Deteksi kolom numerik
-    numeric_mask = [_is_column_numeric(col) for col in cols]
-
-    if not all(numeric_mask):
-        if drop_non_numeric:
-            cols = [col for col, ok in zip(cols, numeric_mask) if ok]
-        else:
-            raise ValueError("Terdapat kolom non-numerik. Gunakan drop_non_numeric=True atau pilih kolom secara manual.")
-
-    # Konversi + imputasi
-    converted_cols = [c for c in _convert_and_impute(cols, impute_strategy) if c is not None]
-
-    # Normalisasi jika diminta
-    if normalize == "minmax":
-        converted_cols = _minmax_scale(converted_cols)
-    elif normalize == "zscore":
-        converted_cols = _zscore_scale(converted_cols)
-
-    # Ubah orientasi → baris
-    rows = _transpose(converted_cols)
-
-    # Tentukan apakah perlu sparse
-    total = len(rows) * len(rows[0])
-    zero_ratio = sum(v == 0 for r in rows for v in r) / total if total else 0
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    if selected_columns is not None:
+        selected_columns = list(selected_columns)
+    streaming = streaming or (workers or 1) > 1
+    key = csv_cache.cache_key(path, {
+        "delimiter": delimiter, "skip_header": skip_header,
+        "selected_columns": selected_columns, "drop_non_numeric": drop_non_numeric,
+        "impute_strategy": impute_strategy, "normalize": normalize, "as_sparse": as_sparse,
+        "sparse_threshold": sparse_threshold, "streaming": streaming,
+        "schema": sorted((repr(k), repr(v)) for k, v in schema.items()) if schema else None,
+    }, cache_validate)
+    with profiler.span("cache_lookup"):
+        cached = csv_cache.lookup(cache_dir, key)
+    if cached is not None:
+        profiler.count("csv_cache_hits")
+        return csv_cache.restore_backend(cached, backend, streaming, normalize is not None)
+
+    profiler.count("csv_cache_misses")
+    matrix = _load(path, delimiter, skip_header, selected_columns, drop_non_numeric,
+                   impute_strategy, normalize, as_sparse, sparse_threshold, backend,
+                   streaming, chunk_size, workers, schema)
+    with profiler.span("cache_store"):
+        csv_cache.store(cache_dir, key, matrix)
+    return matrix
 
-    if as_sparse or zero_ratio >= sparse_threshold:
-        return SparseMatrix({(i, j): v for i, r in enumerate(rows) for j, v in enumerate(r) if v != 0})
-    return Matrix(rows)
\ No newline at end of file
@@ -0,0 +1,97 @@
+# matriks/utilities/csv_parallel.py
+"""
+Parsing CSV paralel per rentang byte (load_matrix_from_csv(workers=N)).
+
+ - file dibagi menjadi N rentang byte yang batasnya digeser ke awal baris
+ - setiap proses mem-parse rentangnya menjadi StreamState (buffer kolom,
+   indeks sel kosong, status numerik) dengan kode yang sama seperti mode streaming
+ - state digabung berurutan sesuai posisi rentang, sehingga hasil akhir identik
+   dengan loader serial (statistik imputasi/normalisasi dihitung setelah merge)
+
+Batasan: field ber-quote yang memuat baris baru tidak didukung pada mode ini
+karena batas rentang dipilih per baris fisik.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+import csv
+import locale
+import os
+
+from .csv_stream import DEFAULT_CHUNK_SIZE, StreamState
+
+# Rentang yang lebih kecil dari ini tidak sebanding dengan biaya membuat proses
+MIN_RANGE_BYTES = 1 << 20
+
+
+def _data_start(path: str, skip_header: bool) -> int:
+    if not skip_header:
+        return 0
+    with open(path, "rb") as f:
+        f.readline()
+        return f.tell()
+
+
+def byte_ranges(path: str, workers: int, skip_header: bool) -> List[Tuple[int, int]]:
+    """Bagi bagian data file menjadi maksimal `workers` rentang [start, end) yang berawal di awal baris."""
+    start = _data_start(path, skip_header)
+    size = os.path.getsize(path)
+    n = max(1, min(workers, (size - start) // MIN_RANGE_BYTES))
+    step = (size - start) // n
+
+    bounds = [start]
+    with open(path, "rb") as f:
+        for i in range(1, n):
+            f.seek(start + i * step)
+            f.readline()  # geser ke awal baris berikutnya
+            bounds.append(max(f.tell(), bounds[-1]))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def iter_range_lines(path: str, start: int, end: int, encoding: str):
+    """Yield baris teks dalam rentang byte [start, end) (start harus awal baris)."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                return
+            yield line.decode(encoding)
+
+
+def _parse_range(task) -> StreamState:
+    path, start, end, delimiter, selected, schema, chunk_size, encoding = task
+    lines = iter_range_lines(path, start, end, encoding)
+    reader = csv.reader(lines, delimiter=delimiter) if delimiter else csv.reader(lines)
+    state = StreamState(selected, schema)
+    while True:
+        chunk = list(islice(reader, chunk_size))
+        if not chunk:
+            return state
+        state.feed(chunk)
+
+
+def load_parallel(path: str, delimiter: Optional[str], skip_header: bool,
+                  selected_indices: Optional[List[int]], workers: int,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  schema: Optional[Dict[int, str]] = None) -> StreamState:
+    """Parse file dengan `workers` proses lalu gabungkan state secara deterministik."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    encoding = locale.getpreferredencoding(False)
+    ranges = byte_ranges(path, workers, skip_header)
+    tasks = [(path, a, b, delimiter, selected_indices, schema, chunk_size, encoding)
+             for a, b in ranges]
+
+    if len(tasks) <= 1:
+        states = [_parse_range(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+            states = list(pool.map(_parse_range, tasks))
+
+    state = states[0] if states else StreamState(selected_indices, schema)
+    for part in states[1:]:
+        state.extend(part)
+    return state
@@ -0,0 +1,470 @@
+# matriks/utilities/csv_stream.py
+"""
+Ingestion CSV streaming untuk load_matrix_from_csv(streaming=True).
+
+Alur:
+ - file dibaca per chunk baris (chunk_size), tidak pernah list(reader)
+ - tipe awal tiap kolom (int / float / non-numerik) ditebak dari SAMPLE_ROWS
+   baris pertama atau diambil dari skema; kolom 'skip' / tidak terpilih dan
+   kolom non-numerik tidak pernah dikonversi
+ - setiap sel dikonversi tepat sekali per kolom per chunk (map int / float),
+   langsung ke buffer kolom array('q') (berubah menjadi array('d') saat muncul
+   nilai pecahan); hanya sel yang gagal yang diulang lewat jalur per sel
+ - sel kosong dicatat indeks barisnya, statistik imputasi/normalisasi
+   dihitung dari buffer kolom setelah file selesai dibaca
+ - hasil ditulis ke satu buffer numpy (jika tersedia) atau builder CSR
+
+Puncak memori ≈ ukuran matriks output (8 byte per sel), bukan kelipatan
+ukuran teks CSV.
+"""
+
+from array import array
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, List, Optional
+import csv
+import math
+import os
+
+from matrix import Matrix, np
+from sparsematrix import SparseMatrix
+from . import column_stats
+from . import profiler
+
+DEFAULT_CHUNK_SIZE = 65536
+# Bilangan bulat dengan |x| ≥ 2**53 tidak selalu persis di float64; 2**63 = batas int64
+FLOAT_EXACT = 2 ** 53
+INT64_LIMIT = 2 ** 63
+# Jumlah baris pertama per kolom yang dipakai untuk menebak tipe (int / float / non-numerik)
+SAMPLE_ROWS = 1000
+
+
+# ------------------------------------------------------------
+# Membaca file per chunk baris
+# ------------------------------------------------------------
+def _reader(f, delimiter: Optional[str]):
+    return csv.reader(f, delimiter=delimiter) if delimiter else csv.reader(f)
+
+
+def read_header(path: str, delimiter: Optional[str]) -> List[str]:
+    """Baca baris pertama file sebagai header."""
+    with open(path, newline='') as f:
+        first = next(_reader(f, delimiter), [])
+    return [h.strip() for h in first]
+
+
+def iter_row_chunks(path: str, delimiter: Optional[str], skip_header: bool,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Yield list baris mentah (maks. chunk_size baris) tanpa memuat seluruh file."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    with open(path, newline='') as f:
+        reader = _reader(f, delimiter)
+        if skip_header:
+            next(reader, None)
+        while True:
+            chunk = list(islice(reader, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+# ------------------------------------------------------------
+# Buffer satu kolom
+# ------------------------------------------------------------
+class _ColumnBuffer:
+    """
+    Nilai satu kolom sejajar dengan nomor baris (sel kosong diisi 0 sementara
+    dan indeksnya dicatat di `missing`).
+    kind: None (tipe diinferensi dari sampel) | 'int' | 'float' (dipaksa skema;
+    sel yang gagal dikonversi menjadi error, bukan fallback).
+    exact: {baris: int} untuk bilangan bulat yang tidak muat persis di buffer
+    (di luar int64, atau ≥ 2**53 di buffer float) agar hasil list tetap eksak.
+    """
+    __slots__ = ("values", "missing", "numeric", "integral", "kind", "sampled", "exact")
+
+    def __init__(self, n_rows: int = 0, kind: Optional[str] = None):
+        self.values = array("d" if kind == "float" else "q", [0]) * n_rows
+        self.missing = array("q", range(n_rows))
+        self.numeric = True    # belum ada sel tak-kosong yang gagal dikonversi
+        self.integral = kind != "float"   # semua nilai tak-kosong bilangan bulat
+        self.kind = kind
+        self.sampled = kind is not None
+        self.exact = {}
+
+    def infer(self, cells: List[str]):
+        """Pilih tipe awal kolom dari sampel sel (int → float → non-numerik)."""
+        self.sampled = True
+        for cell in cells:
+            s = cell.strip()
+            if s == "":
+                continue
+            try:
+                int(s)
+                continue
+            except ValueError:
+                pass
+            try:
+                float(s)
+            except ValueError:
+                self.numeric = False
+                self.values = self.missing = None
+                return
+            if self.values.typecode == "q":
+                self.values = array("d", self.values)
+
+    def extend_cells(self, cells: List[str], start: int):
+        """
+        Konversi sel satu chunk dengan map int / float di level C. Sel yang gagal
+        (spasi saja, pecahan di kolom int, non-numerik) ditangani append() lalu
+        map dilanjutkan dari sel berikutnya pada iterator yang sama.
+        """
+        if not self.numeric:
+            return
+        # Sel kosong dicari di level C (list.count / list.index) lalu diisi "0"
+        empties = cells.count("")
+        if empties:
+            cells = list(cells)
+            pos = -1
+            for _ in range(empties):
+                pos = cells.index("", pos + 1)
+                cells[pos] = "0"
+                self.missing.append(start + pos)
+        it = iter(cells)
+        done = 0
+        while self.numeric:
+            values = self.values
+            n0 = len(values)
+            failed = False
+            try:
+                values.extend(map(int if values.typecode == "q" else float, it))
+            except (ValueError, OverflowError):
+                failed = True
+            converted = len(values) - n0
+            if converted and self.integral and values.typecode == "d":
+                self.integral = all(map(float.is_integer, values[n0:]))
+                if self.integral and max(map(abs, values[n0:])) >= FLOAT_EXACT:
+                    self._keep_exact(cells, values, n0, done, start)
+            done += converted
+            if not failed:
+                return
+            self.append(cells[done], start + done)
+            done += 1
+
+    def append(self, cell: str, row: int):
+        if not self.numeric:
+            return
+        s = cell.strip()
+        if s == "":
+            self.values.append(0)
+            self.missing.append(row)
+            return
+        try:
+            # Kolom yang sudah pecahan langsung dicoba float (hemat satu exception per sel)
+            v = int(s) if self.values.typecode == "q" else float(s)
+        except ValueError:
+            if self.kind is not None:
+                raise ValueError(f"nilai '{s}' pada baris data ke-{row + 1} tidak sesuai skema '{self.kind}'")
+            try:
+                v = float(s)
+            except ValueError:
+                # Kolom non-numerik: buffer tidak diperlukan lagi
+                self.numeric = False
+                self.values = self.missing = None
+                return
+            if self.values.typecode == "q":
+                self.values = array("d", self.values)
+        if self.integral and type(v) is float and not v.is_integer():
+            self.integral = False
+        try:
+            self.values.append(v)
+        except OverflowError:
+            self.values = array("d", self.values)
+            self.values.append(v)
+        if type(v) is int and abs(v) >= FLOAT_EXACT and self.values.typecode == "d":
+            self.exact[row] = v
+        elif self.integral and type(v) is float and abs(v) >= FLOAT_EXACT:
+            self._keep_exact([s], self.values, len(self.values) - 1, 0, row)
+
+    def _keep_exact(self, cells: List[str], values, n0: int, done: int, start: int):
+        """Catat nilai int eksak untuk sel bulat besar yang tersimpan sebagai float."""
+        for i in range(n0, len(values)):
+            if abs(values[i]) >= FLOAT_EXACT:
+                k = done + i - n0
+                try:
+                    self.exact[start + k] = int(cells[k].strip())
+                except ValueError:
+                    pass   # notasi seperti '1e20': nilai float sudah sesuai teksnya
+
+    def extend(self, other: "_ColumnBuffer", offset: int):
+        """Sambungkan buffer kolom lain yang barisnya dimulai pada `offset`."""
+        if not other.numeric:
+            self.numeric = False
+            self.values = self.missing = None
+            return
+        if not self.numeric:
+            return
+        if other.values.typecode == "d" and self.values.typecode == "q":
+            self.values = array("d", self.values)
+        if self.values.typecode == "d" and other.values.typecode == "q":
+            self.values.extend(array("d", other.values))
+        else:
+            self.values.extend(other.values)
+        self.missing.extend(array("q", (r + offset for r in other.missing)))
+        self.exact.update((r + offset, v) for r, v in other.exact.items())
+        self.integral = self.integral and other.integral
+
+    @property
+    def n_present(self) -> int:
+        return len(self.values) - len(self.missing)
+
+
+class StreamState:
+    """
+    Hasil parsing bertahap: buffer per indeks kolom file, jumlah baris data
+    (baris kosong dibuang) dan lebar baris terpanjang.
+    selected: indeks kolom file yang dikonversi (None = semua kolom).
+    schema  : {indeks kolom: 'int' | 'float' | 'skip'}; kolom 'skip' tidak pernah
+              dibuatkan buffer, kolom lain tanpa skema diinferensi dari
+              SAMPLE_ROWS baris pertama yang dilihatnya.
+    """
+    def __init__(self, selected: Optional[List[int]] = None,
+                 schema: Optional[Dict[int, str]] = None):
+        self.schema = dict(schema or {})
+        self.skip = {c for c, kind in self.schema.items() if kind == "skip"}
+        self.selected = None if selected is None else sorted(set(selected) - self.skip)
+        self.columns: Dict[int, _ColumnBuffer] = {}
+        self.n_rows = 0
+        self.width = 0
+        if self.selected is not None:
+            for c in self.selected:
+                self.columns[c] = self._new_column(c, 0)
+
+    def _new_column(self, c: int, n_rows: int) -> _ColumnBuffer:
+        return _ColumnBuffer(n_rows, self.schema.get(c))
+
+    def feed(self, rows):
+        # Buang baris kosong
+        rows = [row for row in rows if any(map(str.strip, row))]
+        if not rows:
+            return
+        start = self.n_rows
+        columns = self.columns
+        width = max(map(len, rows))
+        if width > self.width:
+            if self.selected is None:
+                for c in range(self.width, width):
+                    if c not in self.skip:
+                        columns[c] = self._new_column(c, start)
+            self.width = width
+        # Kolom di bawah min_len ada di semua baris: ambil tanpa cek panjang
+        min_len = min(map(len, rows))
+        for c, col in columns.items():
+            if not col.numeric:
+                continue
+            if c < min_len:
+                cells = list(map(itemgetter(c), rows))
+            else:
+                cells = [row[c] if c < len(row) else "" for row in rows]
+            if not col.sampled:
+                col.infer(cells[:SAMPLE_ROWS])
+            try:
+                col.extend_cells(cells, start)
+            except ValueError as e:
+                raise ValueError(f"Kolom {c}: {e}") from None
+        self.n_rows = start + len(rows)
+
+    def extend(self, other: "StreamState"):
+        """Gabungkan state dari potongan file berikutnya (urutan baris dipertahankan)."""
+        offset = self.n_rows
+        for c in set(self.columns) | set(other.columns):
+            if c not in self.columns:
+                self.columns[c] = self._new_column(c, offset)
+            mine = self.columns[c]
+            theirs = other.columns.get(c)
+            if theirs is None:
+                theirs = self._new_column(c, other.n_rows)
+            mine.extend(theirs, offset)
+        self.n_rows += other.n_rows
+        self.width = max(self.width, other.width)
+
+
+# ------------------------------------------------------------
+# Imputasi + normalisasi pada buffer kolom
+# ------------------------------------------------------------
+def _is_integral(x) -> bool:
+    return isinstance(x, int) or (math.isfinite(x) and abs(x - int(x)) < 1e-9)
+
+
+def _impute(col: _ColumnBuffer, strategy: str):
+    """Isi sel kosong. Mengembalikan (values, is_int) atau None jika kolom di-drop."""
+    values = col.values
+    is_int = col.integral
+    if col.missing:
+        if strategy == "drop":
+            return None
+        if strategy == "zero":
+            fill = 0
+        else:
+            present = column_stats.present(values, col.missing)
+            if not present:
+                fill = 0
+            elif strategy == "mean":
+                fill = column_stats.summarize(present).mean
+            else:
+                fill = column_stats.median(present)
+        if _is_integral(fill):
+            fill = int(round(fill))
+        else:
+            is_int = False
+            if values.typecode == "q":
+                values = array("d", values)
+        column_stats.fill(values, col.missing, fill)
+    return values, is_int
+
+
+def _fits_int64(values) -> bool:
+    """True jika semua nilai buffer bisa di-cast ke int64 tanpa wrap."""
+    if values.typecode == "q" or not values:
+        return True
+    if np is not None:
+        return not (np.abs(np.frombuffer(values, dtype=values.typecode)) >= INT64_LIMIT).any()
+    return not any(abs(x) >= INT64_LIMIT for x in values)
+
+
+def _to_python_column(values, is_int: bool, normalized: bool, exact=None) -> list:
+    """
+    Samakan tipe per nilai dengan loader biasa (pecahan bulat → int). `exact`
+    ({baris: int}) mengembalikan bilangan bulat besar persis seperti di file.
+    """
+    if normalized or (values.typecode == "q" and is_int):
+        return values.tolist()
+    column = _python_values(values, is_int)
+    for row, v in (exact or {}).items():
+        column[row] = v
+    return column
+
+
+def _python_values(values, is_int: bool) -> list:
+    if np is not None and _fits_int64(values):
+        arr = np.frombuffer(values, dtype=values.typecode)
+        rounded = np.rint(arr)
+        integral = np.abs(arr - np.trunc(arr)) < 1e-9
+        if is_int or integral.all():
+            return rounded.astype(np.int64).tolist()
+        if not integral.any():
+            return values.tolist()
+        return [i if ok else x for i, x, ok in
+                zip(rounded.astype(np.int64).tolist(), values.tolist(), integral.tolist())]
+    if is_int:
+        return [int(round(x)) for x in values]
+    return [int(round(x)) if _is_integral(x) else x for x in values]
+
+
+# ------------------------------------------------------------
+# Bentuk Matrix / SparseMatrix dari state
+# ------------------------------------------------------------
+def build_matrix(state: StreamState, column_order: Optional[List[int]],
+                 drop_non_numeric: bool, impute_strategy: str,
+                 normalize: Optional[str], as_sparse: bool,
+                 sparse_threshold: float, backend: Optional[str]):
+    if impute_strategy not in ("zero", "mean", "median", "drop"):
+        raise ValueError(f"Unknown impute strategy: {impute_strategy}")
+    if backend is None:
+        backend = "numpy" if np is not None else "list"
+
+    order = sorted(state.columns) if column_order is None else list(column_order)
+    # Kolom terpilih di luar lebar file: error seperti baris[c] pada loader lama, bukan dibuang diam-diam
+    out_of_range = [c for c in order if not 0 <= c < state.width]
+    if out_of_range and state.n_rows:
+        raise IndexError(f"Indeks kolom di luar jangkauan (file memiliki {state.width} kolom): {out_of_range}")
+    cols = [state.columns.get(c) for c in order]
+    numeric_mask = [c is not None and c.numeric and c.n_present > 0 for c in cols]
+    if not all(numeric_mask):
+        if not drop_non_numeric:
+            raise ValueError("Terdapat kolom non-numerik. Gunakan drop_non_numeric=True atau pilih kolom secara manual.")
+        cols = [c for c, ok in zip(cols, numeric_mask) if ok]
+
+    finished = []
+    with profiler.span("impute_normalize"):
+        for col in cols:
+            imputed = _impute(col, impute_strategy)
+            if imputed is None:
+                continue
+            values, is_int = imputed
+            if normalize == "minmax":
+                values, is_int = column_stats.minmax_scale(values), False
+            elif normalize == "zscore":
+                values, is_int = column_stats.zscore_scale(values), False
+            finished.append((values, is_int and _fits_int64(values), col.exact))
+    # Buffer parsing tidak dibutuhkan lagi
+    state.columns = {}
+
+    n = state.n_rows
+    k = len(finished)
+    if n == 0 or k == 0:
+        return SparseMatrix({}) if as_sparse else Matrix([])
+
+    with profiler.span("zero_scan"):
+        zeros = sum(values.count(0) for values, *_ in finished)
+    all_int = all(is_int for _, is_int, _ in finished)
+    normalized = normalize in ("minmax", "zscore")
+
+    if as_sparse or zeros / (n * k) >= sparse_threshold:
+        with profiler.span("build"):
+            return _build_sparse(finished, n, all_int)
+
+    with profiler.span("build"):
+        if backend == "numpy":
+            out = np.empty((n, k), dtype=np.int64 if all_int else np.float64)
+            for j in range(k):
+                values = finished[j][0]
+                out[:, j] = np.frombuffer(values, dtype=values.typecode)
+                finished[j] = None
+            return Matrix(out)
+
+        if backend == "array":
+            # Kolom j pada buffer row-major = slice berlangkah [j::k]
+            typecode = "q" if all_int else "d"
+            flat = array(typecode, bytes(8 * n * k))
+            for j in range(k):
+                values = finished[j][0]
+                if values.typecode != typecode:
+                    values = array(typecode, map(round, values) if all_int else values)
+                flat[j::k] = values
+                finished[j] = None
+            return Matrix.from_flat(flat, n, k)
+
+        columns = []
+        for j in range(k):
+            values, is_int, exact = finished[j]
+            columns.append(_to_python_column(values, is_int, normalized, exact))
+            finished[j] = None
+        return Matrix([list(r) for r in zip(*columns)])
+
+
+def _build_sparse(finished, n: int, all_int: bool) -> SparseMatrix:
+    """Builder CSR langsung dari buffer kolom (baris demi baris)."""
+    k = len(finished)
+    columns = [values for values, *_ in finished]
+    indptr = array("q", [0])
+    indices = array("q")
+    values = array("q" if all_int else "d")
+    for i in range(n):
+        for j in range(k):
+            v = columns[j][i]
+            if v != 0:
+                indices.append(j)
+                values.append(int(v) if all_int else v)
+        indptr.append(len(indices))
+    return SparseMatrix.from_compressed(indptr, indices, values, shape=(n, k))
+
+
+def load_streaming(path: str, delimiter: Optional[str], skip_header: bool,
+                   selected_indices: Optional[List[int]], chunk_size: int,
+                   schema: Optional[Dict[int, str]] = None) -> StreamState:
+    """Parse seluruh file secara streaming menjadi StreamState."""
+    state = StreamState(selected_indices, schema)
+    for chunk in iter_row_chunks(path, delimiter, skip_header, chunk_size):
+        state.feed(chunk)
+    return state
@@ -0,0 +1,81 @@
+# matriks/utilities/downsample.py
+"""
+Downsampling seri (x, y) untuk visualisasi.
+
+Jumlah titik yang dikirim ke browser cukup sebanding dengan lebar chart
+dalam piksel, bukan jumlah baris data. Kedua metode mengembalikan indeks
+titik asli (terurut) sehingga seri lain (mis. prediksi) bisa diambil pada
+indeks yang sama.
+
+ - lttb   : Largest-Triangle-Three-Buckets, mempertahankan bentuk visual seri
+ - minmax : per bucket diambil titik y minimum dan maksimum (puncak/lembah
+            tidak pernah hilang)
+
+x diasumsikan sudah terurut naik.
+"""
+
+import numpy as np
+
+METHODS = ("lttb", "minmax")
+
+
+def lttb(x, y, threshold: int) -> np.ndarray:
+    """Indeks `threshold` titik terpilih dengan algoritma LTTB."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if threshold >= n or n <= 2:
+        return np.arange(n)
+    if threshold < 3:
+        return np.array([0, n - 1])
+
+    # threshold-2 bucket untuk titik 1..n-2; titik pertama & terakhir selalu diambil
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Rata-rata bucket berikutnya (untuk bucket terakhir: titik terakhir)
+        if i + 2 < len(edges):
+            nlo, nhi = edges[i + 1], edges[i + 2]
+        else:
+            nlo, nhi = n - 1, n
+        avg_x = x[nlo:nhi].mean()
+        avg_y = y[nlo:nhi].mean()
+
+        # Luas segitiga (a, kandidat, rata-rata bucket berikutnya), tanpa faktor 1/2
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax(y, threshold: int) -> np.ndarray:
+    """Indeks titik min & max y per bucket (maks. `threshold` titik)."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n:
+        return np.arange(n)
+    n_buckets = max(1, threshold // 2)
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.int64)
+
+    selected = []
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        if hi <= lo:
+            continue
+        bucket = y[lo:hi]
+        selected.append(lo + int(np.argmin(bucket)))
+        selected.append(lo + int(np.argmax(bucket)))
+    return np.unique(np.asarray(selected, dtype=np.int64))
+
+
+def downsample(x, y, threshold: int, method: str = "lttb") -> np.ndarray:
+    """Pilih indeks titik yang ditampilkan untuk `threshold` titik dengan metode `method`."""
+    if method == "lttb":
+        return lttb(x, y, threshold)
+    if method == "minmax":
+        return minmax(y, threshold)
+    raise ValueError(f"Metode downsampling tidak dikenal: {method}. Pilihan: {', '.join(METHODS)}")
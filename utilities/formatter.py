@@ -1,11 +1,109 @@
 # formatter.py
-def to_string(matrix):
-    """Mengubah matriks menjadi string dengan format baris-kolom."""
-    result = []
-    for row in matrix.data:
-        result.append(" ".join(map(str, row)))
-    return "\n".join(result)
-
-def print_matrix(matrix):
-    """Mencetak matriks (menggunakan to_string)."""
-    print(to_string(matrix))
+"""
+Tampilan matriks di console dengan elisi baris/kolom.
+
+Hanya sel yang ditampilkan yang dibaca: max_rows baris (separuh awal, separuh
+akhir) × max_cols kolom, sehingga biaya O(ukuran preview) berapa pun ukuran
+matriks. Kolom disejajarkan ke kanan; baris ditulis satu per satu ke stream
+(default sys.stdout) tanpa membangun satu string besar.
+
+      0.0   1.25  ...    5.0
+     6.25    7.5  ...  11.25
+      ...    ...  ...    ...
+     37.5  38.75  ...   42.5
+    43.75   45.0  ...  48.75
+    [8 baris × 5 kolom]
+"""
+import sys
+
+from matrix import uses_buffer, np
+from . import profiler
+
+DEFAULT_MAX_ROWS = 10
+DEFAULT_MAX_COLS = 8
+ELLIPSIS = "..."
+
+
+def _split(n, limit):
+    """Indeks yang ditampilkan (awal, akhir) dari n item dengan batas `limit` (None/0 = semua)."""
+    if not limit or n <= limit:
+        return list(range(n)), []
+    head = (limit + 1) // 2
+    tail = limit - head
+    return list(range(head)), list(range(n - tail, n))
+
+
+def _cells(matrix, rows, cols):
+    """Ambil nilai sel rows × cols saja (tanpa menyentuh bagian lain matriks)."""
+    if hasattr(matrix, "evaluate"):
+        # LazyMatrix: setiap sel dihitung dari suku-sukunya, ekspresi tidak dievaluasi penuh
+        return [[matrix.get_value(r, c) for c in cols] for r in rows]
+    if uses_buffer(matrix) and np is not None:
+        return matrix.to_array()[np.ix_(rows, cols)].tolist()
+    if hasattr(matrix, "get_value"):
+        return [[matrix.get_value(r, c) for c in cols] for r in rows]
+    data = matrix.data
+    return [[data[r][c] for c in cols] for r in rows]
+
+
+def _format_value(value, precision):
+    if precision is not None and isinstance(value, float):
+        return f"{value:.{precision}f}"
+    return str(value)
+
+
+def format_lines(matrix, max_rows=DEFAULT_MAX_ROWS, max_cols=DEFAULT_MAX_COLS, precision=None):
+    """
+    Hasilkan baris teks preview matriks satu per satu.
+    max_rows / max_cols: jumlah baris / kolom yang ditampilkan (None atau 0 = semua)
+    precision          : jumlah desimal untuk nilai float (None = apa adanya)
+    """
+    n_rows, n_cols = matrix.rows, matrix.cols
+    if n_rows == 0 or n_cols == 0:
+        yield f"[{n_rows} baris × {n_cols} kolom]"
+        return
+
+    head_rows, tail_rows = _split(n_rows, max_rows)
+    head_cols, tail_cols = _split(n_cols, max_cols)
+    cols = head_cols + tail_cols
+    rows = head_rows + tail_rows
+
+    cells = [[_format_value(v, precision) for v in row] for row in _cells(matrix, rows, cols)]
+    if tail_cols:
+        for row in cells:
+            row.insert(len(head_cols), ELLIPSIS)
+    if tail_rows:
+        cells.insert(len(head_rows), [ELLIPSIS] * len(cells[0]))
+
+    widths = [max(len(row[j]) for row in cells) for j in range(len(cells[0]))]
+    for row in cells:
+        yield "  ".join(text.rjust(width) for text, width in zip(row, widths))
+    if tail_rows or tail_cols:
+        yield f"[{n_rows} baris × {n_cols} kolom]"
+
+
+def write_matrix(matrix, stream=None, **options):
+    """Tulis preview matriks ke stream (default sys.stdout) baris demi baris."""
+    stream = stream or sys.stdout
+    for line in format_lines(matrix, **options):
+        stream.write(line)
+        stream.write("\n")
+
+
+def to_string(matrix, **options):
+    """
+    Mengubah matriks menjadi string.
+    Tanpa opsi: seluruh isi, satu baris teks per baris matriks dengan nilai
+    dipisah spasi (format lama, tidak dipotong). Dengan opsi max_rows / max_cols /
+    precision: preview berelisi seperti print_matrix (lihat format_lines).
+    """
+    if options:
+        return "\n".join(format_lines(matrix, **options))
+    rows = matrix.iter_rows() if hasattr(matrix, "iter_rows") else matrix.data
+    return "\n".join(" ".join(map(str, row)) for row in rows)
+
+
+@profiler.timed()
+def print_matrix(matrix, **options):
+    """Mencetak preview matriks ke console (lihat format_lines untuk opsi)."""
+    write_matrix(matrix, sys.stdout, **options)
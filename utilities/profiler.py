@@ -0,0 +1,278 @@
+# matriks/utilities/profiler.py
+"""
+Instrumentasi ringan: span bertingkat (timer) dan counter.
+
+    from utilities import profiler
+    profiler.enable()
+    with profiler.span("load A"):
+        ...
+        profiler.count("rows_parsed", n)
+    profiler.print_report()
+    profiler.write_trace("trace.json")
+
+Nonaktif secara default. Saat nonaktif span() mengembalikan satu objek no-op
+bersama, count() dan fungsi ber-@timed hanya memeriksa satu flag, sehingga
+biayanya hanya satu pemanggilan fungsi. Span dicatat untuk thread utama;
+pekerjaan di proses worker tidak ikut terukur, hanya span pemanggilnya.
+
+Trace ditulis dalam format Chrome trace event ("traceEvents", bisa dibuka di
+chrome://tracing / Perfetto) ditambah ringkasan per stage dan counter.
+Dengan enable(cprofile=True) setiap span tingkat atas juga dijalankan di
+bawah cProfile; profil stage terlama disimpan (file .prof + fungsi teratas).
+"""
+
+import cProfile
+from collections import OrderedDict
+import functools
+import json
+import os
+import pstats
+import sys
+import time
+
+
+class _State:
+    def __init__(self):
+        self.enabled = False
+        self.cprofile = False
+        self.reset()
+
+    def reset(self):
+        self.origin = time.perf_counter()
+        self.stack = []
+        self.spans = []
+        self.counters = OrderedDict()
+        self.profiles = []
+
+
+_state = _State()
+
+
+def enable(cprofile=False):
+    """Aktifkan pencatatan (dan cProfile per span tingkat atas bila cprofile=True)."""
+    _state.reset()
+    _state.enabled = True
+    _state.cprofile = cprofile
+
+
+def disable():
+    _state.enabled = False
+
+
+def is_enabled():
+    return _state.enabled
+
+
+def reset():
+    """Hapus semua span / counter yang sudah dicatat."""
+    _state.reset()
+
+
+class _NullSpan:
+    """Span saat profiler nonaktif: tidak melakukan apa pun."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, name, n=1):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "path", "start", "counters", "profile")
+
+    def __init__(self, name):
+        self.name = name
+        self.counters = OrderedDict()
+        self.profile = None
+
+    def __enter__(self):
+        stack = _state.stack
+        self.path = f"{stack[-1].path}/{self.name}" if stack else self.name
+        if _state.cprofile and not stack:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        stack = _state.stack
+        stack.pop()
+        if self.profile is not None:
+            self.profile.disable()
+            _state.profiles.append((self.path, end - self.start, self.profile))
+        _state.spans.append({
+            "name": self.name,
+            "path": self.path,
+            "depth": len(stack),
+            "start": self.start - _state.origin,
+            "duration": end - self.start,
+            "counters": dict(self.counters),
+        })
+        return False
+
+    def add(self, name, n=1):
+        """Tambah counter pada span ini (dan total global)."""
+        self.counters[name] = self.counters.get(name, 0) + n
+        _state.counters[name] = _state.counters.get(name, 0) + n
+
+
+def span(name):
+    """Context manager timer bernama; bertingkat mengikuti span yang sedang aktif."""
+    if not _state.enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def count(name, n=1):
+    """Tambah counter pada span terdalam yang aktif (dan total global)."""
+    if not _state.enabled:
+        return
+    if _state.stack:
+        _state.stack[-1].add(name, n)
+    else:
+        _state.counters[name] = _state.counters.get(name, 0) + n
+
+
+def timed(name=None):
+    """Dekorator: jalankan fungsi di dalam span `name` (default: nama fungsi) saat profiler aktif."""
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return func(*args, **kwargs)
+            with _Span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ------------------------------------------------------------
+# Laporan
+# ------------------------------------------------------------
+def summary():
+    """
+    Agregasi per path stage (urut kemunculan pertama):
+    [{path, depth, calls, total, self, counters}]; self = total - waktu sub-stage.
+    """
+    stages = OrderedDict()
+    children = {}
+    for s in sorted(_state.spans, key=lambda s: s["start"]):
+        entry = stages.get(s["path"])
+        if entry is None:
+            entry = stages[s["path"]] = {
+                "path": s["path"], "depth": s["depth"], "calls": 0,
+                "total": 0.0, "self": 0.0, "counters": {},
+            }
+        entry["calls"] += 1
+        entry["total"] += s["duration"]
+        for k, v in s["counters"].items():
+            entry["counters"][k] = entry["counters"].get(k, 0) + v
+        parent = s["path"].rsplit("/", 1)[0] if "/" in s["path"] else None
+        if parent is not None:
+            children[parent] = children.get(parent, 0.0) + s["duration"]
+    for path, entry in stages.items():
+        entry["self"] = entry["total"] - children.get(path, 0.0)
+    return list(stages.values())
+
+
+def _hottest_profile():
+    if not _state.profiles:
+        return None
+    return max(_state.profiles, key=lambda p: p[1])
+
+
+def _top_functions(profile, limit=20):
+    stats = pstats.Stats(profile)
+    rows = []
+    for (filename, line, func), (cc, nc, tt, ct, _) in stats.stats.items():
+        rows.append({
+            "function": f"{os.path.basename(filename)}:{line}({func})",
+            "ncalls": nc,
+            "tottime": tt,
+            "cumtime": ct,
+        })
+    rows.sort(key=lambda r: r["cumtime"], reverse=True)
+    return rows[:limit]
+
+
+def format_report():
+    """Tabel breakdown stage sebagai teks."""
+    stages = summary()
+    if not stages:
+        return "(profiler: tidak ada span yang tercatat)"
+    root_total = sum(s["total"] for s in stages if s["depth"] == 0) or 1.0
+    lines = [f"{'stage':<48} {'calls':>6} {'total':>10} {'self':>10} {'%':>6}  counters"]
+    for s in stages:
+        label = ("  " * s["depth"] + s["path"].rsplit("/", 1)[-1])[:48]
+        counters = ", ".join(f"{k}={v:,}" for k, v in s["counters"].items())
+        lines.append(
+            f"{label:<48} {s['calls']:>6} {s['total']:>9.4f}s {s['self']:>9.4f}s "
+            f"{100 * s['total'] / root_total:>5.1f}%  {counters}"
+        )
+    if _state.counters:
+        lines.append("")
+        lines.append("counters: " + ", ".join(f"{k}={v:,}" for k, v in _state.counters.items()))
+    hottest = _hottest_profile()
+    if hottest is not None:
+        path, duration, profile = hottest
+        lines.append("")
+        lines.append(f"cProfile stage terlama: {path} ({duration:.4f}s)")
+        for row in _top_functions(profile, limit=10):
+            lines.append(f"  {row['cumtime']:>9.4f}s cum {row['tottime']:>9.4f}s self "
+                         f"{row['ncalls']:>8}  {row['function']}")
+    return "\n".join(lines)
+
+
+def print_report(file=None):
+    print(format_report(), file=file or sys.stdout)
+
+
+def write_trace(path):
+    """
+    Tulis trace JSON: traceEvents (Chrome trace, µs), summary per stage, counter global
+    dan, bila ada, profil cProfile stage terlama (disimpan juga ke <path>.prof).
+    """
+    pid = os.getpid()
+    events = [{
+        "name": s["name"],
+        "cat": s["path"].split("/", 1)[0],
+        "ph": "X",
+        "ts": round(s["start"] * 1e6, 3),
+        "dur": round(s["duration"] * 1e6, 3),
+        "pid": pid,
+        "tid": 0,
+        "args": dict(s["counters"], path=s["path"]),
+    } for s in sorted(_state.spans, key=lambda s: s["start"])]
+
+    trace = {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "summary": summary(),
+        "counters": dict(_state.counters),
+    }
+    hottest = _hottest_profile()
+    if hottest is not None:
+        stage, duration, profile = hottest
+        prof_path = os.path.splitext(path)[0] + ".prof"
+        profile.dump_stats(prof_path)
+        trace["cprofile"] = {
+            "stage": stage,
+            "duration": duration,
+            "file": prof_path,
+            "top": _top_functions(profile),
+        }
+    with open(path, "w") as f:
+        json.dump(trace, f, indent=2)
+    return path
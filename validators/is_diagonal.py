@@ -0,0 +1,14 @@
+from validators.is_square import is_square
+from validators.structure import scan_structure
+def is_diagonal(matrix):
+    """
+    Memeriksa apakah sebuah matriks adalah matriks diagonal.
+    """
+    if not isinstance(matrix, list) and hasattr(matrix, "is_diagonal"):
+        return matrix.is_diagonal()
+    if not isinstance(matrix, list) and hasattr(matrix, "data"):
+        matrix = matrix.data
+    if not is_square(matrix):
+        return False
+    flags = scan_structure(matrix)
+    return flags["upper"] and flags["lower"]
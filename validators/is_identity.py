@@ -2,6 +2,9 @@ def is_identity(matrix):
     """
     Memeriksa apakah sebuah matriks adalah matriks identitas.
     """
+    # Matrix / SparseMatrix: flag struktur yang di-cache
+    if not isinstance(matrix, list) and hasattr(matrix, "is_identity"):
+        return matrix.is_identity()
     if not matrix or not isinstance(matrix, list):
         return False
     n = len(matrix)
@@ -1,6 +1,9 @@
 def is_square(matrix):
     """
     Memeriksa apakah sebuah matriks (list of lists) adalah matr>    """
+    # Matrix / SparseMatrix: jawab dari bentuk yang tersimpan
+    if not isinstance(matrix, list) and hasattr(matrix, "is_square"):
+        return matrix.is_square()
     if not matrix or not isinstance(matrix, list):
         return False
     rows = len(matrix)
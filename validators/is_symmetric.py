@@ -3,6 +3,9 @@ def is_symmetric(matrix):
     """
     Memeriksa apakah sebuah matriks adalah simetris.
     """
+    # Matrix / SparseMatrix: flag struktur yang di-cache
+    if not isinstance(matrix, list) and hasattr(matrix, "is_symmetric"):
+        return matrix.is_symmetric()
     if not is_square(matrix):
         return False
     n = len(matrix)
@@ -0,0 +1,19 @@
+from validators.is_square import is_square
+from validators.structure import scan_structure
+def is_triangular(matrix, kind=None):
+    """
+    Memeriksa apakah sebuah matriks adalah matriks segitiga.
+    kind: None (atas atau bawah) | "upper" | "lower"
+    """
+    if kind not in (None, "upper", "lower"):
+        raise ValueError(f"Jenis segitiga tidak dikenal: {kind}")
+    if not isinstance(matrix, list) and hasattr(matrix, "is_triangular"):
+        return matrix.is_triangular(kind)
+    if not isinstance(matrix, list) and hasattr(matrix, "data"):
+        matrix = matrix.data
+    if not is_square(matrix):
+        return False
+    flags = scan_structure(matrix)
+    if kind is None:
+        return flags["upper"] or flags["lower"]
+    return flags[kind]
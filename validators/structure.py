@@ -0,0 +1,25 @@
+def scan_structure(matrix):
+    """
+    Satu kali scan matriks persegi (list of lists) untuk semua flag struktur:
+      symmetric : A[i][j] == A[j][i]
+      upper     : semua elemen di bawah diagonal nol (segitiga atas)
+      lower     : semua elemen di atas diagonal nol (segitiga bawah)
+      unit_diag : semua elemen diagonal bernilai 1
+    Scan berhenti lebih awal begitu ketiga flag off-diagonal sudah False.
+    """
+    n = len(matrix)
+    symmetric = upper = lower = True
+    for i in range(n):
+        row = matrix[i]
+        for j in range(i + 1, n):
+            a, b = row[j], matrix[j][i]
+            if a != b:
+                symmetric = False
+            if a != 0:
+                lower = False
+            if b != 0:
+                upper = False
+        if not (symmetric or upper or lower):
+            break
+    unit_diag = all(matrix[i][i] == 1 for i in range(n))
+    return {"symmetric": symmetric, "upper": upper, "lower": lower, "unit_diag": unit_diag}
@@ -1,5 +1,6 @@
 import sys
 import os
+import threading
 
 # 1. Tambahkan direktori induk (formatter) ke Python path
 # Ini memastikan Python dapat menemukan 'matrix' dan 'operations'
@@ -7,7 +8,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import pandas as pd
 import numpy as np
-from flask import Flask, render_template
+from flask import Flask, jsonify, render_template, request
 
 # ====================================================================
 # PERBAIKAN IMPOR: Sekarang impor ini seharusnya stabil karena path sudah ditambahkan
@@ -16,6 +17,8 @@ from flask import Flask, render_template
 try:
     from matrix import Matrix
     from operations.linear_regression import linear_regression, predict
+    from utilities.binary_loader import load_matrix_from_binary
+    from utilities.downsample import METHODS as DOWNSAMPLE_METHODS, downsample
 except ImportError:
     # Ini akan menangkap jika ada masalah di dalam modul itu sendiri,
     # tetapi tidak lagi karena masalah path. Kita biarkan saja pesan warning-nya.
@@ -25,28 +28,67 @@ except ImportError:
     def linear_regression(X, Y): raise NotImplementedError("linear_regression module failed to load.")
     def predict(x, a, b): raise NotImplementedError("predict module failed to load.")
     Matrix = None
+    load_matrix_from_binary = None
+    DOWNSAMPLE_METHODS = ()
+    def downsample(x, y, threshold, method="lttb"): raise NotImplementedError("downsample module failed to load.")
 
 
 app = Flask(__name__)
 
 # File data ada di direktori kerja saat ini (CWD: ~/formatter)
 DATA_FILE_RAW = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'matriks_a_copy.csv'))
+# Salinan biner (.mtxb) dari main.py: di-mmap sehingga tidak perlu parsing teks
+DATA_FILE_BINARY = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'matriks_a_copy.mtxb'))
 COLUMNS = ['Luas', 'Kamar', 'Usia', 'Harga']
 LUAS_COL_INDEX = 0
 HARGA_COL_INDEX = 3
 
-def load_and_analyze_data():
-    """Memuat data dari matriks_a_copy.csv dan menjalankan Simple Linear Regression (SLR)."""
+# Batas payload endpoint JSON: titik chart ~ lebar layar, preview per halaman
+DEFAULT_CHART_WIDTH = 800
+MIN_CHART_WIDTH = 3
+MAX_CHART_WIDTH = 4096
+SERIES_CACHE_SIZE = 32
+PREVIEW_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 500
+
+def _binary_is_current():
+    """Pakai .mtxb jika ada dan tidak lebih lama dari CSV-nya."""
+    if load_matrix_from_binary is None or not os.path.exists(DATA_FILE_BINARY):
+        return False
+    if not os.path.exists(DATA_FILE_RAW):
+        return True
+    return os.path.getmtime(DATA_FILE_BINARY) >= os.path.getmtime(DATA_FILE_RAW)
+
+def _data_source():
+    """Path file yang akan dibaca: .mtxb jika masih sesuai dengan CSV, selain itu CSV."""
+    return DATA_FILE_BINARY if _binary_is_current() else DATA_FILE_RAW
+
+def _file_stamp(path):
+    """Kunci cache untuk isi file: (path, mtime_ns, size). None jika file tidak ada."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+def load_and_analyze_data(path=None):
+    """Memuat data dari matriks_a_copy.csv (atau .mtxb) dan menjalankan Simple Linear Regression (SLR)."""
     # Cek impor kritis sebelum mencoba menghitung
     if 'linear_regression' not in globals() and 'linear_regression' not in locals():
         return None, None, {"error": "Gagal menjalankan Regresi: Modul linear_regression tidak ditemukan (ImportError)." }
 
+    if path is None:
+        path = _data_source()
     try:
-        # Menggunakan pandas untuk memuat data tanpa header
-        df = pd.read_csv(DATA_FILE_RAW, header=None) 
-        df.columns = COLUMNS # Beri nama kolom secara manual
+        if path == DATA_FILE_BINARY:
+            matrix = load_matrix_from_binary(DATA_FILE_BINARY)
+            values = matrix.to_array() if hasattr(matrix, "to_array") else matrix.data
+            df = pd.DataFrame(values, columns=COLUMNS)
+        else:
+            # Menggunakan pandas untuk memuat data tanpa header
+            df = pd.read_csv(DATA_FILE_RAW, header=None) 
+            df.columns = COLUMNS # Beri nama kolom secara manual
     except FileNotFoundError:
-        import os
         return None, None, {"error": f"File data {DATA_FILE_RAW} tidak ditemukan di {os.getcwd()}."}
     except Exception as e:
          return None, None, {"error": f"Gagal membaca data: {e}"}
@@ -66,47 +108,163 @@ def load_and_analyze_data():
     model_slr = {
         'intercept': f"{a:.3f}",
         'slope_luas': f"{b:.3f}",
-        'equation': f"Harga = {a:.3f} + {b:.3f} * Luas"
+        'equation': f"Harga = {a:.3f} + {b:.3f} * Luas",
+        # Koefisien tanpa pembulatan, dipakai untuk prediksi
+        'a': float(a),
+        'b': float(b),
     }
     
     preview_df = df.head(10)
     return df, model_slr, preview_df
 
-@app.route('/')
-def index():
-    df, model_slr, preview_df = load_and_analyze_data()
-    
-    if df is None:
-        return render_template('index.html', model_slr=None, preview_data=preview_df,chart_data={})
-
-    # Siapkan data untuk Chart.js (hanya Luas dan Harga)
+def _build_series(df, model_slr):
+    """Seri Luas/Harga terurut menurut Luas + prediksi model (satu panggilan predict tervektorisasi)."""
+    luas = df[COLUMNS[LUAS_COL_INDEX]].to_numpy(dtype=float)
+    order = np.argsort(luas, kind='mergesort')
+    series = {
+        'luas': luas[order],
+        'harga': df[COLUMNS[HARGA_COL_INDEX]].to_numpy(dtype=float)[order],
+        'prediksi': None
+    }
     try:
-        chart_data = {
-            'luas': df[COLUMNS[LUAS_COL_INDEX]].tolist(),
-            'harga': df[COLUMNS[HARGA_COL_INDEX]].tolist(),
-            'prediksi': [predict(x, float(model_slr['intercept']), float(model_slr['slope_luas']))[0] 
-                        for x in df[COLUMNS[LUAS_COL_INDEX]].tolist()]
-        }
+        series['prediksi'] = np.asarray(predict(series['luas'], model_slr['a'], model_slr['b']), dtype=float)
     except Exception:
         # Jika predict gagal (karena modul tidak dimuat), kirim data mentah saja
-        chart_data = {
-            'luas': df[COLUMNS[LUAS_COL_INDEX]].tolist(),
-            'harga': df[COLUMNS[HARGA_COL_INDEX]].tolist(),
-            'prediksi': []
-        }
+        pass
+    return series
 
-    # Siapkan data preview sebagai list of lists untuk template
-    preview_data = {
-        'headers': preview_df.columns.tolist(),
-        'rows': preview_df.values.tolist()
-    }
+# ====================================================================
+# Cache analisis per proses
+# ====================================================================
+# Frame, model, seri chart (beserta hasil downsampling per lebar) disimpan
+# per file data dengan kunci (path, mtime_ns, size); request berikutnya hanya
+# membaca dari cache sampai file berubah. Hasil error (mis. file belum ada)
+# tidak di-cache.
+_ANALYSIS_CACHE = {}
+_ANALYSIS_LOCK = threading.Lock()
+
+def get_analysis():
+    """Kembalikan dict {df, model_slr, preview_data, series, ...}; dihitung ulang hanya jika file data berubah."""
+    path = _data_source()
+    stamp = _file_stamp(path)
+    with _ANALYSIS_LOCK:
+        cached = _ANALYSIS_CACHE.get(path)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        df, model_slr, preview_df = load_and_analyze_data(path)
+        if df is None:
+            return {'df': None, 'model_slr': None, 'preview_data': preview_df, 'series': None}
 
+        analysis = {
+            'df': df,
+            'model_slr': model_slr,
+            # Siapkan data preview sebagai list of lists untuk template
+            'preview_data': {
+                'headers': preview_df.columns.tolist(),
+                'rows': preview_df.values.tolist()
+            },
+            'series': _build_series(df, model_slr),
+            'downsampled': {},
+        }
+        # Simpan hanya jika file tidak berubah selama dihitung
+        if stamp is not None and _file_stamp(path) == stamp:
+            _ANALYSIS_CACHE[path] = (stamp, analysis)
+        return analysis
+
+@app.route('/')
+def index():
+    analysis = get_analysis()
+    # Seri chart dan halaman preview berikutnya diambil lewat /api/* sehingga
+    # ukuran halaman tidak bergantung pada jumlah baris data
     return render_template(
         'index.html',
-        model_slr=model_slr,
-        preview_data=preview_data,
-        chart_data=chart_data
+        model_slr=analysis['model_slr'],
+        preview_data=analysis['preview_data'],
+        page_size=PREVIEW_PAGE_SIZE
     )
 
+# ====================================================================
+# Endpoint JSON: seri chart ter-downsample & preview berhalaman
+# ====================================================================
+def _int_arg(name, default, lo, hi):
+    """Ambil argumen query integer dan batasi ke [lo, hi]; ValueError jika bukan angka."""
+    raw = request.args.get(name)
+    if raw is None or raw == '':
+        return default
+    return min(max(int(raw), lo), hi)
+
+def _analysis_or_error():
+    analysis = get_analysis()
+    if analysis['df'] is None:
+        return None, (jsonify(analysis['preview_data']), 503)
+    return analysis, None
+
+@app.route('/api/series')
+def api_series():
+    """
+    Seri Luas/Harga/prediksi ter-downsample ke lebar chart.
+    Query: width (piksel, jumlah titik maksimum), method ('lttb' | 'minmax').
+    """
+    try:
+        width = _int_arg('width', DEFAULT_CHART_WIDTH, MIN_CHART_WIDTH, MAX_CHART_WIDTH)
+    except ValueError:
+        return jsonify({'error': "Parameter 'width' harus bilangan bulat."}), 400
+    method = request.args.get('method', 'lttb')
+    if method not in DOWNSAMPLE_METHODS:
+        return jsonify({'error': f"Parameter 'method' harus salah satu dari {list(DOWNSAMPLE_METHODS)}."}), 400
+
+    analysis, error = _analysis_or_error()
+    if error:
+        return error
+
+    key = (method, width)
+    payload = analysis['downsampled'].get(key)
+    if payload is None:
+        series = analysis['series']
+        idx = downsample(series['luas'], series['harga'], width, method)
+        payload = {
+            'method': method,
+            'width': width,
+            'total_points': int(len(series['luas'])),
+            'points': int(len(idx)),
+            'luas': series['luas'][idx].tolist(),
+            'harga': series['harga'][idx].tolist(),
+            'prediksi': series['prediksi'][idx].tolist() if series['prediksi'] is not None else []
+        }
+        with _ANALYSIS_LOCK:
+            if len(analysis['downsampled']) >= SERIES_CACHE_SIZE:
+                # Buang entri tertua (dict mempertahankan urutan sisip)
+                analysis['downsampled'].pop(next(iter(analysis['downsampled'])))
+            analysis['downsampled'][key] = payload
+    return jsonify(payload)
+
+@app.route('/api/preview')
+def api_preview():
+    """Potongan baris data per halaman. Query: page (mulai 1), page_size."""
+    try:
+        page = _int_arg('page', 1, 1, sys.maxsize)
+        page_size = _int_arg('page_size', PREVIEW_PAGE_SIZE, 1, MAX_PAGE_SIZE)
+    except ValueError:
+        return jsonify({'error': "Parameter 'page' dan 'page_size' harus bilangan bulat."}), 400
+
+    analysis, error = _analysis_or_error()
+    if error:
+        return error
+
+    df = analysis['df']
+    total_rows = len(df)
+    total_pages = max(1, -(-total_rows // page_size))
+    page = min(page, total_pages)
+    start = (page - 1) * page_size
+    return jsonify({
+        'headers': df.columns.tolist(),
+        'rows': df.iloc[start:start + page_size].values.tolist(),
+        'page': page,
+        'page_size': page_size,
+        'total_rows': total_rows,
+        'total_pages': total_pages
+    })
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)